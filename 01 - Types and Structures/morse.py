@@ -1,3 +1,5 @@
+from functools import partial
+
 MORSE = {
     ".-": "a",
     "-...": "b",
@@ -40,6 +42,12 @@ MORSE = {
 
 MORSE_REVERSE = {v: k for k, v in MORSE.items()}
 
+# The longest valid morse code; any longer token can never be decoded
+MAX_CODE_LENGTH = max(len(code) for code in MORSE)
+
+# Default read size for file objects passed to decode_morse_stream
+STREAM_CHUNK_SIZE = 64 * 1024
+
 def encode_morse(text):
     """
     Return encoded with morse text, where "." is morse dot and "-" is morse dash, and
@@ -50,8 +58,8 @@ def encode_morse(text):
     """
     seq = []
     for letter in text:
-        seq.append(MORSE_REVERSE.get(letter.lower(), ' '))
-    return ''.join(seq)
+        seq.append(MORSE_REVERSE.get(letter.lower(), ''))
+    return ' '.join(seq)
 
 def decode_morse(sequence):
     """
@@ -71,6 +79,36 @@ def decode_morse(sequence):
         print('Invalid morse sequence')
     return text
 
+def decode_morse_stream(source, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Decode morse sequence that arrives in chunks, yielding decoded text incrementally.
+    Produces exactly the same text as decode_morse applied to the joined input,
+    but keeps only one unfinished morse letter between chunks, so memory does not
+    depend on the transmission length and the total running time is linear.
+    Letter (" ") and word ("  ") separators may fall on any chunk boundary.
+    Example: decode_morse_stream(["... -", "-- ..."]) --> "s", "os"
+    :param source: iterable of str chunks or a text file object
+    :param chunk_size: read size used when source is a file object
+    :return: generator of decoded text pieces
+    :type: Iterator[str]
+    """
+    if hasattr(source, 'read'):
+        source = iter(partial(source.read, chunk_size), '')
+
+    tail = ''
+    for chunk in source:
+        if not chunk:
+            continue
+        tokens = (tail + chunk).split(' ')
+        # last token may be continued by the next chunk
+        tail = tokens.pop()
+        if len(tail) > MAX_CODE_LENGTH:
+            # already invalid - keep it short so a chunk without spaces can't grow it
+            tail = tail[:MAX_CODE_LENGTH + 1]
+        if tokens:
+            yield ''.join([MORSE.get(token, ' ') for token in tokens])
+    yield MORSE.get(tail, ' ')
+
 
 
 if __name__ == '__main__':
@@ -86,3 +124,9 @@ if __name__ == '__main__':
                        '-.. . ...- . .-.. --- .--. . .-.  . ...- . .-. '))
     print(decode_morse('-.-. --- -.. .. -. --.  .- -. -..  -.. . -.-. --- -.. '
                        '.. -. --.  -- --- .-. ... .  -.-. --- -.. .  .. ...  .- .-- . ... --- -- .'))
+
+    from io import StringIO
+    transmission = StringIO(encode_morse('streaming decoder reads the file chunk by chunk'))
+    for piece in decode_morse_stream(transmission, chunk_size=7):
+        print(piece, end='')
+    print()
@@ -0,0 +1,137 @@
+"""
+Bulk morse codec for millions of short messages.
+
+The whole batch is joined into one ASCII buffer and translated with precomputed
+byte-level lookup tables built from MORSE/MORSE_REVERSE, so there is no Python-level
+loop over characters or tokens. Results are exactly the same as calling
+encode_morse/decode_morse for every message.
+
+Measured speed-up over a loop of encode_morse/decode_morse on 1M short messages
+(python morse_benchmark.py, varies between runs): about x3-5 for encode_many and
+x3-4 for decode_many - short of the x10 target. Joining the batch into one string and
+splitting the result back into a million str objects alone take about as long as
+a x10 run would; the rest is the table lookup and deleting the zero padding with
+bytes.translate (faster than any numpy compaction tried).
+
+Requires numpy: pip install numpy
+"""
+import numpy as np
+
+from morse import MAX_CODE_LENGTH, MORSE, MORSE_REVERSE, decode_morse, encode_morse
+
+BATCH_SIZE = 50_000
+
+SEPARATOR = '\n'
+DECODE_SEPARATOR = ' \n '
+
+SPACE, NEWLINE = ord(' '), ord(SEPARATOR)
+WORD = 8  # bytes in a uint64 table row / token window
+
+# Encode table: one uint64 row per (ASCII char, is last letter of the message).
+# A row holds the morse code, then the letter separator (not for the last letter),
+# padded with zero bytes that are deleted after the lookup.
+ENCODE_ROWS = np.zeros((256, WORD), dtype=np.uint8)
+for char_code in range(128):
+    code = MORSE_REVERSE.get(chr(char_code).lower(), '')
+    for row, suffix in ((char_code, ' '), (char_code | 128, '')):
+        symbols = (code + suffix).encode('ascii')
+        ENCODE_ROWS[row, :len(symbols)] = list(symbols)
+ENCODE_ROWS[NEWLINE, 0] = ENCODE_ROWS[NEWLINE | 128, 0] = NEWLINE
+ENCODE_TABLE = ENCODE_ROWS.view('<u8').ravel()
+
+# Decode table: token bytes read as a little-endian integer --> letter
+_decode_pairs = sorted((int.from_bytes(code.encode('ascii'), 'little'), ord(letter))
+                       for code, letter in MORSE.items())
+_decode_pairs.append((NEWLINE, NEWLINE))
+_decode_pairs.sort()
+DECODE_KEYS = np.array([key for key, _ in _decode_pairs], dtype=np.uint64)
+DECODE_LETTERS = np.array([letter for _, letter in _decode_pairs], dtype=np.uint8)
+
+# Shift that leaves only the token in its 8-byte window, indexed by token length + 1
+# (distance between two spaces). Empty tokens keep the preceding space and tokens longer
+# than MAX_CODE_LENGTH keep foreign bytes, so neither can match a key and both decode
+# to space like in decode_morse.
+TOKEN_SHIFTS = np.array([0, 8 * (WORD - 1)] +
+                        [8 * (WORD - length) for length in range(1, MAX_CODE_LENGTH + 1)] +
+                        [0], dtype=np.uint64)
+
+
+def _encode_batch(messages):
+    joined = SEPARATOR.join(messages)
+    if not joined:
+        return [''] * len(messages)
+    if not joined.isascii() or joined.count(SEPARATOR) != len(messages) - 1:
+        # unicode letters or separator inside a message - use the reference encoder
+        return [encode_morse(message) for message in messages]
+
+    chars = np.frombuffer(joined.encode('ascii'), dtype=np.uint8)
+    # high bit marks the last letter of a message, it gets no trailing separator
+    rows = chars.copy()
+    rows[:-1] |= (chars[1:] == NEWLINE).view(np.uint8) << 7
+    rows[-1] |= 128
+    encoded = np.take(ENCODE_TABLE, rows).tobytes().translate(None, b'\0')
+    return encoded.decode('ascii').split(SEPARATOR)
+
+
+def _decode_batch(sequences):
+    joined = DECODE_SEPARATOR.join(sequences)
+    if not joined.isascii() or '\0' in joined:
+        # zero bytes pad token windows, so '.-\0' would look like '.-' - use the reference decoder
+        return [decode_morse(sequence) for sequence in sequences]
+
+    # zero padding in front, so the first token also has a full 8-byte window
+    raw = bytes(WORD) + joined.encode('ascii') + b' '
+    data = np.frombuffer(raw, dtype=np.uint8, offset=WORD)
+    token_ends = np.flatnonzero(data == SPACE)
+    # window i is raw[i:i + 8] == the 8 data bytes just before data[i]
+    windows = np.ndarray(shape=(len(raw) - WORD + 1,), dtype='<u8', buffer=raw, strides=(1,))
+
+    token_sizes = np.diff(token_ends, prepend=-1)
+    np.minimum(token_sizes, len(TOKEN_SHIFTS) - 1, out=token_sizes)
+    keys = windows[token_ends] >> TOKEN_SHIFTS[token_sizes]
+
+    positions = np.searchsorted(DECODE_KEYS, keys)
+    positions[positions == len(DECODE_KEYS)] = 0
+    letters = np.where(DECODE_KEYS[positions] == keys, DECODE_LETTERS[positions], np.uint8(SPACE))
+
+    texts = letters.tobytes().decode('ascii').split(SEPARATOR)
+    if len(texts) != len(sequences):
+        # separator token inside a sequence - use the reference decoder
+        return [decode_morse(sequence) for sequence in sequences]
+    return texts
+
+
+def encode_many(messages, batch_size=BATCH_SIZE):
+    """
+    Encode a lot of messages at once, result is the same as [encode_morse(m) for m in messages]
+    :param messages: iterable of texts to encode
+    :param batch_size: how many messages are translated by one vectorized pass
+    :return: list of morse sequences
+    :type: List[str]
+    """
+    messages = list(messages)
+    result = []
+    for i in range(0, len(messages), batch_size):
+        result.extend(_encode_batch(messages[i:i + batch_size]))
+    return result
+
+
+def decode_many(sequences, batch_size=BATCH_SIZE):
+    """
+    Decode a lot of morse sequences at once, result is the same as
+    [decode_morse(s) for s in sequences]
+    :param sequences: iterable of morse sequences
+    :param batch_size: how many sequences are translated by one vectorized pass
+    :return: list of decoded texts
+    :type: List[str]
+    """
+    sequences = list(sequences)
+    result = []
+    for i in range(0, len(sequences), batch_size):
+        result.extend(_decode_batch(sequences[i:i + batch_size]))
+    return result
+
+
+if __name__ == '__main__':
+    print(encode_many(["SOS", "Hello Morse!", ""]))
+    print(decode_many(['... --- ...', '.... . .-.. .-.. ---  -- --- .-. ... .', '']))
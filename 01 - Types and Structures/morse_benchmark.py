@@ -0,0 +1,132 @@
+"""
+Benchmarks for the morse codec on multi-megabyte transmissions.
+
+Usage:
+    python morse_benchmark.py                       # 4 MB transmission, 1M short messages
+    python morse_benchmark.py --mb 16 --messages 3000000
+"""
+import argparse
+import random
+import time
+import tracemalloc
+from io import StringIO
+
+from morse import decode_morse, decode_morse_stream, encode_morse
+from morse_batch import decode_many, encode_many
+
+# Speed-up over the encode_morse/decode_morse loop that the batch codec aims for
+TARGET_SPEEDUP = 10
+
+WORDS = ['sos', 'morse', 'signal', 'python', 'decoder', 'radio', 'station', 'kyiv', '2025', 'test']
+
+
+def make_transmission(size_mb, seed=42):
+    """Build an encoded transmission of roughly size_mb megabytes"""
+    rnd = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    # encode each word once, then glue them with the word separator
+    encoded = [encode_morse(word) for word in WORDS]
+    parts = []
+    size = 0
+    while size < target:
+        word = rnd.choice(encoded)
+        parts.append(word)
+        size += len(word) + 2
+    return '  '.join(parts)
+
+
+def make_messages(count, seed=42):
+    """Build count short messages like 'SOS Kyiv 2025'"""
+    rnd = random.Random(seed)
+    return [' '.join(rnd.sample(WORDS, rnd.randint(1, 3))).upper() for _ in range(count)]
+
+
+def measure(func, *args):
+    """Run func twice: timed without tracing, then under tracemalloc.
+    Return (result, seconds, peak traced memory in MB)"""
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024 / 1024
+
+
+def read_chunks(transmission, chunk_size=64 * 1024):
+    """Imitate reading a captured transmission from disk chunk by chunk"""
+    for i in range(0, len(transmission), chunk_size):
+        yield transmission[i:i + chunk_size]
+
+
+def stream_decode(transmission):
+    """Decode chunk by chunk, counting characters instead of keeping the text"""
+    decoded = 0
+    for piece in decode_morse_stream(read_chunks(transmission)):
+        decoded += len(piece)
+    return decoded
+
+
+def benchmark_decoders(transmission):
+    size_mb = len(transmission) / 1024 / 1024
+    print(f"\n=== Decoding {size_mb:.1f} MB transmission ===")
+
+    text, classic_time, classic_peak = measure(decode_morse, transmission)
+    print(f"decode_morse         : {classic_time:7.3f}s | peak {classic_peak:7.2f} MB")
+
+    # the input string is created outside tracemalloc, so the peak is the decoder overhead
+    _, stream_time, stream_peak = measure(stream_decode, transmission)
+    print(f"decode_morse_stream  : {stream_time:7.3f}s | peak {stream_peak:7.2f} MB")
+
+    # odd chunk size so separators regularly fall on chunk boundaries
+    assert ''.join(decode_morse_stream(StringIO(transmission), chunk_size=4099)) == text, \
+        "Stream decoder result differs from decode_morse"
+    print(f"✓ Results match | speed-up x{classic_time / stream_time:.1f}")
+
+
+def benchmark_batch(messages):
+    print(f"\n=== Batch codec on {len(messages):,} short messages ===")
+
+    start = time.perf_counter()
+    encoded = [encode_morse(message) for message in messages]
+    loop_encode = time.perf_counter() - start
+
+    start = time.perf_counter()
+    encoded_many = encode_many(messages)
+    batch_encode = time.perf_counter() - start
+    assert encoded_many == encoded, "encode_many result differs from encode_morse"
+
+    start = time.perf_counter()
+    decoded = [decode_morse(sequence) for sequence in encoded]
+    loop_decode = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decoded_many = decode_many(encoded)
+    batch_decode = time.perf_counter() - start
+    assert decoded_many == decoded, "decode_many result differs from decode_morse"
+
+    total = len(messages)
+    encode_speedup, decode_speedup = loop_encode / batch_encode, loop_decode / batch_decode
+    print(f"encode_morse loop : {loop_encode:7.3f}s | {total / loop_encode:12,.0f} msg/s")
+    print(f"encode_many       : {batch_encode:7.3f}s | {total / batch_encode:12,.0f} msg/s"
+          f" | x{encode_speedup:.1f}")
+    print(f"decode_morse loop : {loop_decode:7.3f}s | {total / loop_decode:12,.0f} msg/s")
+    print(f"decode_many       : {batch_decode:7.3f}s | {total / batch_decode:12,.0f} msg/s"
+          f" | x{decode_speedup:.1f}")
+    print("✓ Results match")
+    for name, speedup in (('encode_many', encode_speedup), ('decode_many', decode_speedup)):
+        reached = speedup >= TARGET_SPEEDUP
+        print(f"{'✓' if reached else '❌'} {name}: x{speedup:.1f} of the x{TARGET_SPEEDUP} target"
+              f"{'' if reached else ' - not reached'}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Morse codec benchmark")
+    parser.add_argument('--mb', type=float, default=4, help="size of the generated transmission in MB")
+    parser.add_argument('--messages', type=int, default=1_000_000, help="number of short messages")
+    args = parser.parse_args()
+
+    benchmark_decoders(make_transmission(args.mb))
+    benchmark_batch(make_messages(args.messages))
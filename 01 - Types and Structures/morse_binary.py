@@ -0,0 +1,138 @@
+"""
+Compact binary storage for morse sequences produced by encode_morse.
+
+Text morse spends 8 bits on every dot, dash and space. Here every symbol gets
+a variable-length prefix code, the most frequent symbols get the shortest codes:
+
+    "."   dot           0
+    "-"   dash          10
+    " "   letter gap    110
+    "  "  word gap      111
+
+Packed data is a bytearray: header (magic + length of the morse text) followed by
+the bits, most significant bit first, zero padded to a whole byte.
+The decoder walks a memoryview over the data byte by byte with a precomputed
+(state, byte) table, so the payload is never copied or converted to a bit string.
+"""
+import struct
+import time
+
+from morse import decode_morse, encode_morse
+
+MAGIC = b'MRS1'
+HEADER = struct.Struct('<4sQ')  # magic, length of the morse text in characters
+
+SYMBOL_CODES = {'.': '0', '-': '10', ' ': '110', '  ': '111'}
+
+# word gap is replaced with one mark first, so "   " becomes word gap + letter gap
+WORD_GAP_MARK = 'w'
+BITS_TABLE = str.maketrans({WORD_GAP_MARK if symbol == '  ' else symbol: code
+                            for symbol, code in SYMBOL_CODES.items()})
+
+
+def _build_decode_table():
+    """
+    Table for every (decoder state, byte) pair --> (decoded symbols, next state).
+    State is the part of a code read so far: "" (0), "1" (1) or "11" (2).
+    Stored flat, index is state * 256 + byte.
+    """
+    table = []
+    for start_state in range(3):
+        for byte in range(256):
+            state = start_state
+            symbols = []
+            for shift in range(7, -1, -1):
+                bit = (byte >> shift) & 1
+                if state == 0:
+                    if bit:
+                        state = 1
+                    else:
+                        symbols.append('.')
+                elif state == 1:
+                    if bit:
+                        state = 2
+                    else:
+                        symbols.append('-')
+                        state = 0
+                else:
+                    symbols.append('  ' if bit else ' ')
+                    state = 0
+            table.append((''.join(symbols), state * 256))
+    return table
+
+
+DECODE_TABLE = _build_decode_table()
+
+
+def pack_morse(sequence):
+    """
+    Pack morse sequence of dots, dashes and spaces into bytes
+    Example: "... --- ..." --> 3 bytes of payload instead of 11
+    :param sequence: morse sequence as returned by encode_morse
+    :return: packed data
+    :type: bytearray
+    """
+    if sequence.strip('.- '):
+        raise ValueError("Morse sequence may contain only dots, dashes and spaces")
+    bits = sequence.replace('  ', WORD_GAP_MARK).translate(BITS_TABLE)
+
+    data = bytearray(HEADER.pack(MAGIC, len(sequence)))
+    if bits:
+        # zero padding decodes to dots, which are cut off by the length from the header
+        padding = -len(bits) % 8
+        data += (int(bits, 2) << padding).to_bytes((len(bits) + padding) // 8, 'big')
+    return data
+
+
+def unpack_morse(data):
+    """
+    Unpack morse sequence from packed data without copying it
+    :param data: bytes, bytearray, memoryview or mmap with packed morse
+    :return: morse sequence
+    :type: str
+    """
+    view = memoryview(data)
+    if len(view) < HEADER.size:
+        raise ValueError("Invalid packed morse data: too short")
+    magic, length = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Invalid packed morse data: wrong header")
+
+    table = DECODE_TABLE
+    state = 0
+    parts = []
+    append = parts.append
+    for byte in view[HEADER.size:]:
+        symbols, state = table[state + byte]
+        append(symbols)
+    return ''.join(parts)[:length]
+
+
+def encode_binary(text):
+    """Encode text to packed morse"""
+    return pack_morse(encode_morse(text))
+
+
+def decode_binary(data):
+    """Decode packed morse to readable text"""
+    return decode_morse(unpack_morse(data))
+
+
+if __name__ == '__main__':
+    packed = encode_binary("SOS")
+    print(f"SOS --> {bytes(packed)!r} --> {decode_binary(packed)}")
+
+    text = ' '.join(['coding and decoding morse code is awesome'] * 50_000)
+    sequence = encode_morse(text)
+    packed = pack_morse(sequence)
+    payload = len(packed) - HEADER.size
+    print(f"Text morse:   {len(sequence):>12,} bytes")
+    print(f"Packed morse: {len(packed):>12,} bytes "
+          f"({payload * 8 / len(sequence):.2f} bits per symbol, x{len(sequence) / len(packed):.1f} smaller)")
+
+    start = time.perf_counter()
+    unpacked = unpack_morse(packed)
+    elapsed = time.perf_counter() - start
+    print(f"Decode: {elapsed:.3f}s | {payload / elapsed / 1024 / 1024:.1f} MB/s packed | "
+          f"{len(unpacked) / elapsed / 1024 / 1024:.1f} MB/s of morse text")
+    print("✓ Round trip OK" if decode_morse(unpacked) == decode_morse(sequence) == text else "❌ Round trip failed")
@@ -0,0 +1,230 @@
+"""
+Morse decoder for keyed on/off sample streams (e.g. 8 kHz captures).
+
+Samples are turned into dots, dashes and gaps with vectorized run-length encoding,
+the dot length is estimated from the signal itself, and the resulting textual
+sequence is decoded with the MORSE table from morse.py.
+There are no Python-level loops over samples or runs.
+
+Requires numpy: pip install numpy
+"""
+import time
+
+import numpy as np
+
+from morse import decode_morse, encode_morse
+
+SAMPLE_RATE = 8000
+
+# Timing of the standard morse code, in dot units
+DASH_UNITS = 3
+LETTER_GAP_UNITS = 3
+WORD_GAP_UNITS = 7
+
+# Runs shorter than this part of a dot are noise and are merged with their neighbours
+GLITCH_UNITS = 0.25
+GLITCH_PASSES = 4
+
+# Share of samples below the first guess of the dot length, see estimate_unit
+UNIT_PERCENTILE = 0.1
+
+# Symbol bytes for every run, zero bytes (gaps inside a letter) are deleted
+DOT, DASH, LETTER_GAP, WORD_GAP = b'.', b'-', b' ', b'|'
+
+
+def envelope(samples, window):
+    """
+    Moving average of the absolute signal value, turns a keyed tone into on/off levels
+    :param samples: 1-D array of samples
+    :param window: averaging window in samples
+    :return: envelope of the same length as samples
+    :type: np.ndarray
+    """
+    magnitude = np.abs(np.asarray(samples, dtype=np.float64))
+    if not len(magnitude):
+        return magnitude
+    # a window longer than the signal averages the whole signal
+    window = max(1, min(window, len(magnitude)))
+    cumulative = np.concatenate(([0.0], np.cumsum(magnitude)))
+    smoothed = (cumulative[window:] - cumulative[:-window]) / window
+    # pad the tail so the envelope is aligned with the input
+    return np.concatenate((smoothed, np.full(window - 1, smoothed[-1])))
+
+
+def binarize(samples, threshold=None):
+    """
+    Convert samples to key states: True - key is down (signal), False - silence
+    :param samples: 1-D array of samples or envelope values
+    :param threshold: level between silence and signal, middle of the range by default
+    :return: boolean array
+    :type: np.ndarray
+    """
+    samples = np.asarray(samples)
+    if threshold is None:
+        threshold = (float(samples.min()) + float(samples.max())) / 2
+    return samples > threshold
+
+
+def run_lengths(keyed):
+    """
+    Run-length encoding of the key states
+    Example: [0, 1, 1, 0, 0, 0] --> ([False, True, False], [1, 2, 3])
+    :param keyed: boolean array from binarize
+    :return: state of every run and its length in samples
+    :type: Tuple[np.ndarray, np.ndarray]
+    """
+    keyed = np.asarray(keyed, dtype=bool)
+    if len(keyed) == 0:
+        return keyed, np.zeros(0, dtype=np.int64)
+    boundaries = np.flatnonzero(keyed[1:] != keyed[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    lengths = np.diff(np.concatenate((starts, [len(keyed)])))
+    return keyed[starts], lengths
+
+
+def merge_glitches(states, lengths, min_length):
+    """
+    Remove runs shorter than min_length samples: a glitch takes the state of its
+    neighbours and the neighbouring runs are joined into one.
+    Neighbouring glitches flip together and can leave a short run behind,
+    so the pass is repeated a few times while short runs remain.
+    :param states: run states from run_lengths
+    :param lengths: run lengths from run_lengths
+    :param min_length: shortest valid run in samples
+    :return: cleaned states and lengths
+    :type: Tuple[np.ndarray, np.ndarray]
+    """
+    for _ in range(GLITCH_PASSES):
+        short = lengths < min_length
+        if len(states) == 0 or not short.any():
+            break
+        states = np.where(short, ~states, states)
+        # first run of every group of equal neighbouring states
+        starts = np.concatenate(([0], np.flatnonzero(states[1:] != states[:-1]) + 1))
+        states, lengths = states[starts], np.add.reduceat(lengths, starts)
+    return states, lengths
+
+
+def estimate_unit(lengths):
+    """
+    Estimate the dot length in samples from run lengths.
+    Dots and gaps inside a letter are one unit long and hold a large share of all samples,
+    so the estimate starts from a low percentile of the samples (every run weighted by its
+    length - a noise spike of a few samples barely counts) and is refined by averaging
+    all runs that are close to it. Works for any keying speed without configuration.
+    :param lengths: lengths of marks and gaps in samples
+    :return: dot length in samples
+    :type: float
+    """
+    lengths = np.sort(np.asarray(lengths, dtype=np.float64))
+    if len(lengths) == 0:
+        return 0.0
+    covered = np.cumsum(lengths)
+    seed = lengths[np.searchsorted(covered, covered[-1] * UNIT_PERCENTILE)]
+    close = lengths[(lengths >= seed / 2) & (lengths < seed * 2)]
+    return float(close.mean()) if len(close) else float(seed)
+
+
+def samples_to_morse(samples, threshold=None, unit=None, window=None):
+    """
+    Convert keyed samples into textual morse sequence in the format of morse.py:
+    letters are separated with space, words with double space
+    :param samples: 1-D array of on/off samples
+    :param threshold: see binarize
+    :param unit: dot length in samples, estimated from the signal by default
+    :param window: smooth samples with envelope() first - for noisy input or a keyed tone
+    :return: morse sequence, e.g. "... --- ..."
+    :type: str
+    """
+    samples = np.asarray(samples)
+    if len(samples) == 0:
+        return ''
+    if window:
+        samples = envelope(samples, window)
+    states, lengths = run_lengths(binarize(samples, threshold))
+    if len(states) == 0:
+        return ''
+    if unit is None:
+        # noise splits marks and gaps into pieces, so the rough estimate only removes glitches,
+        # and the dot length is measured again on the cleaned runs
+        states, lengths = merge_glitches(states, lengths, estimate_unit(lengths) * GLITCH_UNITS)
+        unit = estimate_unit(lengths)
+    states, lengths = merge_glitches(states, lengths, unit * GLITCH_UNITS)
+
+    # silence before the first and after the last mark carries no symbols
+    if len(states) and not states[0]:
+        states, lengths = states[1:], lengths[1:]
+    if len(states) and not states[-1]:
+        states, lengths = states[:-1], lengths[:-1]
+    if len(states) == 0:
+        return ''
+    units = lengths / unit
+
+    # decision borders lie in the middle between the nominal durations
+    symbols = np.zeros(len(states), dtype=np.uint8)
+    symbols[states] = np.where(units[states] < (1 + DASH_UNITS) / 2, ord(DOT), ord(DASH))
+    gaps = ~states
+    symbols[gaps & (units >= (1 + LETTER_GAP_UNITS) / 2)] = ord(LETTER_GAP)
+    symbols[gaps & (units >= (LETTER_GAP_UNITS + WORD_GAP_UNITS) / 2)] = ord(WORD_GAP)
+
+    sequence = symbols.tobytes().translate(None, b'\0').decode('ascii')
+    return sequence.replace(WORD_GAP.decode(), '  ')
+
+
+def decode_samples(samples, threshold=None, unit=None, window=None):
+    """
+    Decode keyed on/off samples to readable text
+    :param samples: 1-D array of on/off samples
+    :param threshold: see binarize
+    :param unit: see samples_to_morse
+    :param window: see samples_to_morse
+    :return: decoded text
+    :type: str
+    """
+    return decode_morse(samples_to_morse(samples, threshold, unit, window))
+
+
+def synthesize(text, wpm=20, sample_rate=SAMPLE_RATE, noise=0.0, seed=None):
+    """
+    Build keyed on/off samples for the text, useful for tests and benchmarks.
+    Speed follows the PARIS standard: dot length is 1.2 / wpm seconds.
+    :param text: text to transmit
+    :param wpm: words per minute
+    :param sample_rate: samples per second
+    :param noise: standard deviation of gaussian noise added to the 0/1 levels
+    :param seed: random seed for the noise
+    :return: float array of samples
+    :type: np.ndarray
+    """
+    unit = int(round(1.2 / wpm * sample_rate))
+    sequence = np.frombuffer(encode_morse(text).replace('  ', '|').encode('ascii'), dtype=np.uint8)
+
+    # every symbol is followed by a one unit gap, separators extend that gap
+    is_mark = (sequence == ord(DOT)) | (sequence == ord(DASH))
+    mark_units = np.where(sequence == ord(DASH), DASH_UNITS, 1)
+    gap_units = np.select([sequence == ord(LETTER_GAP), sequence == ord(WORD_GAP)],
+                          [LETTER_GAP_UNITS - 1, WORD_GAP_UNITS - 1], 1)
+    levels = np.stack((is_mark, np.zeros_like(is_mark))).T.ravel()
+    durations = np.stack((np.where(is_mark, mark_units, 0), np.where(is_mark, 1, gap_units))).T.ravel()
+    samples = np.repeat(levels.astype(np.float64), durations * unit)
+
+    if noise:
+        samples += np.random.default_rng(seed).normal(0.0, noise, len(samples))
+    return samples
+
+
+if __name__ == '__main__':
+    message = 'coding and decoding morse code is awesome'
+    samples = synthesize(message, wpm=18, noise=0.2, seed=1)
+    print(samples_to_morse(samples, window=16))
+    print(decode_samples(samples, window=16))
+
+    # minutes of 8 kHz capture
+    long_message = ' '.join([message] * 60)
+    samples = synthesize(long_message, wpm=25, noise=0.2, seed=2)
+    start = time.perf_counter()
+    decoded = decode_samples(samples, window=16)
+    elapsed = time.perf_counter() - start
+    minutes = len(samples) / SAMPLE_RATE / 60
+    print(f"Decoded {minutes:.1f} minutes ({len(samples):,} samples) in {elapsed:.3f}s")
+    print("✓ Decoded text matches" if decoded == long_message else "❌ Decoded text differs")
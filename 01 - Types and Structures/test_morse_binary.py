@@ -0,0 +1,60 @@
+"""
+Tests for the packed morse format: python test_morse_binary.py or pytest
+"""
+from morse import decode_morse, encode_morse
+from morse_binary import HEADER, decode_binary, encode_binary, pack_morse, unpack_morse
+
+
+def test_round_trip_with_encode_morse():
+    for text in ["sos", "Hello Morse!", "good evening we are from ukraine", "0123456789", "a", ""]:
+        sequence = encode_morse(text)
+        assert unpack_morse(pack_morse(sequence)) == sequence
+        assert decode_binary(encode_binary(text)) == decode_morse(sequence)
+    print("✓ Round trip with encode_morse passed")
+
+
+def test_separators_and_padding():
+    # every length of the payload tail and odd runs of spaces
+    for sequence in [".", "-", " ", "  ", "   ", "... --- ...", ".-  -...", ".- ", " .-", "-----  ....."]:
+        for repeat in range(1, 10):
+            data = ' '.join([sequence] * repeat)
+            assert unpack_morse(pack_morse(data)) == data
+    print("✓ Separators and padding passed")
+
+
+def test_packed_size():
+    sequence = encode_morse("coding and decoding morse code is awesome " * 100)
+    packed = pack_morse(sequence)
+    assert len(packed) - HEADER.size < len(sequence) / 3
+    print("✓ Packed size passed")
+
+
+def test_memoryview_input():
+    packed = encode_binary("the quick brown fox")
+    assert decode_binary(memoryview(packed)) == "the quick brown fox"
+    assert decode_binary(bytes(packed)) == "the quick brown fox"
+    print("✓ Memoryview input passed")
+
+
+def test_invalid_data():
+    for data in [b"", b"MRS", b"XXXX" + bytes(8)]:
+        try:
+            unpack_morse(data)
+            assert False, "ValueError expected"
+        except ValueError:
+            pass
+    try:
+        pack_morse("... abc")
+        assert False, "ValueError expected"
+    except ValueError:
+        pass
+    print("✓ Invalid data passed")
+
+
+if __name__ == '__main__':
+    test_round_trip_with_encode_morse()
+    test_separators_and_padding()
+    test_packed_size()
+    test_memoryview_input()
+    test_invalid_data()
+    print("Всі тести пройдено успішно!")
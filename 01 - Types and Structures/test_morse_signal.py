@@ -0,0 +1,41 @@
+"""
+Tests for the sample stream decoder: python test_morse_signal.py or pytest
+"""
+from morse_signal import decode_samples, envelope, synthesize
+
+MESSAGE = "coding and decoding morse code is awesome"
+
+
+def test_clean_signal():
+    for wpm in [12, 18, 25, 40]:
+        assert decode_samples(synthesize(MESSAGE, wpm=wpm)) == MESSAGE
+    print("✓ Clean signal passed")
+
+
+def test_noisy_signal_with_default_arguments():
+    # no window and no unit: noise spikes must not shrink the estimated dot length
+    for wpm in [12, 18, 25, 40]:
+        for seed in [1, 2, 3]:
+            samples = synthesize(MESSAGE, wpm=wpm, noise=0.2, seed=seed)
+            assert decode_samples(samples) == MESSAGE, (wpm, seed)
+    print("✓ Noisy signal with default arguments passed")
+
+
+def test_noisy_signal_with_window():
+    samples = synthesize(MESSAGE, wpm=18, noise=0.3, seed=1)
+    assert decode_samples(samples, window=16) == MESSAGE
+    print("✓ Noisy signal with window passed")
+
+
+def test_envelope_window_longer_than_signal():
+    assert list(envelope([1, -1, 1], 10)) == [1.0, 1.0, 1.0]
+    assert len(envelope([], 10)) == 0
+    print("✓ Envelope window passed")
+
+
+if __name__ == '__main__':
+    test_clean_signal()
+    test_noisy_signal_with_default_arguments()
+    test_noisy_signal_with_window()
+    test_envelope_window_longer_than_signal()
+    print("Всі тести пройдено успішно!")
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Визначення країни по IP через інтервальний індекс (Завдання 3).
+
+get_country_by_ip з Benchmark_test_code.md перебирає всі префікси рядків для кожного запиту
+і не розуміє CIDR. Тут діапазони CIDR -> країна читаються з CSV (ip_ranges.csv, ті самі
+мережі, що й IP_RANGES, записані як /16) у відсортовані масиви чисел start/end:
+- одна адреса шукається бінарним пошуком bisect - O(log N);
+- масив адрес (наприклад колонка ips з log_columns.py) - одним викликом numpy.searchsorted.
+
+Використання:
+    python geoip.py ./log_investigation
+    python geoip.py ./log_investigation --ranges ip_ranges.csv --store ./log_columns
+"""
+
+import argparse
+import csv
+import ipaddress
+import time
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from log_analysis import AUTH_FAILURE_STATUSES, LOG_DIR, LOG_FILES_COUNT, log_files
+from log_columns import STORE_DIR, LogColumns, int_to_ip, ip_to_int
+
+RANGES_FILE = Path(__file__).with_name('ip_ranges.csv')
+UNKNOWN = 'unknown'
+
+
+class GeoIndex:
+    """Відсортовані неперетинні діапазони IPv4 [start, end] з номером країни"""
+
+    def __init__(self, ranges):
+        """
+        :param ranges: ітерабельний об'єкт (start, end, country), межі включно
+        """
+        ranges = sorted(ranges)
+        for (_, previous_end, previous), (start, _, country) in zip(ranges, ranges[1:]):
+            if start <= previous_end:
+                raise ValueError(f"Діапазони перетинаються: {int_to_ip(start)} ({country}) "
+                                 f"всередині діапазону {previous}")
+
+        # номер країни -> назва; останній номер - невідома країна
+        self.countries = sorted({country for _, _, country in ranges}) + [UNKNOWN]
+        numbers = {country: i for i, country in enumerate(self.countries)}
+        self.unknown = numbers[UNKNOWN]
+
+        # списки Python для bisect, масиви numpy для пакетного пошуку
+        self._starts = [start for start, _, _ in ranges]
+        self._ends = [end for _, end, _ in ranges]
+        self._codes = [numbers[country] for _, _, country in ranges]
+        self.starts = np.array(self._starts, dtype=np.uint32)
+        self.ends = np.array(self._ends, dtype=np.uint32)
+        self.codes = np.array(self._codes, dtype=np.uint16)
+
+    def __len__(self):
+        return len(self._starts)
+
+    @classmethod
+    def from_csv(cls, path=RANGES_FILE) -> 'GeoIndex':
+        """Завантажити CSV з колонками network (CIDR, наприклад 91.203.0.0/16) та country"""
+        ranges = []
+        with open(path, newline='') as f:
+            for row in csv.DictReader(f):
+                network = ipaddress.IPv4Network(row['network'].strip())
+                ranges.append((int(network.network_address), int(network.broadcast_address),
+                               row['country'].strip()))
+        return cls(ranges)
+
+    # ------------------------------------------------------------------------
+    # Пошук однієї адреси
+    # ------------------------------------------------------------------------
+
+    def lookup_int(self, value: int) -> str:
+        i = bisect_right(self._starts, value) - 1
+        if i >= 0 and value <= self._ends[i]:
+            return self.countries[self._codes[i]]
+        return UNKNOWN
+
+    def lookup(self, ip: str) -> str:
+        """'185.220.101.47' --> 'russia'"""
+        return self.lookup_int(ip_to_int(ip))
+
+    # ------------------------------------------------------------------------
+    # Пакетний пошук
+    # ------------------------------------------------------------------------
+
+    def lookup_codes(self, ips) -> np.ndarray:
+        """
+        Номери країн для масиву адрес
+        :param ips: масив uint32 (колонка ips) або список рядків IP
+        :return: масив номерів у self.countries
+        """
+        values = np.asarray(ips)
+        if values.dtype.kind not in 'ui':
+            values = np.array([ip_to_int(ip) for ip in values], dtype=np.uint32)
+        i = np.searchsorted(self.starts, values, side='right') - 1
+        inside = (i >= 0) & (values <= self.ends[np.maximum(i, 0)])
+        return np.where(inside, self.codes[np.maximum(i, 0)], self.unknown)
+
+    def lookup_many(self, ips) -> List[str]:
+        """Назви країн для масиву адрес"""
+        countries = self.countries
+        return [countries[code] for code in self.lookup_codes(ips)]
+
+    def country_counts(self, ips) -> Dict[str, int]:
+        """Кількість адрес (або запитів) по країнах, від найбільшої"""
+        counts = np.bincount(self.lookup_codes(ips), minlength=len(self.countries))
+        order = np.argsort(-counts, kind='stable')
+        return {self.countries[code]: int(counts[code]) for code in order if counts[code]}
+
+
+def prefix_lookup_table(index: GeoIndex) -> Dict[str, List[str]]:
+    """Префікси рядків у форматі IP_RANGES з Benchmark_test_code.md (тільки для мереж /16)"""
+    table = {}
+    for start, code in zip(index._starts, index._codes):
+        table.setdefault(index.countries[code], []).append('.'.join(int_to_ip(start).split('.')[:2]) + '.')
+    return table
+
+
+def get_country_by_prefix(address: str, ip_ranges: Dict[str, List[str]]) -> str:
+    """Перебір префіксів як у Benchmark_test_code.md - для порівняння"""
+    for country, prefixes in ip_ranges.items():
+        for prefix in prefixes:
+            if address.startswith(prefix):
+                return country
+    return UNKNOWN
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Розподіл запитів access_log_{i}.log по країнах")
+    parser.add_argument('log_dir', nargs='?', default=LOG_DIR, help="каталог з файлами логів")
+    parser.add_argument('--files', type=int, default=LOG_FILES_COUNT, help="кількість файлів")
+    parser.add_argument('--ranges', default=RANGES_FILE, help="CSV з діапазонами network,country")
+    parser.add_argument('--store', default=STORE_DIR, help="каталог колонок log_columns.py")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = GeoIndex.from_csv(args.ranges)
+    print(f"⏱️ Індекс з {len(index)} діапазонів: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    if not LogColumns.exists(args.store):
+        LogColumns.from_logs(log_files(args.log_dir, args.files)).save(args.store)
+    columns = LogColumns.load(args.store)
+
+    start = time.perf_counter()
+    requests = index.country_counts(columns.ips)
+    auth_failures = index.country_counts(
+        columns.ips[np.isin(columns.statuses, [int(status) for status in AUTH_FAILURE_STATUSES])])
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{'Країна':<14}{'Запити':>10}{'401/403':>10}{'Частка 401/403':>16}")
+    for country, count in requests.items():
+        failures = auth_failures.get(country, 0)
+        print(f"{country:<14}{count:>10,}{failures:>10,}{failures / count:>16.1%}")
+    print(f"\n⏱️ {len(columns):,} запитів по країнах (searchsorted): {elapsed * 1000:.1f}ms")
+
+    # порівняння з перебором префіксів на вибірці
+    sample = [int_to_ip(value) for value in columns.ips[:100_000]]
+    prefixes = prefix_lookup_table(index)
+    start = time.perf_counter()
+    expected = [get_country_by_prefix(ip, prefixes) for ip in sample]
+    prefix_time = time.perf_counter() - start
+    start = time.perf_counter()
+    single = [index.lookup(ip) for ip in sample]
+    bisect_time = time.perf_counter() - start
+    start = time.perf_counter()
+    batch = index.lookup_many(sample)
+    batch_time = time.perf_counter() - start
+
+    print(f"\n{len(sample):,} рядків IP:")
+    print(f"⏱️ Перебір префіксів: {prefix_time:.3f}s")
+    print(f"⏱️ bisect:            {bisect_time:.3f}s | x{prefix_time / bisect_time:.1f}")
+    print(f"⏱️ searchsorted:      {batch_time:.3f}s | x{prefix_time / batch_time:.1f}")
+    print("✓ Результати збігаються" if expected == single == batch else "❌ Результати відрізняються")
+
+    # мільйони адрес, вже перетворених у числа
+    ips = np.random.default_rng(0).integers(0, 2 ** 32, 5_000_000, dtype=np.uint32)
+    start = time.perf_counter()
+    index.lookup_codes(ips)
+    print(f"\n⏱️ {len(ips):,} випадкових адрес uint32: {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""
+Аналіз журналів nginx (Завдання 1) з розпаралелюванням map-reduce.
+
+Файли розбиваються на шматки по байтових діапазонах, вирівняних на межі рядків.
+Кожен шматок парситься скомпільованим регулярним виразом в окремому процесі,
+процес повертає лічильники (Counter) IP, статусів і шляхів, а головний процес їх об'єднує.
+
+Стиснуті ротовані журнали (.gz, .bz2, .xz) розпізнаються за магічними байтами і читаються
+потоково (open_log); паралельно вони розпаковуються в окремих процесах.
+
+Використання:
+    python log_analysis.py ./log_investigation
+    python log_analysis.py ./log_investigation --workers 4
+"""
+
+import argparse
+import bz2
+import calendar
+import gzip
+import lzma
+import multiprocessing
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+LOG_DIR = './log_investigation'
+LOG_FILES_COUNT = 10
+
+# 185.220.101.47 - - [27/Aug/2025:14:23:15 +0000] "GET /wp-admin/ HTTP/1.1" 404 169 "-" "sqlmap/1.6.12" "-"
+LOG_PATTERN = re.compile(
+    r'(?P<ip>\S+) \S+ \S+ \[(?P<timestamp>[^\]]+)\] '
+    r'"(?P<method>\S+) (?P<path>\S+)[^"]*" (?P<status>\d{3}) (?P<size>\S+)'
+    r'(?: "(?P<referer>[^"]*)" "(?P<user_agent>[^"]*)")?'
+)
+
+# Розмір шматка для паралельної обробки
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# Перші байти стиснутих файлів -> функція, що відкриває їх як текст
+COMPRESSED_FORMATS = {
+    b'\x1f\x8b': gzip.open,
+    b'BZh': bz2.open,
+    b'\xfd7zXZ\x00': lzma.open,
+}
+MAGIC_SIZE = max(len(magic) for magic in COMPRESSED_FORMATS)
+COMPRESSED_SUFFIXES = ('.gz', '.bz2', '.xz')
+
+# Скільки розпакованого тексту процес-читач передає за один раз
+READ_BLOCK_SIZE = 1024 * 1024
+
+
+def log_files(log_dir: str = LOG_DIR, count: int = LOG_FILES_COUNT) -> List[Path]:
+    """Шляхи до файлів access_log_{i}.log; якщо файлу немає, але є стиснутий access_log_{i}.log.gz - до нього"""
+    paths = []
+    for i in range(count):
+        path = Path(log_dir) / f'access_log_{i}.log'
+        if not path.exists():
+            path = next((compressed for compressed in (path.with_name(path.name + suffix)
+                                                       for suffix in COMPRESSED_SUFFIXES)
+                         if compressed.exists()), path)
+        paths.append(path)
+    return paths
+
+
+# ============================================================================
+# Читання звичайних і стиснутих файлів
+# ============================================================================
+
+def compressed_opener(path):
+    """Функція для відкриття стиснутого файлу за його магічними байтами, None - звичайний текст"""
+    with open(path, 'rb') as f:
+        head = f.read(MAGIC_SIZE)
+    for magic, opener in COMPRESSED_FORMATS.items():
+        if head.startswith(magic):
+            return opener
+    return None
+
+
+def open_log(path):
+    """Відкрити журнал як текст; gzip, bz2 і xz розпаковуються потоково"""
+    opener = compressed_opener(path)
+    if opener is None:
+        return open(path, 'r', errors='replace')
+    return opener(path, 'rt', errors='replace')
+
+
+def _read_blocks(paths: 'multiprocessing.Queue', blocks: 'multiprocessing.Queue', block_size: int):
+    """Процес-читач: бере файли з черги paths, кладе в blocks текст з цілих рядків"""
+    try:
+        for path in iter(paths.get, None):
+            with open_log(path) as f:
+                tail = ''
+                for block in iter(lambda: f.read(block_size), ''):
+                    block = tail + block
+                    end = block.rfind('\n') + 1
+                    if end:
+                        blocks.put(block[:end])
+                    tail = block[end:]
+                if tail:
+                    blocks.put(tail)
+        blocks.put(None)
+    except Exception as error:
+        blocks.put(error)
+
+
+def parallel_file_generator(paths, workers: Optional[int] = None,
+                            block_size: int = READ_BLOCK_SIZE) -> Iterator[str]:
+    """
+    Рядки з усіх файлів, які розпаковують кілька процесів одночасно.
+    Порядок рядків всередині файлу зберігається, але рядки різних файлів перемішуються.
+    """
+    paths = [str(path) for path in paths]
+    workers = max(1, min(workers or os.cpu_count(), len(paths)))
+    tasks = multiprocessing.Queue()
+    for path in paths:
+        tasks.put(path)
+    for _ in range(workers):
+        tasks.put(None)
+    # обмежена черга: якщо аналіз не встигає, читачі чекають, а не заповнюють пам'ять
+    blocks = multiprocessing.Queue(maxsize=workers * 4)
+    readers = [multiprocessing.Process(target=_read_blocks, args=(tasks, blocks, block_size), daemon=True)
+               for _ in range(workers)]
+    for reader in readers:
+        reader.start()
+
+    try:
+        running = workers
+        while running:
+            block = blocks.get()
+            if block is None:
+                running -= 1
+            elif isinstance(block, Exception):
+                raise block
+            else:
+                for line in block.splitlines():
+                    yield line.strip()
+    finally:
+        for reader in readers:
+            if reader.is_alive():
+                reader.terminate()
+            reader.join()
+
+
+# ============================================================================
+# Послідовна обробка генераторами (як у README)
+# ============================================================================
+
+def file_generator(paths) -> Iterator[str]:
+    """Повертає рядки з усіх файлів по одному"""
+    for path in paths:
+        with open_log(path) as f:
+            for line in f:
+                yield line.strip()
+
+
+def parse_log_line(line: str) -> Optional[dict]:
+    """Парсинг рядка логу через split (підказка 2 з README)"""
+    parts = line.split()
+    if len(parts) >= 10:
+        return {
+            'ip': parts[0],
+            'timestamp': parts[3] + ' ' + parts[4],
+            'method': parts[5].strip('"'),
+            'path': parts[6],
+            'status': parts[8],
+            'size': parts[9],
+            'user_agent': ' '.join(parts[11:]).strip('"')
+        }
+    return None
+
+
+def parse_log_line_regex(line: str) -> Optional[dict]:
+    """Парсинг рядка логу скомпільованим регулярним виразом"""
+    match = LOG_PATTERN.match(line)
+    return match.groupdict() if match else None
+
+
+# Коди відповіді, які означають невдалий вхід / заборонений доступ (брутфорс)
+AUTH_FAILURE_STATUSES = ('401', '403')
+
+
+TIMESTAMP_FORMAT = '%d/%b/%Y:%H:%M:%S %z'
+MONTHS = {month: number for number, month in enumerate(
+    ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), 1)}
+TWO_DIGITS = {f'{number:02d}': number for number in range(60)}
+UTC_OFFSET = '+0000'
+# скільки хвилин пам'ятає TimestampParser (тиждень)
+MINUTE_CACHE_SIZE = 7 * 24 * 60
+
+
+def timestamp_hour(timestamp: str) -> str:
+    """Година з мітки часу nginx: '27/Aug/2025:14:23:15 +0000' --> '14'"""
+    return timestamp[12:14]
+
+
+def epoch_hour(epoch: int) -> int:
+    """Година доби (UTC) для секунд Unix - для гістограм по годинах"""
+    return epoch // 3600 % 24
+
+
+class TimestampParser:
+    """
+    Мітка часу nginx у секунди Unix без strptime.
+    Формат фіксований, тому поля беруться зрізами за відомими позиціями, а місяць - з таблиці.
+    Кешуються: початок доби ('27/Aug/2025'), початок хвилини і значення попереднього виклику -
+    сусідні рядки журналу найчастіше мають ту саму секунду.
+    """
+
+    def __init__(self):
+        self._days = {}  # '27/Aug/2025' -> секунди Unix півночі UTC
+        self._minutes = {}  # '27/Aug/2025:14:23:' -> секунди Unix початку хвилини (тільки +0000)
+        self._last_timestamp = None
+        self._last_epoch = 0
+
+    def parse(self, timestamp: str) -> int:
+        """'[27/Aug/2025:14:23:15 +0000]' або '27/Aug/2025:14:23:15 +0000' --> 1756304595"""
+        if timestamp == self._last_timestamp:
+            return self._last_epoch
+        text = timestamp[1:27] if timestamp[:1] == '[' else timestamp
+        try:
+            # ключ кешу закінчується роздільником ':', а хвіст ' +0000' перевіряється цілком -
+            # рядок з кешованою хвилиною, але зіпсованими роздільниками, не проходить повз _parse_minute
+            minute = self._minutes.get(text[:18])
+            if minute is None or text[20:] != ' ' + UTC_OFFSET:
+                minute = self._parse_minute(text)
+            epoch = minute + TWO_DIGITS[text[18:20]]
+        except (KeyError, ValueError):
+            raise ValueError(f"Невідомий формат мітки часу: {timestamp!r}") from None
+        self._last_timestamp, self._last_epoch = timestamp, epoch
+        return epoch
+
+    __call__ = parse
+
+    def _parse_minute(self, text: str) -> int:
+        # '27/Aug/2025:14:23:15 +0000' - роздільники на всіх позиціях, інакше '10:00x00' пройшов би в кеш
+        if (len(text) != 26 or text[2] != '/' or text[6] != '/' or text[11] != ':' or text[14] != ':'
+                or text[17] != ':' or text[20] != ' '):
+            raise ValueError(text)
+        day = self._days.get(text[:11])
+        if day is None:
+            year, month, day_of_month = int(text[7:11]), MONTHS[text[3:6]], TWO_DIGITS[text[:2]]
+            # timegm сам переносить 31/Feb на 3/Mar - неіснуючу дату відкидаємо явно
+            if not 1 <= day_of_month <= calendar.monthrange(year, month)[1]:
+                raise ValueError(text)
+            day = self._days[text[:11]] = calendar.timegm((year, month, day_of_month, 0, 0, 0))
+        hour = TWO_DIGITS[text[12:14]]
+        if hour >= 24:
+            raise ValueError(text)
+        # хвилини і секунди TWO_DIGITS обмежує сам: лише '00'-'59'
+        minute = day + hour * 3600 + TWO_DIGITS[text[15:17]] * 60
+
+        offset = text[21:26]
+        if offset == UTC_OFFSET:
+            if len(self._minutes) >= MINUTE_CACHE_SIZE:
+                self._minutes.clear()
+            self._minutes[text[:18]] = minute
+            return minute
+        shift = int(offset[1:3]) * 3600 + int(offset[3:5]) * 60
+        if offset[0] == '+':
+            return minute - shift
+        if offset[0] == '-':
+            return minute + shift
+        raise ValueError(text)
+
+
+_timestamp_parser = TimestampParser()
+
+
+def parse_timestamp(timestamp: str) -> int:
+    """Мітка часу nginx у секунди Unix: '27/Aug/2025:14:23:15 +0000' --> 1756304595"""
+    return _timestamp_parser.parse(timestamp)
+
+
+def parse_timestamp_strptime(timestamp: str) -> int:
+    """Те саме через datetime.strptime - повільно, для порівняння"""
+    return int(datetime.strptime(timestamp.strip('[]'), TIMESTAMP_FORMAT).timestamp())
+
+
+class LogStats:
+    """Агреговані результати аналізу, які можна об'єднувати між процесами"""
+
+    COUNTERS = ('ips', 'statuses', 'paths', 'hours', 'auth_failures')
+
+    def __init__(self):
+        self.total = 0
+        self.ips = Counter()
+        self.statuses = Counter()
+        self.paths = Counter()
+        self.hours = Counter()  # година доби -> кількість запитів
+        self.auth_failures = Counter()  # IP -> кількість відповідей 401/403
+
+    def add(self, record: dict):
+        """Врахувати один розпарсений запис"""
+        self.total += 1
+        self.ips[record['ip']] += 1
+        self.statuses[record['status']] += 1
+        self.paths[record['path']] += 1
+        self.hours[timestamp_hour(record['timestamp'].lstrip('['))] += 1
+        if record['status'] in AUTH_FAILURE_STATUSES:
+            self.auth_failures[record['ip']] += 1
+
+    def merge(self, other: 'LogStats') -> 'LogStats':
+        """Додати результати іншого процесу (reduce)"""
+        self.total += other.total
+        for name in self.COUNTERS:
+            getattr(self, name).update(getattr(other, name))
+        return self
+
+    def subtract(self, other: 'LogStats') -> 'LogStats':
+        """Прибрати результати, які раніше додав merge (наприклад, файл, що обробляється заново)"""
+        self.total -= other.total
+        for name in self.COUNTERS:
+            counter = getattr(self, name)
+            counter.subtract(getattr(other, name))
+            for key in [key for key, count in counter.items() if count <= 0]:
+                del counter[key]
+        return self
+
+    def to_dict(self) -> dict:
+        """Стан для збереження в JSON"""
+        state = {'total': self.total}
+        for name in self.COUNTERS:
+            state[name] = dict(getattr(self, name))
+        return state
+
+    @classmethod
+    def from_dict(cls, state: dict) -> 'LogStats':
+        """Відновити результати, збережені to_dict"""
+        stats = cls()
+        stats.total = state.get('total', 0)
+        for name in cls.COUNTERS:
+            getattr(stats, name).update(state.get(name, {}))
+        return stats
+
+    def top_ips(self, n: int = 20) -> List[Tuple[str, int]]:
+        """Топ-N найактивніших IP; при однаковій кількості - за IP, щоб результат був стабільним"""
+        return sorted(self.ips.items(), key=lambda item: (-item[1], item[0]))[:n]
+
+    def status_distribution(self) -> dict:
+        """Розподіл кодів статусу HTTP"""
+        return dict(sorted(self.statuses.items()))
+
+
+def sequential_analysis(paths) -> LogStats:
+    """Один процес, генератор рядків + parse_log_line"""
+    return analyze_lines(file_generator(paths))
+
+
+def analyze_lines(lines) -> LogStats:
+    """Агрегувати рядки з будь-якого генератора"""
+    stats = LogStats()
+    for line in lines:
+        record = parse_log_line(line)
+        if record:
+            stats.add(record)
+    return stats
+
+
+# ============================================================================
+# Паралельна обробка: map (шматки файлів) -> reduce (об'єднання Counter)
+# ============================================================================
+
+def chunk_ranges(path, chunk_size: int = CHUNK_SIZE, start: int = 0,
+                 size: Optional[int] = None) -> List[Tuple[str, int, Optional[int]]]:
+    """
+    Розбити файл (або його частину від start до size) на байтові діапазони (path, start, end).
+    Кожна межа зсувається до початку наступного рядка, тому рядки не розриваються.
+    Стиснутий файл не можна читати з довільного зсуву - він стає одним завданням (path, 0, None).
+    """
+    if compressed_opener(path) is not None:
+        return [(str(path), 0, None)]
+    if size is None:
+        size = os.path.getsize(path)
+    ranges = []
+    with open(path, 'rb') as f:
+        while start < size:
+            end = min(start + chunk_size, size)
+            if end < size:
+                f.seek(end)
+                f.readline()  # дочитуємо рядок до кінця
+                end = min(f.tell(), size)
+            ranges.append((str(path), start, end))
+            start = end
+    return ranges
+
+
+def chunk_lines(path: str, start: int, end: Optional[int]) -> Iterator[str]:
+    """Рядки діапазону файлу; end=None - весь файл, можливо стиснутий"""
+    if end is None:
+        with open_log(path) as f:
+            yield from f
+        return
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    yield from data.decode('utf-8', errors='replace').splitlines()
+
+
+def analyze_chunk(task: Tuple[str, int, Optional[int]]) -> LogStats:
+    """Обробити один діапазон файлу (виконується в окремому процесі)"""
+    path, start, end = task
+    stats = LogStats()
+    ips, statuses, paths = stats.ips, stats.statuses, stats.paths
+    hours, auth_failures = stats.hours, stats.auth_failures
+    match = LOG_PATTERN.match
+
+    for line in chunk_lines(path, start, end):
+        found = match(line)
+        if found:
+            ip, timestamp, path_, status = found.group('ip', 'timestamp', 'path', 'status')
+            ips[ip] += 1
+            statuses[status] += 1
+            paths[path_] += 1
+            hours[timestamp_hour(timestamp)] += 1
+            if status in AUTH_FAILURE_STATUSES:
+                auth_failures[ip] += 1
+            stats.total += 1
+    return stats
+
+
+def parallel_analysis(paths, workers: Optional[int] = None, chunk_size: int = CHUNK_SIZE) -> LogStats:
+    """Паралельний аналіз файлів у пулі процесів"""
+    tasks = [task for path in paths for task in chunk_ranges(path, chunk_size)]
+    stats = LogStats()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_stats in executor.map(analyze_chunk, tasks):
+            stats.merge(chunk_stats)
+    return stats
+
+
+def print_report(stats: LogStats, n: int = 20):
+    print(f"\nВсього запитів: {stats.total:,}")
+    print(f"\nТоп-{n} IP адрес:")
+    for ip, count in stats.top_ips(n):
+        print(f"  {ip:18} {count:>8,}")
+    print("\nРозподіл кодів статусу:")
+    for status, count in stats.status_distribution().items():
+        print(f"  {status}: {count:>8,} ({count / stats.total:.1%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Паралельний аналіз access_log_{i}.log")
+    parser.add_argument('log_dir', nargs='?', default=LOG_DIR, help="каталог з файлами логів")
+    parser.add_argument('--workers', type=int, default=None, help="кількість процесів (за замовчуванням - всі ядра)")
+    parser.add_argument('--files', type=int, default=LOG_FILES_COUNT, help="кількість файлів")
+    args = parser.parse_args()
+
+    paths = log_files(args.log_dir, args.files)
+
+    start = time.perf_counter()
+    sequential = sequential_analysis(paths)
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = parallel_analysis(paths, args.workers)
+    parallel_time = time.perf_counter() - start
+
+    print_report(parallel)
+
+    workers = args.workers or os.cpu_count()
+    print(f"\n⏱️ Генератор (1 процес): {sequential_time:.2f}s")
+    print(f"⏱️ Map-reduce ({workers} процесів): {parallel_time:.2f}s | x{sequential_time / parallel_time:.1f}")
+    results = [parallel]
+
+    if any(compressed_opener(path) for path in paths):
+        # розпаковка в окремих процесах, парсинг - в одному конвеєрі генераторів
+        start = time.perf_counter()
+        results.append(analyze_lines(parallel_file_generator(paths, args.workers)))
+        reader_time = time.perf_counter() - start
+        print(f"⏱️ Паралельна розпаковка ({workers} процесів) + генератор: {reader_time:.2f}s "
+              f"| x{sequential_time / reader_time:.1f}")
+
+    same = all(sequential.top_ips(20) == stats.top_ips(20) and
+               sequential.status_distribution() == stats.status_distribution() for stats in results)
+    print("✓ Результати збігаються з послідовним генератором" if same else "❌ Результати відрізняються")
+
+
+if __name__ == '__main__':
+    main()
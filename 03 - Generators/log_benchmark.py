@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Відтворюваний бенчмарк завантаження журналів: список vs генератор,
+а також парсинг міток часу: datetime.strptime vs TimestampParser.
+
+Тести з Benchmark_test_code.md (memory_test_*, speed_test_*) запускаються один раз і
+міряють різницю RSS через psutil - цей показник шумить і не порівнюється між запусками.
+Тут для кожного підходу:
+- дані потрібного розміру генерує log_generator.py з фіксованим seed;
+- спочатку прогрівочні запуски, потім кілька вимірюваних;
+- пам'ять - пік tracemalloc (окремим запуском, бо трасування сповільнює код);
+- рядків за секунду та час до першого результату;
+- результати записуються в JSON, попередній JSON можна передати як базу для порівняння.
+
+Використання:
+    python log_benchmark.py
+    python log_benchmark.py --files 10 --lines 50000 --repeat 5 --output results.json
+    python log_benchmark.py --baseline results.json    # чи не стало повільніше
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator
+
+from log_analysis import (LogStats, TimestampParser, compressed_opener, file_generator, log_files, open_log,
+                          parse_log_line, parse_timestamp_strptime)
+from log_generator import generate_logs
+
+DATA_DIR = './benchmark_data'
+OUTPUT_FILE = 'benchmark_results.json'
+FILES = 10
+LINES = 20_000
+SEED = 42
+WARMUP = 1
+REPEAT = 5
+# наскільки повільніше за базу вважається регресією
+REGRESSION_TOLERANCE = 0.10
+
+
+# ============================================================================
+# Дані (генерує log_generator.py)
+# ============================================================================
+
+def dataset_info(paths) -> dict:
+    lines = 0
+    for path in paths:
+        with (compressed_opener(path) or open)(path, 'rb') as f:
+            lines += sum(block.count(b'\n') for block in iter(lambda: f.read(1024 * 1024), b''))
+    return {'files': len(paths), 'lines': lines, 'bytes': sum(Path(path).stat().st_size for path in paths)}
+
+
+# ============================================================================
+# Підходи, що порівнюються. Кожен - генератор результатів: так вимірюється
+# час до першого результату, а рахує рядки сам бенчмарк.
+# ============================================================================
+
+def traditional(paths) -> Iterator[str]:
+    """Як memory_test_traditional: спочатку всі рядки в список, потім обробка"""
+    all_lines = []
+    for path in paths:
+        with open_log(path) as f:
+            all_lines.extend(f.readlines())
+    for line in all_lines:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def generator(paths) -> Iterator[str]:
+    """Як memory_test_generator: рядок за рядком"""
+    for line in file_generator(paths):
+        if line:
+            yield line
+
+
+def generator_parse(paths) -> Iterator[dict]:
+    """Генератор + parse_log_line + агрегація LogStats (Завдання 1)"""
+    stats = LogStats()
+    for line in file_generator(paths):
+        record = parse_log_line(line)
+        if record:
+            stats.add(record)
+            yield record
+
+
+CASES: Dict[str, Callable[..., Iterator]] = {
+    'traditional': traditional,
+    'generator': generator,
+    'generator_parse': generator_parse,
+}
+
+
+# ============================================================================
+# Вимірювання
+# ============================================================================
+
+def run_once(case: Callable, paths):
+    """Один запуск: (секунд усього, секунд до першого результату, кількість результатів)"""
+    start = time.perf_counter()
+    first_result = None
+    count = 0
+    for _ in case(paths):
+        if first_result is None:
+            first_result = time.perf_counter() - start
+        count += 1
+    return time.perf_counter() - start, first_result, count
+
+
+def peak_memory(case: Callable, paths) -> float:
+    """Пік пам'яті Python за tracemalloc, MB"""
+    tracemalloc.start()
+    for _ in case(paths):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+def benchmark_case(case: Callable, paths, warmup: int = WARMUP, repeat: int = REPEAT) -> dict:
+    for _ in range(warmup):
+        run_once(case, paths)
+    trials = [run_once(case, paths) for _ in range(repeat)]
+    times = [total for total, _, _ in trials]
+    first_results = [first for _, first, _ in trials if first is not None]
+    count = trials[0][2]
+    median = statistics.median(times)
+    return {
+        'results': count,
+        'times': times,
+        'median': median,
+        'min': min(times),
+        'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+        'lines_per_second': count / median if median else 0.0,
+        'first_result': statistics.median(first_results) if first_results else None,
+        'peak_memory_mb': peak_memory(case, paths),
+    }
+
+
+def benchmark(paths, cases=None, warmup: int = WARMUP, repeat: int = REPEAT) -> dict:
+    return {name: benchmark_case(CASES[name], paths, warmup, repeat) for name in cases or CASES}
+
+
+# Парсери міток часу; кожен запуск отримує новий TimestampParser, щоб кеш починався порожнім
+TIMESTAMP_PARSERS: Dict[str, Callable[[], Callable[[str], int]]] = {
+    'strptime': lambda: parse_timestamp_strptime,
+    'timestamp_parser': lambda: TimestampParser().parse,
+}
+
+
+def benchmark_timestamps(paths, warmup: int = WARMUP, repeat: int = REPEAT) -> dict:
+    """Тільки перетворення міток часу - рядки вже прочитані і розбиті"""
+    timestamps = [record['timestamp'] for record in map(parse_log_line, file_generator(paths)) if record]
+    results = {}
+    for name, make_parser in TIMESTAMP_PARSERS.items():
+        times = []
+        for trial in range(warmup + repeat):
+            parse = make_parser()
+            start = time.perf_counter()
+            for timestamp in timestamps:
+                parse(timestamp)
+            if trial >= warmup:
+                times.append(time.perf_counter() - start)
+        median = statistics.median(times)
+        results[name] = {
+            'results': len(timestamps),
+            'times': times,
+            'median': median,
+            'min': min(times),
+            'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+            'lines_per_second': len(timestamps) / median if median else 0.0,
+        }
+    return results
+
+
+def compare(results: dict, baseline: dict) -> Dict[str, float]:
+    """Відношення медіанного часу до бази для кожного вимірювання, що є в обох результатах"""
+    ratios = {}
+    for section in ('results', 'timestamps'):
+        for name, result in results.get(section, {}).items():
+            if name in baseline.get(section, {}):
+                ratios[name] = result['median'] / baseline[section][name]['median']
+    return ratios
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк завантаження журналів: список vs генератор")
+    parser.add_argument('--data', default=DATA_DIR, help="каталог зі згенерованими журналами")
+    parser.add_argument('--files', type=int, default=FILES, help="кількість файлів")
+    parser.add_argument('--lines', type=int, default=LINES, help="рядків у кожному файлі")
+    parser.add_argument('--seed', type=int, default=SEED, help="seed генератора даних")
+    parser.add_argument('--regenerate', action='store_true', help="згенерувати дані заново")
+    parser.add_argument('--warmup', type=int, default=WARMUP, help="прогрівочних запусків")
+    parser.add_argument('--repeat', type=int, default=REPEAT, help="вимірюваних запусків")
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), help="підходи для порівняння")
+    parser.add_argument('--output', default=OUTPUT_FILE, help="JSON з результатами")
+    parser.add_argument('--baseline', help="JSON попереднього запуску для пошуку регресій")
+    args = parser.parse_args()
+
+    paths = log_files(args.data, args.files)
+    info_file = Path(args.data) / 'dataset.json'
+    dataset = {'files': args.files, 'lines_per_file': args.lines, 'seed': args.seed}
+    if (args.regenerate or not all(path.exists() for path in paths) or
+            not info_file.exists() or json.loads(info_file.read_text()) != dataset):
+        print(f"Генерація {args.files} x {args.lines:,} рядків у {args.data} ...")
+        generate_logs(args.data, args.files, args.lines, args.seed)
+        info_file.write_text(json.dumps(dataset))
+
+    results = {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'dataset': {**dataset, **dataset_info(paths)},
+        'warmup': args.warmup,
+        'repeat': args.repeat,
+        'results': benchmark(paths, args.cases, args.warmup, args.repeat),
+        'timestamps': benchmark_timestamps(paths, args.warmup, args.repeat),
+    }
+
+    print(f"\n{'Підхід':<18}{'Медіана, с':>12}{'±':>8}{'Рядків/с':>12}{'Перший, с':>12}{'Пік, MB':>10}")
+    for name, result in results['results'].items():
+        first = f"{result['first_result']:.4f}" if result['first_result'] is not None else '-'
+        print(f"{name:<18}{result['median']:>12.3f}{result['stdev']:>8.3f}"
+              f"{result['lines_per_second']:>12,.0f}{first:>12}{result['peak_memory_mb']:>10.1f}")
+
+    print(f"\n{'Мітки часу':<18}{'Медіана, с':>12}{'±':>8}{'Рядків/с':>12}")
+    for name, result in results['timestamps'].items():
+        print(f"{name:<18}{result['median']:>12.3f}{result['stdev']:>8.3f}{result['lines_per_second']:>12,.0f}")
+    timestamps = results['timestamps']
+    print(f"TimestampParser швидше за strptime у "
+          f"x{timestamps['strptime']['median'] / timestamps['timestamp_parser']['median']:.1f}")
+
+    Path(args.output).write_text(json.dumps(results, indent=2))
+    print(f"\nРезультати записано у {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        if baseline.get('dataset') != results['dataset']:
+            print("⚠️ Дані бази відрізняються від поточних - порівняння неточне")
+        regressions = 0
+        for name, ratio in compare(results, baseline).items():
+            slower = ratio > 1 + REGRESSION_TOLERANCE
+            regressions += slower
+            print(f"{'❌' if slower else '✓'} {name:<18} x{ratio:.2f} від бази")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
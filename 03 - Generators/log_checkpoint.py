@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Інкрементальний аналіз журналів з контрольними точками (checkpoint).
+
+Журнали тільки дописуються, тому немає сенсу щоразу читати їх з першого байта.
+Для кожного файлу зберігаються inode, розмір і зсув останнього обробленого рядка,
+а разом з ними - накопичені результати (лічильники, погодинна гістограма, 401/403).
+Повторний запуск парсить тільки дописані байти.
+
+Ротація (новий inode) і обрізання файлу (розмір менший за зсув або змінився
+відбиток початку файлу) обробляються:
+- після ротації спочатку дочитується хвіст старого файлу (access_log_0.log.1),
+  потім новий файл читається з початку;
+- обрізаний файл читається з початку.
+Стиснуті файли (.gz, .bz2, .xz) не дописуються: новий або змінений файл обробляється цілком,
+а його попередній внесок у результати віднімається - для цього в стані файлу зберігаються
+його власні лічильники.
+
+Використання:
+    python log_checkpoint.py ./log_investigation
+    python log_checkpoint.py ./log_investigation --state checkpoint.json --reset
+"""
+
+import argparse
+import json
+import os
+import time
+import zlib
+from pathlib import Path
+from typing import Optional
+
+from log_analysis import (LOG_DIR, LOG_FILES_COUNT, LogStats, analyze_chunk, chunk_ranges,
+                          compressed_opener, log_files, print_report)
+
+STATE_FILE = 'checkpoint.json'
+
+# Суфікс, з яким logrotate перейменовує попередній файл
+ROTATED_SUFFIX = '.1'
+
+# Скільки перших байт файлу входить у його відбиток
+FINGERPRINT_SIZE = 1024
+
+
+def fingerprint(path, size: int) -> int:
+    """CRC32 початку файлу: помічає файл, який обрізали і дописали знову понад старий зсув"""
+    with open(path, 'rb') as f:
+        return zlib.crc32(f.read(min(size, FINGERPRINT_SIZE)))
+
+
+def last_line_end(path, start: int, size: int, block_size: int = 64 * 1024) -> int:
+    """Позиція одразу після останнього '\\n' в діапазоні [start, size) - неповний рядок ще дописується"""
+    with open(path, 'rb') as f:
+        end = size
+        while end > start:
+            block_start = max(start, end - block_size)
+            f.seek(block_start)
+            position = f.read(end - block_start).rfind(b'\n')
+            if position != -1:
+                return block_start + position + 1
+            end = block_start
+    return start
+
+
+class LogCheckpoint:
+    """Стан інкрементального аналізу: позиції у файлах + накопичені результати"""
+
+    def __init__(self, state_file: str = STATE_FILE):
+        self.state_file = Path(state_file)
+        self.files = {}  # шлях -> {'inode', 'size', 'offset', 'fingerprint'} (+ 'stats' у стиснутих)
+        self.stats = LogStats()
+        self.load()
+
+    def load(self):
+        if self.state_file.exists():
+            state = json.loads(self.state_file.read_text())
+            self.files = state['files']
+            self.stats = LogStats.from_dict(state['stats'])
+
+    def save(self):
+        """Запис через тимчасовий файл, щоб перерваний запуск не зіпсував стан"""
+        temp_file = self.state_file.with_name(self.state_file.name + '.tmp')
+        temp_file.write_text(json.dumps({'files': self.files, 'stats': self.stats.to_dict()}))
+        os.replace(temp_file, self.state_file)
+
+    def reset(self):
+        self.files = {}
+        self.stats = LogStats()
+
+    def _process_range(self, path, start: int, size: int) -> int:
+        """Обробити повні рядки з [start, size), повернути новий зсув"""
+        end = last_line_end(path, start, size)
+        for task in chunk_ranges(path, start=start, size=end):
+            self.stats.merge(analyze_chunk(task))
+        return end
+
+    def _finish_rotated(self, path: str, entry: dict):
+        """Дочитати хвіст файлу, який logrotate перейменував у path.1"""
+        rotated = path + ROTATED_SUFFIX
+        if os.path.exists(rotated) and os.stat(rotated).st_ino == entry['inode']:
+            self._process_range(rotated, entry['offset'], os.path.getsize(rotated))
+
+    def update_file(self, path) -> int:
+        """
+        Обробити нові рядки одного файлу
+        :return: кількість оброблених байт
+        """
+        path = str(path)
+        info = os.stat(path)
+        entry: Optional[dict] = self.files.get(path)
+        offset = 0
+
+        if compressed_opener(path) is not None:
+            return self._update_compressed(path, info, entry)
+
+        if entry is not None:
+            if entry['inode'] != info.st_ino:
+                # файл ротовано: старий дочитуємо, новий читаємо з початку
+                self._finish_rotated(path, entry)
+            elif (info.st_size < entry['offset'] or
+                  fingerprint(path, entry['offset']) != entry['fingerprint']):
+                # файл обрізано - читаємо з початку
+                pass
+            else:
+                offset = entry['offset']
+
+        new_offset = self._process_range(path, offset, info.st_size)
+        self.files[path] = {'inode': info.st_ino, 'size': info.st_size, 'offset': new_offset,
+                            'fingerprint': fingerprint(path, new_offset)}
+        return new_offset - offset
+
+    def _update_compressed(self, path: str, info: os.stat_result, entry: Optional[dict]) -> int:
+        """
+        Стиснутий файл не можна дочитати з зсуву, тому новий або змінений файл обробляється цілком:
+        його попередні лічильники віднімаються від результатів і замінюються новими
+        """
+        if entry is not None and entry['inode'] == info.st_ino and entry['size'] == info.st_size:
+            return 0
+        file_stats = analyze_chunk((path, 0, None))
+        if entry is not None and 'stats' in entry:
+            self.stats.subtract(LogStats.from_dict(entry['stats']))
+        self.stats.merge(file_stats)
+        self.files[path] = {'inode': info.st_ino, 'size': info.st_size, 'offset': info.st_size,
+                            'fingerprint': fingerprint(path, info.st_size), 'stats': file_stats.to_dict()}
+        return info.st_size
+
+    def update(self, paths) -> int:
+        """Обробити нові рядки всіх файлів і зберегти стан"""
+        processed = sum(self.update_file(path) for path in paths if os.path.exists(path))
+        self.save()
+        return processed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Інкрементальний аналіз access_log_{i}.log")
+    parser.add_argument('log_dir', nargs='?', default=LOG_DIR, help="каталог з файлами логів")
+    parser.add_argument('--files', type=int, default=LOG_FILES_COUNT, help="кількість файлів")
+    parser.add_argument('--state', default=STATE_FILE, help="файл зі станом аналізу")
+    parser.add_argument('--reset', action='store_true', help="почати аналіз спочатку")
+    args = parser.parse_args()
+
+    checkpoint = LogCheckpoint(args.state)
+    if args.reset:
+        checkpoint.reset()
+
+    start = time.perf_counter()
+    processed = checkpoint.update(log_files(args.log_dir, args.files))
+    elapsed = time.perf_counter() - start
+
+    print_report(checkpoint.stats)
+    print("\nЗапити по годинах:")
+    for hour, count in sorted(checkpoint.stats.hours.items()):
+        print(f"  {hour}:00 {count:>8,}")
+    print("\nТоп-10 IP з відповідями 401/403:")
+    for ip, count in checkpoint.stats.auth_failures.most_common(10):
+        print(f"  {ip:18} {count:>8,}")
+
+    print(f"\n⏱️ Оброблено {processed / 1024 / 1024:.1f} MB нових даних за {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
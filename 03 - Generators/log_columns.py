@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Колонкове сховище журналів для повторних запитів (Завдання 1-4).
+
+Журнали парсяться один раз і перетворюються на масиви numpy:
+    ips          uint32  - IPv4 адреса як число (0 - адреса не IPv4, див. нижче)
+    statuses     uint16  - код статусу HTTP
+    timestamps   int64   - час запиту, секунди Unix (UTC)
+    paths        uint32  - номер шляху у словнику paths.json
+    user_agents  uint32  - номер User-Agent у словнику user_agents.json
+
+Колонки зберігаються у файли .npy і відкриваються через mmap, тому наступні
+запити не читають і не парсять сирі журнали. Топ-N, розподіл статусів та
+активність по годинах рахуються векторними операціями за мілісекунди.
+
+Обмеження: колонка ips вміщує лише IPv4. Усі інші адреси (IPv6, сміття в полі IP)
+записуються як 0 і в запитах виглядають як одна адреса '0.0.0.0'; їх кількість
+показує LogColumns.non_ipv4. Рядки з неправильною міткою часу пропускаються
+і рахуються в LogColumns.malformed.
+
+Використання:
+    python log_columns.py ./log_investigation
+    python log_columns.py ./log_investigation --store ./log_columns --rebuild
+"""
+
+import argparse
+import json
+import socket
+import struct
+import time
+from array import array
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+
+from log_analysis import (AUTH_FAILURE_STATUSES, LOG_DIR, LOG_FILES_COUNT, LOG_PATTERN, log_files, open_log,
+                          parse_timestamp, sequential_analysis)
+
+STORE_DIR = './log_columns'
+
+# назва колонки -> (тип numpy, код типу для array під час побудови)
+COLUMNS = {
+    'ips': (np.uint32, 'I'),
+    'statuses': (np.uint16, 'H'),
+    'timestamps': (np.int64, 'q'),
+    'paths': (np.uint32, 'I'),
+    'user_agents': (np.uint32, 'I'),
+}
+# колонки, що зберігають номери значень у словнику
+DICTIONARIES = ('paths', 'user_agents')
+
+
+def ip_to_int(ip: str) -> int:
+    """
+    '185.220.101.47' --> 3118228783; не IPv4 адреса --> 0.
+    Усі не IPv4 адреси отримують однакове значення 0 - розрізнити їх у колонці не можна
+    """
+    try:
+        return struct.unpack('!I', socket.inet_aton(ip))[0]
+    except OSError:
+        return 0
+
+
+def int_to_ip(value: int) -> str:
+    """3118228783 --> '185.220.101.47'"""
+    return socket.inet_ntoa(struct.pack('!I', int(value)))
+
+
+class LogColumns:
+    """Записи журналів у вигляді колонок numpy"""
+
+    def __init__(self, columns: dict, dictionaries: dict, malformed: int = 0):
+        self.ips = columns['ips']
+        self.statuses = columns['statuses']
+        self.timestamps = columns['timestamps']
+        self.paths = columns['paths']
+        self.user_agents = columns['user_agents']
+        self.dictionaries = dictionaries  # назва колонки -> список значень
+        self.malformed = malformed  # рядки з неправильною міткою часу (лише під час побудови)
+
+    def __len__(self):
+        return len(self.ips)
+
+    @property
+    def non_ipv4(self) -> int:
+        """Кількість записів з адресою не IPv4 (у колонці ips вони всі - 0)"""
+        return int(np.count_nonzero(self.ips == 0))
+
+    # ------------------------------------------------------------------------
+    # Побудова, збереження, завантаження
+    # ------------------------------------------------------------------------
+
+    @classmethod
+    def from_logs(cls, paths) -> 'LogColumns':
+        """
+        Розпарсити журнали один раз; рядки, що не відповідають формату, пропускаються,
+        а рядки з неправильною міткою часу ще й рахуються в malformed
+        """
+        columns = {name: array(typecode) for name, (_, typecode) in COLUMNS.items()}
+        codes = {name: {} for name in DICTIONARIES}  # значення -> номер у словнику
+        ip_cache = {}
+        malformed = 0
+        match = LOG_PATTERN.match
+
+        ips, statuses, timestamps = columns['ips'], columns['statuses'], columns['timestamps']
+        path_column, agent_column = columns['paths'], columns['user_agents']
+        path_codes, agent_codes = codes['paths'], codes['user_agents']
+
+        for path in paths:
+            with open_log(path) as f:
+                for line in f:
+                    found = match(line)
+                    if not found:
+                        continue
+                    ip, timestamp, path_, status, agent = found.group(
+                        'ip', 'timestamp', 'path', 'status', 'user_agent')
+                    try:
+                        seconds = parse_timestamp(timestamp)
+                    except ValueError:
+                        # рядок збігся з шаблоном, але дата неможлива - пропускаємо до запису колонок
+                        malformed += 1
+                        continue
+
+                    # IP повторюються в тисячах рядків - перетворюємо кожну адресу один раз
+                    ip_value = ip_cache.get(ip)
+                    if ip_value is None:
+                        ip_value = ip_cache[ip] = ip_to_int(ip)
+
+                    ips.append(ip_value)
+                    statuses.append(int(status))
+                    timestamps.append(seconds)
+                    path_column.append(path_codes.setdefault(path_, len(path_codes)))
+                    agent_column.append(agent_codes.setdefault(agent or '', len(agent_codes)))
+
+        return cls({name: np.frombuffer(values, dtype=COLUMNS[name][0]) if len(values)
+                    else np.zeros(0, dtype=COLUMNS[name][0]) for name, values in columns.items()},
+                   {name: list(codes[name]) for name in DICTIONARIES}, malformed)
+
+    def save(self, directory: str = STORE_DIR):
+        """Кожна колонка - окремий файл .npy, словники - JSON"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in COLUMNS:
+            np.save(directory / f'{name}.npy', getattr(self, name))
+        for name in DICTIONARIES:
+            (directory / f'{name}.json').write_text(json.dumps(self.dictionaries[name]))
+
+    @classmethod
+    def load(cls, directory: str = STORE_DIR) -> 'LogColumns':
+        """Відкрити збережені колонки через mmap: дані читаються з диску лише під час запиту"""
+        directory = Path(directory)
+        columns = {name: np.load(directory / f'{name}.npy', mmap_mode='r') for name in COLUMNS}
+        dictionaries = {name: json.loads((directory / f'{name}.json').read_text()) for name in DICTIONARIES}
+        return cls(columns, dictionaries)
+
+    @staticmethod
+    def exists(directory: str = STORE_DIR) -> bool:
+        directory = Path(directory)
+        return all((directory / f'{name}.npy').exists() for name in COLUMNS)
+
+    # ------------------------------------------------------------------------
+    # Запити
+    # ------------------------------------------------------------------------
+
+    def top_ips(self, n: int = 20, mask=None) -> List[Tuple[str, int]]:
+        """
+        Топ-N IP; порядок такий самий, як у LogStats.top_ips
+        :param mask: булевий масив для відбору записів, наприклад statuses == 404
+        """
+        ips = self.ips if mask is None else self.ips[mask]
+        values, counts = np.unique(ips, return_counts=True)
+        if len(counts) > n:
+            # кандидати - всі IP з кількістю не меншою за N-ту, далі сортуємо як рядки
+            threshold = np.partition(counts, len(counts) - n)[len(counts) - n]
+            keep = counts >= threshold
+            values, counts = values[keep], counts[keep]
+        top = [(int_to_ip(value), int(count)) for value, count in zip(values, counts)]
+        return sorted(top, key=lambda item: (-item[1], item[0]))[:n]
+
+    def _top_codes(self, name: str, n: int) -> List[Tuple[str, int]]:
+        counts = np.bincount(getattr(self, name), minlength=len(self.dictionaries[name]))
+        order = np.argsort(-counts, kind='stable')[:n]
+        values = self.dictionaries[name]
+        return [(values[code], int(counts[code])) for code in order if counts[code]]
+
+    def top_paths(self, n: int = 20) -> List[Tuple[str, int]]:
+        return self._top_codes('paths', n)
+
+    def top_user_agents(self, n: int = 20) -> List[Tuple[str, int]]:
+        return self._top_codes('user_agents', n)
+
+    def status_distribution(self) -> dict:
+        """Розподіл кодів статусу HTTP: {'200': 1000, '404': 50}"""
+        counts = np.bincount(self.statuses)
+        return {str(status): int(counts[status]) for status in np.flatnonzero(counts)}
+
+    def hourly_distribution(self) -> dict:
+        """Кількість запитів по годинах доби (UTC): {'00': 1000, ..., '23': 900}"""
+        counts = np.bincount(self.timestamps // 3600 % 24, minlength=24)
+        return {f'{hour:02d}': int(count) for hour, count in enumerate(counts) if count}
+
+    def auth_failures(self, n: int = 20) -> List[Tuple[str, int]]:
+        """IP з найбільшою кількістю відповідей 401/403 (брутфорс)"""
+        return self.top_ips(n, np.isin(self.statuses, [int(status) for status in AUTH_FAILURE_STATUSES]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Колонкове сховище access_log_{i}.log")
+    parser.add_argument('log_dir', nargs='?', default=LOG_DIR, help="каталог з файлами логів")
+    parser.add_argument('--files', type=int, default=LOG_FILES_COUNT, help="кількість файлів")
+    parser.add_argument('--store', default=STORE_DIR, help="каталог для файлів колонок")
+    parser.add_argument('--rebuild', action='store_true', help="перебудувати колонки з журналів")
+    args = parser.parse_args()
+
+    paths = log_files(args.log_dir, args.files)
+    if args.rebuild or not LogColumns.exists(args.store):
+        start = time.perf_counter()
+        built = LogColumns.from_logs(paths)
+        built.save(args.store)
+        print(f"⏱️ Побудова колонок: {time.perf_counter() - start:.2f}s")
+        if built.malformed:
+            print(f"⚠️ Пропущено рядків з неправильною міткою часу: {built.malformed:,}")
+
+    start = time.perf_counter()
+    columns = LogColumns.load(args.store)
+    top_ips = columns.top_ips(20)
+    statuses = columns.status_distribution()
+    hours = columns.hourly_distribution()
+    auth_failures = columns.auth_failures(10)
+    query_time = time.perf_counter() - start
+
+    print(f"\nВсього запитів: {len(columns):,}")
+    if columns.non_ipv4:
+        print(f"⚠️ Записів з адресою не IPv4 (показані як 0.0.0.0): {columns.non_ipv4:,}")
+    print("\nТоп-20 IP адрес:")
+    for ip, count in top_ips:
+        print(f"  {ip:18} {count:>8,}")
+    print("\nРозподіл кодів статусу:")
+    for status, count in statuses.items():
+        print(f"  {status}: {count:>8,} ({count / len(columns):.1%})")
+    print("\nЗапити по годинах (UTC):")
+    for hour, count in hours.items():
+        print(f"  {hour}:00 {count:>8,}")
+    print("\nТоп-10 IP з відповідями 401/403:")
+    for ip, count in auth_failures:
+        print(f"  {ip:18} {count:>8,}")
+
+    start = time.perf_counter()
+    stats = sequential_analysis(paths)
+    parse_time = time.perf_counter() - start
+
+    print(f"\n⏱️ Запити по колонках (mmap): {query_time * 1000:.1f}ms")
+    print(f"⏱️ Повторний парсинг журналів: {parse_time:.2f}s | x{parse_time / query_time:.0f}")
+    same = stats.top_ips(20) == top_ips and stats.status_distribution() == statuses
+    print("✓ Результати збігаються з послідовним генератором" if same else "❌ Результати відрізняються")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Генератор реалістичних журналів nginx (combined) для навантажувального тестування.
+
+Суміш трафіку як у README:
+    70% - нормальний трафік: браузери, сторінки курсів, 200/304, дружні країни
+    15% - підозрілий: невдалі входи 401/403, python-requests/curl, нічний час, країни високого ризику
+    10% - атаки: пошук .env, wp-admin, phpmyadmin, SQL-ін'єкції, sqlmap/Nikto/masscan
+     5% - DDoS: короткі сплески "GET /" 503 без User-Agent від ботнету
+
+Рядок складається з трьох заздалегідь відрендерених шматків bytes:
+    голова  '185.220.101.47 - - ['                       - пул IP для кожного типу трафіку
+    час     '27/Aug/2025:14:23:15 +0000] '               - 86400 секунд доби
+    хвіст   '"GET /.env HTTP/1.1" 404 0 "-" "Nikto/2.1.6" "-"\\n' - пул шаблонів запитів
+Номери шматків для всіх рядків вибираються векторно (numpy), а рядки збираються
+одним bytes.join - у циклі Python немає жодного рядка журналу.
+Однаковий seed дає побайтно однакові файли.
+
+Використання:
+    python log_generator.py ./log_investigation
+    python log_generator.py ./big_logs --files 10 --lines 1000000 --seed 7
+    python log_generator.py ./big_logs --files 4 --mb 1024
+"""
+
+import argparse
+import csv
+import ipaddress
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from log_analysis import LOG_DIR, LOG_FILES_COUNT
+
+LINES = 46_800  # як у файлах з README
+SEED = 42
+DATE = date(2025, 8, 27)
+RANGES_FILE = Path(__file__).with_name('ip_ranges.csv')
+
+# скільки рядків збирається одним bytes.join; невеликі блоки працюють у кеші процесора
+BLOCK_LINES = 20_000
+# скільки різних хвостів запитів рендериться для кожного типу трафіку
+TEMPLATES = 4096
+
+FRIENDLY_COUNTRIES = ('ukraine', 'usa', 'germany', 'uk', 'canada', 'netherlands', 'japan', 'brazil', 'india')
+HIGH_RISK_COUNTRIES = ('russia', 'china', 'iran', 'north_korea')
+
+NORMAL_PATHS = ['/', '/courses', '/courses/python-security', '/courses/python-basics', '/blog',
+                '/blog/generators-in-python', '/about', '/contacts', '/login', '/static/app.js',
+                '/static/style.css', '/images/logo.png', '/api/v1/courses', '/favicon.ico']
+BROWSERS = ['Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/138.0.0.0',
+            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) Safari/605.1.15',
+            'Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0',
+            'Mozilla/5.0 (iPhone; CPU iPhone OS 17_5 like Mac OS X) Mobile/15E148 Safari/604.1',
+            'Mozilla/5.0 (Linux; Android 14; Pixel 8) Chrome/138.0.0.0 Mobile Safari/537.36']
+REFERERS = ['-', 'https://google.com/', 'https://www.bing.com/', 'https://t.me/', 'https://github.com/']
+
+SUSPICIOUS_PATHS = ['/login', '/admin', '/admin/login', '/api/v1/auth', '/user/login']
+AUTOMATION_AGENTS = ['python-requests/2.25.1', 'curl/7.68.0', 'Go-http-client/1.1', 'Wget/1.21.2',
+                     'Apache-HttpClient/4.5.13 (Java/11.0.19)']
+
+ATTACK_PATHS = ['/.env', '/.git/config', '/wp-admin/', '/wp-admin/setup-config.php', '/wp-login.php',
+                '/xmlrpc.php', '/phpmyadmin/', '/pma/', '/config.php', '/.svn/entries', '/cgi-bin/test.cgi',
+                '/server-status', '/backup.sql', "/products?id=1'%20OR%20'1'='1",
+                '/search?q=%3Cscript%3Ealert(1)%3C/script%3E', '/index.php?page=../../../../etc/passwd']
+SCANNER_AGENTS = ['sqlmap/1.6.12#stable (https://sqlmap.org)', 'Nikto/2.1.6', 'masscan/1.3',
+                  'Mozilla/5.0 (compatible; Nmap Scripting Engine; https://nmap.org/book/nse.html)',
+                  'acunetix-wvs-test', 'WPScan v3.8.22 (https://wpscan.com/wordpress-security-scanner)']
+
+# тип трафіку -> частка рядків, кількість IP у пулі, країни
+TRAFFIC = {
+    'normal': (0.70, 20_000, FRIENDLY_COUNTRIES),
+    'suspicious': (0.15, 600, HIGH_RISK_COUNTRIES),
+    'attack': (0.10, 300, HIGH_RISK_COUNTRIES),
+    'ddos': (0.05, 3_000, HIGH_RISK_COUNTRIES),
+}
+
+# відносна активність по годинах доби (UTC): люди - вдень, автоматика - вночі
+DAY_PROFILE = np.array([2, 1, 1, 1, 1, 2, 3, 5, 7, 8, 9, 9, 9, 9, 9, 9, 9, 8, 8, 8, 7, 6, 4, 3], dtype=float)
+NIGHT_PROFILE = np.array([9, 9, 9, 9, 8, 7, 5, 4, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 4, 4, 5, 6, 7, 8], dtype=float)
+
+# DDoS: кілька сплесків на добу
+DDOS_BURSTS = 3
+DDOS_BURST_SECONDS = 120
+
+
+def load_networks(path=RANGES_FILE) -> dict:
+    """Країна -> список мереж з ip_ranges.csv"""
+    networks = {}
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            networks.setdefault(row['country'].strip(), []).append(ipaddress.IPv4Network(row['network'].strip()))
+    return networks
+
+
+def render_ips(rng: np.random.Generator, networks: list, count: int) -> list:
+    """count випадкових адрес з мереж, відрендерених як голова рядка"""
+    starts = np.array([int(network.network_address) for network in networks], dtype=np.int64)
+    sizes = np.array([network.num_addresses for network in networks], dtype=np.int64)
+    choice = rng.integers(0, len(networks), count)
+    values = starts[choice] + rng.integers(1, sizes[choice] - 1)
+    octets = (values[:, None] >> np.array([24, 16, 8, 0])) & 255
+    return [f'{a}.{b}.{c}.{d} - - ['.encode() for a, b, c, d in octets.tolist()]
+
+
+def render_timestamps(day: date) -> list:
+    """Всі секунди доби: '27/Aug/2025:14:23:15 +0000] '"""
+    prefix = datetime(day.year, day.month, day.day, tzinfo=timezone.utc).strftime('%d/%b/%Y')
+    return [f'{prefix}:{second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d} +0000] '.encode()
+            for second in range(86400)]
+
+
+def render_tails(rng: np.random.Generator, kind: str, count: int = TEMPLATES) -> list:
+    """Пул хвостів рядка: запит, статус, розмір, referer, User-Agent"""
+    def pick(values, size=count):
+        return [values[i] for i in rng.integers(0, len(values), size)]
+
+    if kind == 'normal':
+        methods = pick(['GET'] * 9 + ['POST'])
+        paths = pick(NORMAL_PATHS)
+        statuses = pick([200] * 17 + [304, 301, 404])
+        sizes = rng.integers(300, 60_000, count).tolist()
+        referers = pick(REFERERS)
+        agents = pick(BROWSERS)
+    elif kind == 'suspicious':
+        methods = pick(['POST', 'POST', 'GET'])
+        paths = pick(SUSPICIOUS_PATHS)
+        statuses = pick([401, 401, 403, 429])
+        sizes = rng.integers(0, 400, count).tolist()
+        referers = ['-'] * count
+        agents = pick(AUTOMATION_AGENTS)
+    elif kind == 'attack':
+        methods = pick(['GET', 'GET', 'GET', 'POST', 'HEAD'])
+        paths = pick(ATTACK_PATHS)
+        statuses = pick([404, 404, 404, 403, 400, 500])
+        sizes = rng.integers(0, 600, count).tolist()
+        referers = ['-'] * count
+        agents = pick(SCANNER_AGENTS)
+    else:
+        methods, paths, statuses, sizes, referers, agents = (
+            ['GET'] * count, ['/'] * count, pick([503, 503, 503, 502, 504]), [0] * count, ['-'] * count,
+            ['-'] * count)
+
+    # 304 і 301 без тіла відповіді
+    sizes = [0 if status in (301, 304) else size for status, size in zip(statuses, sizes)]
+    return [f'"{method} {path} HTTP/1.1" {status} {size} "{referer}" "{agent}" "-"\n'.encode()
+            for method, path, status, size, referer, agent in
+            zip(methods, paths, statuses, sizes, referers, agents)]
+
+
+class LogGenerator:
+    """Пули голів, часу і хвостів; файли генеруються з них векторно"""
+
+    def __init__(self, seed: int = SEED, day: date = DATE, ranges_file=RANGES_FILE):
+        self.seed = seed
+        rng = np.random.default_rng(seed)
+        networks = load_networks(ranges_file)
+
+        self.kinds = list(TRAFFIC)
+        self.shares = np.array([share for share, _, _ in TRAFFIC.values()])
+        self.shares /= self.shares.sum()
+
+        # всі пули зливаються в один список; для кожного типу - (зсув, розмір)
+        self.heads, self.tails = [], []
+        self.head_pools, self.tail_pools = [], []
+        for kind, (_, ip_count, countries) in TRAFFIC.items():
+            kind_networks = [network for country in countries for network in networks.get(country, [])]
+            self.head_pools.append((len(self.heads), ip_count))
+            self.heads += render_ips(rng, kind_networks, ip_count)
+            tails = render_tails(rng, kind)
+            self.tail_pools.append((len(self.tails), len(tails)))
+            self.tails += tails
+        self.timestamps = render_timestamps(day)
+        self.head_bits = len(self.heads).bit_length()
+        self.tail_bits = len(self.tails).bit_length()
+
+        self.ddos_starts = rng.integers(0, 86400 - DDOS_BURST_SECONDS, DDOS_BURSTS)
+        self.profiles = {'normal': DAY_PROFILE / DAY_PROFILE.sum(),
+                         'suspicious': NIGHT_PROFILE / NIGHT_PROFILE.sum(),
+                         'attack': NIGHT_PROFILE / NIGHT_PROFILE.sum()}
+
+        # numpy масиви об'єктів - для векторної вибірки шматків за номерами
+        self._heads = np.array(self.heads + [b''], dtype=object)[:-1]
+        self._tails = np.array(self.tails + [b''], dtype=object)[:-1]
+        self._timestamps = np.array(self.timestamps + [b''], dtype=object)[:-1]
+
+    def _seconds(self, rng: np.random.Generator, kind: str, count: int) -> np.ndarray:
+        """Секунди доби для count рядків одного типу трафіку"""
+        if kind == 'ddos':
+            burst = self.ddos_starts[rng.integers(0, len(self.ddos_starts), count)]
+            return burst + rng.integers(0, DDOS_BURST_SECONDS, count)
+        hours = rng.choice(24, count, p=self.profiles[kind])
+        return hours * 3600 + rng.integers(0, 3600, count)
+
+    def sample(self, count: int, file_index: int = 0):
+        """
+        Номери шматків для count рядків, відсортованих за часом
+        :return: (heads, seconds, tails) - масиви номерів у self.heads, self.timestamps, self.tails
+        """
+        rng = np.random.default_rng([self.seed, file_index])
+        heads, seconds, tails = [], [], []
+        for number, (kind, kind_count) in enumerate(zip(self.kinds, rng.multinomial(count, self.shares))):
+            head_offset, head_count = self.head_pools[number]
+            tail_offset, tail_count = self.tail_pools[number]
+            # кілька IP генерують більшість запитів: квадрат рівномірного розподілу зміщує вибір до початку пулу
+            skew = rng.random(kind_count) ** 2
+            heads.append(head_offset + (skew * head_count).astype(np.int64))
+            seconds.append(self._seconds(rng, kind, kind_count))
+            tails.append(tail_offset + rng.integers(0, tail_count, kind_count))
+
+        # сортуємо одне число (секунда, голова, хвіст) замість argsort і трьох перестановок
+        keys = np.concatenate(seconds) << (self.head_bits + self.tail_bits)
+        keys |= np.concatenate(heads) << self.tail_bits
+        keys |= np.concatenate(tails)
+        keys.sort()
+        return (keys >> self.tail_bits) & ((1 << self.head_bits) - 1), \
+            keys >> (self.head_bits + self.tail_bits), keys & ((1 << self.tail_bits) - 1)
+
+    def render(self, heads, seconds, tails) -> bytes:
+        """Зібрати рядки: три шматки на рядок, один bytes.join"""
+        pieces = np.empty((len(heads), 3), dtype=object)
+        pieces[:, 0] = self._heads[heads]
+        pieces[:, 1] = self._timestamps[seconds]
+        pieces[:, 2] = self._tails[tails]
+        return b''.join(pieces.ravel().tolist())
+
+    def write_file(self, path, lines: int, file_index: int = 0) -> int:
+        """
+        Записати файл журналу
+        :return: розмір файлу в байтах
+        """
+        heads, seconds, tails = self.sample(lines, file_index)
+        written = 0
+        with open(path, 'wb') as f:
+            for start in range(0, lines, BLOCK_LINES):
+                block = slice(start, start + BLOCK_LINES)
+                written += f.write(self.render(heads[block], seconds[block], tails[block]))
+        return written
+
+    def average_line_length(self) -> float:
+        """Середня довжина рядка для оцінки кількості рядків за розміром файлу"""
+        heads, seconds, tails = self.sample(10_000)
+        return len(self.render(heads, seconds, tails)) / 10_000
+
+
+def output_path(directory, i: int) -> Path:
+    """
+    Куди писати файл i - завжди звичайний access_log_{i}.log.
+    log_files() для цього не годиться: він повертає наявний .gz/.bz2/.xz, і генератор
+    перезаписав би архів простим текстом
+    """
+    return Path(directory) / f'access_log_{i}.log'
+
+
+def generate_logs(directory: str = LOG_DIR, files: int = LOG_FILES_COUNT, lines: int = LINES,
+                  seed: int = SEED) -> int:
+    """
+    Записати files файлів access_log_{i}.log по lines рядків
+    :return: загальний розмір у байтах
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    generator = LogGenerator(seed)
+    return sum(generator.write_file(output_path(directory, i), lines, i) for i in range(files))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Генератор журналів nginx access_log_{i}.log")
+    parser.add_argument('log_dir', nargs='?', default=LOG_DIR, help="каталог для файлів")
+    parser.add_argument('--files', type=int, default=LOG_FILES_COUNT, help="кількість файлів")
+    parser.add_argument('--lines', type=int, default=LINES, help="рядків у кожному файлі")
+    parser.add_argument('--mb', type=float, help="приблизний розмір кожного файлу в MB (замість --lines)")
+    parser.add_argument('--seed', type=int, default=SEED, help="seed: однаковий seed - однакові файли")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    generator = LogGenerator(args.seed)
+    setup = time.perf_counter() - start
+
+    lines = args.lines
+    if args.mb:
+        lines = int(args.mb * 1024 * 1024 / generator.average_line_length())
+
+    Path(args.log_dir).mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    written = sum(generator.write_file(output_path(args.log_dir, i), lines, i) for i in range(args.files))
+    elapsed = time.perf_counter() - start
+
+    print(f"✓ {args.files} файлів по {lines:,} рядків у {args.log_dir}: {written / 1024 / 1024:,.1f} MB")
+    print(f"⏱️ Підготовка шаблонів: {setup:.2f}s | генерація: {elapsed:.2f}s | "
+          f"{written / 1024 / 1024 / elapsed:,.0f} MB/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Швидкий сканер журналів: IP та код статусу без декодування рядків.
+
+Файл відображається в пам'ять (mmap), регулярні вирази над bytes знаходять
+тільки потрібні поля, а Counter рахує їх на рівні C.
+Рядки ніколи не перетворюються в str - декодуються лише значення у звіті.
+Оброблені сторінки файлу відпускаються (madvise), тому RSS не росте з розміром файлу.
+
+Використання:
+    python log_scanner.py ./log_investigation
+"""
+
+import argparse
+import mmap
+import multiprocessing
+import os
+import re
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+
+import psutil
+
+from log_analysis import (LOG_DIR, LOG_FILES_COUNT, compressed_opener, file_generator, log_files,
+                          parse_log_line)
+
+# IP на початку рядка: після '\n' (пошук по літералу '\n' працює набагато швидше за ^ з MULTILINE)
+IP_PATTERN = re.compile(rb'\n([^ \n]+)')
+FIRST_IP_PATTERN = re.compile(rb'[^ \n]+')
+# код статусу одразу після запиту в лапках
+STATUS_PATTERN = re.compile(rb'" (\d{3}) ')
+
+# Скільки байт файлу обробляється за один виклик findall
+WINDOW_SIZE = 1024 * 1024
+
+
+def scan_file(path, window_size: int = WINDOW_SIZE) -> Tuple[Counter, Counter]:
+    """
+    Порахувати IP та статуси у файлі, ключі - bytes
+    :return: (ips, statuses), наприклад ({b'185.220.101.47': 3}, {b'404': 3})
+    """
+    ips, statuses = Counter(), Counter()
+    if os.path.getsize(path) == 0:
+        return ips, statuses
+    opener = compressed_opener(path)
+    if opener is not None:
+        return scan_stream(opener(path, 'rb'), window_size)
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        first = FIRST_IP_PATTERN.match(mm)
+        if first:
+            ips[first.group()] += 1
+
+        # вікна [start, end) починаються з '\n' попереднього рядка
+        start = 0
+        while start < size:
+            end = mm.find(b'\n', min(start + window_size, size))
+            end = size if end == -1 else end
+            # findall + Counter рахують без циклу Python по рядках
+            ips.update(IP_PATTERN.findall(mm, start, end))
+            statuses.update(STATUS_PATTERN.findall(mm, start, end))
+            if hasattr(mm, 'madvise'):
+                # сторінки вже оброблено - віддаємо їх системі
+                page_start = start - start % mmap.PAGESIZE
+                mm.madvise(mmap.MADV_DONTNEED, page_start, end - page_start)
+            start = end
+    return ips, statuses
+
+
+def scan_stream(f, window_size: int = WINDOW_SIZE) -> Tuple[Counter, Counter]:
+    """Те саме для потоку, який не можна відобразити в пам'ять (розпакований .gz/.bz2/.xz)"""
+    ips, statuses = Counter(), Counter()
+    with f:
+        # '\n' на початку - щоб перший рядок знайшов IP_PATTERN, як і всі інші
+        tail = b'\n'
+        for block in iter(lambda: f.read(window_size), b''):
+            block = tail + block
+            end = block.rfind(b'\n')
+            ips.update(IP_PATTERN.findall(block, 0, end))
+            statuses.update(STATUS_PATTERN.findall(block, 0, end))
+            tail = block[end:]
+        ips.update(IP_PATTERN.findall(tail))
+        statuses.update(STATUS_PATTERN.findall(tail))
+    return ips, statuses
+
+
+def scan_files(paths) -> Tuple[Counter, Counter]:
+    """
+    Лічильники IP та статусів для всіх файлів, ключі - bytes
+    :return: (ips, statuses)
+    """
+    ips, statuses = Counter(), Counter()
+    for path in paths:
+        file_ips, file_statuses = scan_file(path)
+        ips.update(file_ips)
+        statuses.update(file_statuses)
+    return ips, statuses
+
+
+def decode_counts(counter: Counter, n: int = None) -> List[Tuple[str, int]]:
+    """Декодувати в str тільки ті значення, що потрапляють у звіт"""
+    return [(key.decode('ascii', errors='replace'), count) for key, count in counter.most_common(n)]
+
+
+# ============================================================================
+# Порівняння з генератором з Benchmark_test_code.md
+# ============================================================================
+
+def generator_scan(paths) -> Tuple[Counter, Counter]:
+    """Генераторний підхід: кожен рядок декодується в str і розбивається split"""
+    ips, statuses = Counter(), Counter()
+    for line in file_generator(paths):
+        record = parse_log_line(line)
+        if record:
+            ips[record['ip']] += 1
+            statuses[record['status']] += 1
+    return ips, statuses
+
+
+def _measure(name: str, paths: List[str], queue):
+    """Виконується в окремому процесі, щоб виміри RSS не впливали один на одного"""
+    process = psutil.Process(os.getpid())
+    start_memory = process.memory_info().rss
+    peak_memory = start_memory
+
+    start = time.perf_counter()
+    ips, statuses = Counter(), Counter()
+    for path in paths:
+        # заміряємо RSS після кожного файлу - як memory_test_generator, але з піком
+        file_ips, file_statuses = APPROACHES[name]([path])
+        ips.update(file_ips)
+        statuses.update(file_statuses)
+        peak_memory = max(peak_memory, process.memory_info().rss)
+    elapsed = time.perf_counter() - start
+
+    if name == 'mmap':
+        ips = Counter(dict(decode_counts(ips)))
+        statuses = Counter(dict(decode_counts(statuses)))
+    top_ips = sorted(ips.items(), key=lambda item: (-item[1], item[0]))[:20]
+    queue.put((elapsed, (peak_memory - start_memory) / 1024 / 1024, top_ips, dict(sorted(statuses.items()))))
+
+
+APPROACHES = {
+    'generator': generator_scan,
+    'mmap': scan_files,
+}
+
+
+def benchmark(paths) -> Dict[str, tuple]:
+    results = {}
+    for name in APPROACHES:
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=_measure, args=(name, [str(p) for p in paths], queue))
+        process.start()
+        results[name] = queue.get()
+        process.join()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="mmap сканер IP та статусів")
+    parser.add_argument('log_dir', nargs='?', default=LOG_DIR, help="каталог з файлами логів")
+    parser.add_argument('--files', type=int, default=LOG_FILES_COUNT, help="кількість файлів")
+    args = parser.parse_args()
+
+    paths = log_files(args.log_dir, args.files)
+    ips, statuses = scan_files(paths)
+    print("Топ-10 IP:")
+    for ip, count in decode_counts(ips, 10):
+        print(f"  {ip:18} {count:>8,}")
+    print("Статуси:", dict(sorted(decode_counts(statuses))))
+
+    results = benchmark(paths)
+    print(f"\n{'Підхід':<12}{'Час, с':>10}{'RSS +MB':>10}")
+    for name, (elapsed, memory, _, _) in results.items():
+        print(f"{name:<12}{elapsed:>10.2f}{memory:>10.1f}")
+
+    generator, scanner = results['generator'], results['mmap']
+    print(f"\nmmap швидше у x{generator[0] / scanner[0]:.1f}")
+    print("✓ Результати збігаються" if generator[2:] == scanner[2:] else "❌ Результати відрізняються")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Конвеєр генераторів з вимірюванням кожної ланки.
+
+Урок будує ланцюжки file_generator() -> parse -> filter -> count вручну, і не видно,
+яка ланка найповільніша. Pipeline з'єднує ланки так само ліниво, але для кожної рахує:
+- скільки елементів увійшло і вийшло;
+- власний час ланки (без часу ланок перед нею) і пропускну здатність.
+Ланки бувають чотирьох видів:
+    map_stage(func)          - func(item) для кожного елемента
+    filter_stage(predicate)  - пропускає елементи, для яких predicate(item) істинний
+    generator_stage(func)    - func(iterator) -> iterator, як parse_records у spike_detector
+    batch_stage(func, ...)   - func(list) -> list для пачок елементів; з workers пачки
+                               обробляються в пулі процесів (для важких CPU ланок)
+Після запуску print_profile() друкує таблицю по ланках.
+
+Використання:
+    python pipeline.py ./log_investigation
+    python pipeline.py ./log_investigation --workers 4 --batch-size 5000
+"""
+
+import argparse
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from log_analysis import (AUTH_FAILURE_STATUSES, LOG_DIR, LOG_FILES_COUNT, file_generator, log_files,
+                          parse_log_line, parse_timestamp)
+
+BATCH_SIZE = 1000
+
+
+class StageMetrics:
+    """Лічильники однієї ланки; seconds - час усередині next() ланки разом з ланками перед нею"""
+
+    __slots__ = ('name', 'items_in', 'items_out', 'seconds', 'own_seconds')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items_in = 0
+        self.items_out = 0
+        self.seconds = 0.0
+        self.own_seconds = 0.0
+
+    def to_dict(self) -> dict:
+        return {'stage': self.name, 'items_in': self.items_in, 'items_out': self.items_out,
+                'seconds': self.own_seconds,
+                'items_per_second': self.items_in / self.own_seconds if self.own_seconds else 0.0}
+
+
+class Stage:
+    """Ланка конвеєра: apply(iterator) -> iterator"""
+
+    def __init__(self, name: str, apply: Callable[[Iterator], Iterator]):
+        self.name = name
+        self.apply = apply
+
+
+def map_stage(func: Callable, name: Optional[str] = None) -> Stage:
+    return Stage(name or func.__name__, lambda items: map(func, items))
+
+
+def filter_stage(predicate: Callable, name: Optional[str] = None) -> Stage:
+    return Stage(name or predicate.__name__, lambda items: filter(predicate, items))
+
+
+def generator_stage(func: Callable[[Iterator], Iterator], name: Optional[str] = None) -> Stage:
+    return Stage(name or func.__name__, func)
+
+
+def batched(items: Iterable, size: int) -> Iterator[list]:
+    """Елементи пачками по size (остання може бути меншою)"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _run_batches(func: Callable[[list], list], items: Iterator, batch_size: int) -> Iterator:
+    for batch in batched(items, batch_size):
+        yield from func(batch)
+
+
+def _run_batches_in_pool(func: Callable[[list], list], items: Iterator, batch_size: int,
+                         workers: int) -> Iterator:
+    """
+    Пачки обробляються в пулі процесів, результати повертаються в порядку пачок.
+    В роботі не більше workers * 2 пачок: executor.map забрав би весь вхідний генератор одразу.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for batch in batched(items, batch_size):
+            pending.append(executor.submit(func, batch))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def batch_stage(func: Callable[[list], list], batch_size: int = BATCH_SIZE, workers: Optional[int] = None,
+                name: Optional[str] = None) -> Stage:
+    """
+    :param func: list -> list; для workers має бути функцією рівня модуля (її передають у процес)
+    :param workers: кількість процесів; None - обробка в поточному процесі
+    """
+    if workers:
+        return Stage(name or func.__name__,
+                     lambda items: _run_batches_in_pool(func, items, batch_size, workers))
+    return Stage(name or func.__name__, lambda items: _run_batches(func, items, batch_size))
+
+
+def _measure(items: Iterator, metrics: StageMetrics) -> Iterator:
+    """Пропустити елементи ланки, рахуючи їх і час усередині next()"""
+    clock = time.perf_counter
+    while True:
+        start = clock()
+        try:
+            item = next(items)
+        except StopIteration:
+            metrics.seconds += clock() - start
+            return
+        metrics.seconds += clock() - start
+        metrics.items_out += 1
+        yield item
+
+
+class Pipeline:
+    """Джерело + ланки; елементи проходять ланцюжок ліниво, по одному"""
+
+    def __init__(self, source: Iterable, stages: List[Stage], source_name: str = 'source'):
+        self.source = source
+        self.stages = stages
+        self.metrics = [StageMetrics(source_name)] + [StageMetrics(stage.name) for stage in stages]
+
+    def __iter__(self) -> Iterator:
+        items = _measure(iter(self.source), self.metrics[0])
+        for stage, metrics in zip(self.stages, self.metrics[1:]):
+            items = _measure(iter(stage.apply(items)), metrics)
+        return items
+
+    def run(self) -> int:
+        """Пройти весь конвеєр, повернути кількість елементів на виході"""
+        count = 0
+        for _ in self:
+            count += 1
+        return count
+
+    def profile(self) -> List[dict]:
+        """
+        Статистика по ланках. Ланка викликає next() попередньої, тому її власний час -
+        це її загальний час мінус загальний час попередньої ланки.
+        """
+        previous = None
+        for metrics in self.metrics:
+            metrics.items_in = previous.items_out if previous else metrics.items_out
+            metrics.own_seconds = max(0.0, metrics.seconds - (previous.seconds if previous else 0.0))
+            previous = metrics
+        return [metrics.to_dict() for metrics in self.metrics]
+
+    def print_profile(self):
+        profile = self.profile()
+        total = sum(stage['seconds'] for stage in profile) or 1.0
+        print(f"\n{'Ланка':<22}{'Вхід':>10}{'Вихід':>10}{'Час, с':>9}{'Частка':>8}{'Елементів/с':>14}")
+        for stage in profile:
+            print(f"{stage['stage']:<22}{stage['items_in']:>10,}{stage['items_out']:>10,}"
+                  f"{stage['seconds']:>9.2f}{stage['seconds'] / total:>8.0%}{stage['items_per_second']:>14,.0f}")
+        slowest = max(profile, key=lambda stage: stage['seconds'])
+        print(f"Найповільніша ланка: {slowest['stage']}")
+
+
+# ============================================================================
+# Приклад: пошук брутфорсу (Завдання 2) як конвеєр
+# ============================================================================
+
+def parse_batch(lines: list) -> list:
+    """Розпарсити пачку рядків (рівень модуля - можна передати в процес)"""
+    return [record for record in map(parse_log_line, lines) if record]
+
+
+def add_epoch(records: Iterator[dict]) -> Iterator[dict]:
+    """
+    Секунда Unix у полі 'epoch'. Запис з неможливою міткою часу відкидається, а не зупиняє
+    конвеєр - у профілі ланки його видно як різницю між входом і виходом
+    """
+    for record in records:
+        try:
+            record['epoch'] = parse_timestamp(record['timestamp'])
+        except ValueError:
+            continue
+        yield record
+
+
+def is_auth_failure(record: dict) -> bool:
+    return record['status'] in AUTH_FAILURE_STATUSES
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Конвеєр генераторів з профілем по ланках")
+    parser.add_argument('log_dir', nargs='?', default=LOG_DIR, help="каталог з файлами логів")
+    parser.add_argument('--files', type=int, default=LOG_FILES_COUNT, help="кількість файлів")
+    parser.add_argument('--workers', type=int, default=None, help="процеси для парсингу (без - в одному процесі)")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help="рядків у пачці для парсингу")
+    args = parser.parse_args()
+
+    failures = Counter()
+
+    def count_ip(record: dict) -> dict:
+        failures[record['ip']] += 1
+        return record
+
+    pipeline = Pipeline(file_generator(log_files(args.log_dir, args.files)), [
+        batch_stage(parse_batch, args.batch_size, args.workers),
+        filter_stage(is_auth_failure),
+        generator_stage(add_epoch),
+        map_stage(count_ip),
+    ], source_name='file_generator')
+
+    start = time.perf_counter()
+    pipeline.run()
+    elapsed = time.perf_counter() - start
+
+    print("Топ-10 IP з відповідями 401/403:")
+    for ip, count in failures.most_common(10):
+        print(f"  {ip:18} {count:>8,}")
+    pipeline.print_profile()
+    print(f"⏱️ Весь конвеєр: {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
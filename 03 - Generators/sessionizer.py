@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Потокове розбиття запитів на сесії по IP (для звіту безпеки, Завдання 5).
+
+Сесія - послідовні запити одного IP, між якими проходить не більше gap секунд.
+Групувати всі запити по IP, а потім різати на сесії, - це тримати в пам'яті весь журнал.
+Тут записи йдуть у порядку часу (spike_detector.merge_by_time), і в пам'яті лише
+відкриті сесії:
+- словник IP -> Session;
+- купа (heapq) пар (час закінчення, IP) - по одному запису на відкриту сесію.
+Новий запит лише подовжує сесію, запис у купі не змінюється (ледаче видалення):
+коли застарілий запис опиняється на вершині купи, його замінюють на актуальний.
+Сесія, час закінчення якої минув, одразу віддається далі - з кількістю запитів,
+тривалістю і розподілом статусів. Пам'ять пропорційна кількості активних IP.
+
+Використання:
+    python sessionizer.py ./log_investigation
+    python sessionizer.py ./log_investigation --gap 30 --output sessions.csv
+"""
+
+import argparse
+import csv
+import heapq
+import time
+from collections import Counter
+from typing import Iterable, Iterator, List, Optional
+
+from log_analysis import AUTH_FAILURE_STATUSES, LOG_DIR, LOG_FILES_COUNT, log_files
+from spike_detector import RecordParser, merge_by_time
+
+GAP = 30 * 60  # секунд без запитів, після яких сесія закривається
+
+
+class Session:
+    """Сесія одного IP: межі в секундах Unix, кількість запитів і статусів"""
+
+    __slots__ = ('ip', 'start', 'end', 'requests', 'statuses')
+
+    def __init__(self, ip: str, second: int):
+        self.ip = ip
+        self.start = second
+        self.end = second
+        self.requests = 0
+        self.statuses = Counter()
+
+    def add(self, second: int, status: str):
+        if second > self.end:
+            self.end = second
+        elif second < self.start:
+            self.start = second  # запис трохи не по порядку
+        self.requests += 1
+        self.statuses[status] += 1
+
+    @property
+    def duration(self) -> int:
+        return self.end - self.start
+
+    @property
+    def auth_failures(self) -> int:
+        return sum(self.statuses[status] for status in AUTH_FAILURE_STATUSES)
+
+    def to_dict(self) -> dict:
+        return {'ip': self.ip, 'start': self.start, 'end': self.end, 'duration': self.duration,
+                'requests': self.requests, 'auth_failures': self.auth_failures,
+                'statuses': ' '.join(f'{status}:{count}' for status, count in sorted(self.statuses.items()))}
+
+
+class Sessionizer:
+    """Відкриті сесії: словник IP -> Session і купа (час закінчення, IP)"""
+
+    def __init__(self, gap: int = GAP):
+        self.gap = gap
+        self.sessions = {}
+        self._heap = []
+        self.closed = 0
+        self.max_open = 0  # найбільше відкритих сесій одночасно
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def expire(self, now: int) -> Iterator[Session]:
+        """Закрити сесії, в яких більше gap секунд не було запитів на момент now"""
+        heap, sessions, gap = self._heap, self.sessions, self.gap
+        while heap and heap[0][0] < now:
+            expires, ip = heap[0]
+            session = sessions[ip]
+            if session.end + gap != expires:
+                # сесію подовжено після того, як її поклали в купу - оновлюємо запис
+                heapq.heapreplace(heap, (session.end + gap, ip))
+                continue
+            heapq.heappop(heap)
+            del sessions[ip]
+            self.closed += 1
+            yield session
+
+    def add(self, ip: str, second: int, status: str) -> List[Session]:
+        """
+        Врахувати запит одразу (навіть якщо результат не потрібен);
+        повернути список сесій, що закрилися до нього
+        """
+        heap = self._heap
+        # expire лише тоді, коли на вершині купи справді минулий час - без генератора на кожен запит
+        closed = list(self.expire(second)) if heap and heap[0][0] < second else []
+        session = self.sessions.get(ip)
+        if session is None:
+            session = self.sessions[ip] = Session(ip, second)
+            heapq.heappush(heap, (second + self.gap, ip))
+            if len(self.sessions) > self.max_open:
+                self.max_open = len(self.sessions)
+        session.add(second, status)
+        return closed
+
+    def flush(self) -> Iterator[Session]:
+        """Закрити всі сесії (кінець журналу) у порядку закінчення"""
+        for _, ip in sorted((session.end + self.gap, ip) for ip, session in self.sessions.items()):
+            self.closed += 1
+            yield self.sessions.pop(ip)
+        self._heap = []
+
+
+def sessionize(records: Iterable[dict], gap: int = GAP,
+               sessionizer: Optional[Sessionizer] = None) -> Iterator[Session]:
+    """Ланка конвеєра генераторів: записи в порядку часу (з полем 'epoch') -> закриті сесії"""
+    if sessionizer is None:
+        sessionizer = Sessionizer(gap)
+    add = sessionizer.add
+    for record in records:
+        closed = add(record['ip'], record['epoch'], record['status'])
+        if closed:
+            yield from closed
+    yield from sessionizer.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сесії IP в access_log_{i}.log")
+    parser.add_argument('log_dir', nargs='?', default=LOG_DIR, help="каталог з файлами логів")
+    parser.add_argument('--files', type=int, default=LOG_FILES_COUNT, help="кількість файлів")
+    parser.add_argument('--gap', type=int, default=GAP // 60, help="хвилин без запитів, що завершують сесію")
+    parser.add_argument('--output', help="CSV, куди записати всі сесії")
+    args = parser.parse_args()
+
+    sessionizer = Sessionizer(args.gap * 60)
+    record_parser = RecordParser()
+    records = merge_by_time(log_files(args.log_dir, args.files), record_parser)
+    busiest = []  # купа (запитів, IP, сесія) - 10 найбільших сесій
+    requests = 0
+
+    start = time.perf_counter()
+    output = open(args.output, 'w', newline='') if args.output else None
+    try:
+        writer = csv.DictWriter(output, fieldnames=list(Session('', 0).to_dict())) if output else None
+        if writer:
+            writer.writeheader()
+        for session in sessionize(records, sessionizer=sessionizer):
+            requests += session.requests
+            item = (session.requests, session.ip, session.start)
+            if len(busiest) < 10:
+                heapq.heappush(busiest, (item, session))
+            elif item > busiest[0][0]:
+                heapq.heapreplace(busiest, (item, session))
+            if writer:
+                writer.writerow(session.to_dict())
+    finally:
+        if output:
+            output.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"Найбільші сесії (перерва {args.gap} хв):")
+    print(f"  {'IP':18}{'запитів':>9}{'тривалість':>12}{'401/403':>9}  статуси")
+    for _, session in sorted(busiest, key=lambda pair: pair[0], reverse=True):
+        top_statuses = ', '.join(f'{status}:{count}' for status, count in session.statuses.most_common(3))
+        print(f"  {session.ip:18}{session.requests:>9,}{session.duration // 60:>9} хв{session.auth_failures:>9,}"
+              f"  {top_statuses}")
+
+    print(f"\nСесій: {sessionizer.closed:,} | запитів: {requests:,} | "
+          f"найбільше відкритих одночасно: {sessionizer.max_open:,}")
+    if record_parser.malformed:
+        print(f"⚠️ Пропущено рядків з неправильною міткою часу: {record_parser.malformed:,}")
+    if args.output:
+        print(f"Сесії записано у {args.output}")
+    print(f"⏱️ {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
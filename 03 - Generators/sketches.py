@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Наближені топ-K та кількість унікальних значень з обмеженою пам'яттю (скетчі).
+
+Точний "Топ-20 IP" тримає Counter з усіма IP - на довгому записі DDoS він росте без меж.
+Скетчі займають фіксовану пам'ять, яка залежить лише від заданої похибки:
+- SpaceSaving - топ-K: не більше capacity лічильників, похибка кожного лічильника
+  не перевищує total / capacity (capacity = 1 / error);
+- HyperLogLog - кількість унікальних значень: 2^precision регістрів по байту,
+  відносна похибка приблизно 1.04 / sqrt(2^precision).
+Обидва скетчі можна об'єднувати (merge), тому кожен процес map-reduce рахує свої,
+а головний процес їх зливає - як Counter у log_analysis.parallel_analysis.
+Хеш - blake2b, а не hash(): він однаковий у всіх процесах і запусках.
+
+Використання:
+    python sketches.py ./log_investigation
+    python sketches.py ./log_investigation --top-error 0.001 --distinct-error 0.01
+"""
+
+import argparse
+import hashlib
+import heapq
+import math
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from log_analysis import (CHUNK_SIZE, LOG_DIR, LOG_FILES_COUNT, LOG_PATTERN, chunk_lines, chunk_ranges,
+                          log_files, parallel_analysis)
+
+TOP_ERROR = 0.001  # похибка лічильника топ-K як частка всіх подій
+DISTINCT_ERROR = 0.01  # відносна похибка кількості унікальних значень
+# межі precision HyperLogLog: від 16 байт (похибка ~26%) до 256 KB (похибка ~0.2%)
+MIN_PRECISION, MAX_PRECISION = 4, 18
+
+
+def stable_hash(item: str) -> int:
+    """64-бітний хеш, однаковий у всіх процесах (hash() для str залежить від PYTHONHASHSEED)"""
+    return int.from_bytes(hashlib.blake2b(item.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class SpaceSaving:
+    """
+    Наближений топ-K (алгоритм Space-Saving).
+    Нове значення при заповнених лічильниках забирає лічильник найменш частого значення
+    і успадковує його кількість як можливу похибку.
+    """
+
+    def __init__(self, capacity: Optional[int] = None, error: float = TOP_ERROR):
+        self.capacity = capacity or math.ceil(1 / error)
+        self.total = 0
+        self.counters = {}  # значення -> [кількість, похибка]
+        self._heap = []  # (кількість, значення) - по одному запису на значення, кількість може бути застарілою
+
+    def __len__(self):
+        return len(self.counters)
+
+    def add(self, item: str, count: int = 1):
+        self.total += count
+        counters = self.counters
+        counter = counters.get(item)
+        if counter is not None:
+            counter[0] += count
+            return
+        if len(counters) < self.capacity:
+            counters[item] = [count, 0]
+            heapq.heappush(self._heap, (count, item))
+            return
+
+        # знайти справжній мінімум: кількості в купі лише збільшуються, тож застарілий запис оновлюємо
+        heap = self._heap
+        while True:
+            low, victim = heap[0]
+            current = counters[victim][0]
+            if current == low:
+                break
+            heapq.heapreplace(heap, (current, victim))
+        del counters[victim]
+        counters[item] = [low + count, low]
+        heapq.heapreplace(heap, (low + count, item))
+
+    def update(self, items: Iterable[str]):
+        for item in items:
+            self.add(item)
+
+    def min_count(self) -> int:
+        """Найменший лічильник, якщо всі зайняті, - верхня межа для значень, яких немає в скетчі"""
+        if len(self.counters) < self.capacity:
+            return 0
+        return min(count for count, _ in self.counters.values())
+
+    def merge(self, other: 'SpaceSaving') -> 'SpaceSaving':
+        """
+        Об'єднати з іншим скетчем (mergeable summaries): значення, якого немає в одному зі скетчів,
+        могло мати там до min_count подій - це додається і до кількості, і до похибки
+        """
+        own_min, other_min = self.min_count(), other.min_count()
+        merged = {}
+        for item in self.counters.keys() | other.counters.keys():
+            count, error = self.counters.get(item, (own_min, own_min))
+            other_count, other_error = other.counters.get(item, (other_min, other_min))
+            merged[item] = [count + other_count, error + other_error]
+
+        capacity = max(self.capacity, other.capacity)
+        top = heapq.nlargest(capacity, merged.items(), key=lambda pair: pair[1][0])
+        self.capacity = capacity
+        self.total += other.total
+        self.counters = dict(top)
+        self._heap = [(count, item) for item, (count, _) in top]
+        heapq.heapify(self._heap)
+        return self
+
+    def top(self, n: int = 20) -> List[Tuple[str, int, int]]:
+        """Топ-N як (значення, кількість, похибка); справжня кількість - між count - error і count"""
+        top = heapq.nsmallest(n, self.counters.items(), key=lambda pair: (-pair[1][0], pair[0]))
+        return [(item, count, error) for item, (count, error) in top]
+
+
+def precision_for_error(error: float) -> int:
+    """Precision HyperLogLog для відносної похибки error: 1.04 / sqrt(2^precision) <= error"""
+    if error <= 0:
+        raise ValueError(f"похибка має бути більшою за 0, отримано {error}")
+    return math.ceil(math.log2((1.04 / error) ** 2))
+
+
+class HyperLogLog:
+    """Наближена кількість унікальних значень у фіксованих 2^precision байтах"""
+
+    def __init__(self, precision: Optional[int] = None, error: float = DISTINCT_ERROR):
+        """
+        :param precision: 2^precision регістрів, від MIN_PRECISION до MAX_PRECISION
+        :param error: бажана похибка, якщо precision не задано; недосяжна похибка
+            обмежується найближчою precision з попередженням
+        """
+        if precision is None:
+            precision = precision_for_error(error)
+            clamped = min(max(precision, MIN_PRECISION), MAX_PRECISION)
+            if clamped != precision:
+                warnings.warn(f"похибка {error} потребує precision {precision}; використано {clamped} "
+                              f"(похибка ~{1.04 / math.sqrt(1 << clamped):.2%})", stacklevel=2)
+                precision = clamped
+        if not MIN_PRECISION <= precision <= MAX_PRECISION:
+            raise ValueError(f"precision має бути від {MIN_PRECISION} до {MAX_PRECISION}, отримано {precision}")
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(self.size)
+        self._rest_bits = 64 - precision
+        self._rest_mask = (1 << self._rest_bits) - 1
+
+    def add(self, item: str):
+        value = stable_hash(item)
+        index = value >> self._rest_bits
+        # позиція першої одиниці в решті бітів хешу
+        rank = self._rest_bits - (value & self._rest_mask).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, items: Iterable[str]):
+        for item in items:
+            self.add(item)
+
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        if other.precision != self.precision:
+            raise ValueError("Об'єднувати можна лише HyperLogLog з однаковою precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def count(self) -> int:
+        size = self.size
+        alpha = 0.7213 / (1 + 1.079 / size) if size >= 128 else {16: 0.673, 32: 0.697, 64: 0.709}[size]
+        estimate = alpha * size * size / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            # мало значень - точніше рахувати порожні регістри (linear counting)
+            estimate = size * math.log(size / zeros)
+        return round(estimate)
+
+    def __len__(self):
+        return self.count()
+
+
+def track_ips(records: Iterable[dict], top: SpaceSaving, distinct: HyperLogLog) -> Iterator[dict]:
+    """Ланка конвеєра генераторів: пропускає записи далі і рахує IP у скетчах"""
+    for record in records:
+        top.add(record['ip'])
+        distinct.add(record['ip'])
+        yield record
+
+
+# ============================================================================
+# Паралельна обробка: кожен процес повертає свої скетчі, головний їх об'єднує
+# ============================================================================
+
+def sketch_chunk(task, top_error: float = TOP_ERROR,
+                 distinct_error: float = DISTINCT_ERROR) -> Tuple[SpaceSaving, HyperLogLog]:
+    """Скетчі IP для одного діапазону файлу (виконується в окремому процесі)"""
+    top, distinct = SpaceSaving(error=top_error), HyperLogLog(error=distinct_error)
+    match = LOG_PATTERN.match
+    for line in chunk_lines(*task):
+        found = match(line)
+        if found:
+            ip = found.group('ip')
+            top.add(ip)
+            distinct.add(ip)
+    return top, distinct
+
+
+def parallel_sketch_analysis(paths, workers: Optional[int] = None, chunk_size: int = CHUNK_SIZE,
+                             top_error: float = TOP_ERROR,
+                             distinct_error: float = DISTINCT_ERROR) -> Tuple[SpaceSaving, HyperLogLog]:
+    """Як parallel_analysis, але пам'ять кожного процесу і результату обмежена похибками"""
+    tasks = [task for path in paths for task in chunk_ranges(path, chunk_size)]
+    top, distinct = SpaceSaving(error=top_error), HyperLogLog(error=distinct_error)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_top, chunk_distinct in executor.map(
+                partial(sketch_chunk, top_error=top_error, distinct_error=distinct_error), tasks):
+            top.merge(chunk_top)
+            distinct.merge(chunk_distinct)
+    return top, distinct
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Наближені топ IP і кількість унікальних IP")
+    parser.add_argument('log_dir', nargs='?', default=LOG_DIR, help="каталог з файлами логів")
+    parser.add_argument('--files', type=int, default=LOG_FILES_COUNT, help="кількість файлів")
+    parser.add_argument('--workers', type=int, default=None, help="кількість процесів")
+    parser.add_argument('--top-error', type=float, default=TOP_ERROR, help="похибка топ-K (частка подій)")
+    parser.add_argument('--distinct-error', type=float, default=DISTINCT_ERROR,
+                        help="відносна похибка кількості унікальних IP")
+    args = parser.parse_args()
+    if args.top_error <= 0:
+        parser.error("--top-error має бути більшою за 0")
+    if args.distinct_error <= 0 or not MIN_PRECISION <= precision_for_error(args.distinct_error) <= MAX_PRECISION:
+        parser.error(f"--distinct-error має бути від {1.04 / math.sqrt(1 << MAX_PRECISION):g} "
+                     f"до {1.04 / math.sqrt(1 << MIN_PRECISION):g}")
+
+    paths = log_files(args.log_dir, args.files)
+
+    start = time.perf_counter()
+    exact = parallel_analysis(paths, args.workers)
+    exact_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    top, distinct = parallel_sketch_analysis(paths, args.workers, top_error=args.top_error,
+                                             distinct_error=args.distinct_error)
+    sketch_time = time.perf_counter() - start
+
+    exact_top = dict(exact.top_ips(20))
+    print(f"Топ-20 IP (Space-Saving, {top.capacity:,} лічильників):")
+    print(f"  {'IP':18}{'оцінка':>9}{'±':>7}{'точно':>9}")
+    for ip, count, error in top.top(20):
+        print(f"  {ip:18}{count:>9,}{error:>7,}{exact.ips[ip]:>9,}")
+    found = sum(ip in exact_top for ip, _, _ in top.top(20))
+    print(f"Збіг з точним топ-20: {found}/20 | межа похибки: {top.total * args.top_error:,.0f}")
+
+    actual = len(exact.ips)
+    estimate = distinct.count()
+    print(f"\nУнікальних IP: {estimate:,} (HyperLogLog, {distinct.size:,} байт) | точно {actual:,} | "
+          f"похибка {abs(estimate - actual) / actual:.2%}")
+    print(f"\nЛічильників: точний Counter {actual:,} | Space-Saving {len(top):,}")
+    print(f"⏱️ Точний аналіз: {exact_time:.2f}s | скетчі: {sketch_time:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Потоковий детектор сплесків трафіку (Завдання 4, DDoS).
+
+Детектор - ще одна ланка генераторного конвеєра:
+
+    file_generator(path) -> parse_records(...) -> merge_by_time(...) -> detect_spikes(...) -> сповіщення
+
+Кількість запитів за останні N секунд зберігається у кільцевому буфері фіксованого
+розміру: одна комірка на секунду, сума вікна оновлюється інкрементально, тому кожен
+запис обробляється за O(1). Для IP адрес тримаються такі самі маленькі буфери, але
+не більше max_ips штук - найдавніше активні IP витісняються (LRU), тож пам'ять
+обмежена незалежно від кількості унікальних адрес.
+Сповіщення видається одразу, щойно поріг перевищено, а не після сканування всіх файлів.
+
+Використання:
+    python spike_detector.py ./log_investigation
+    python spike_detector.py ./log_investigation --window 10 --threshold 500 --ip-threshold 50
+"""
+
+import argparse
+import heapq
+import time
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+
+from log_analysis import LOG_DIR, LOG_FILES_COUNT, file_generator, log_files, parse_log_line, parse_timestamp
+
+WINDOW = 10  # секунд
+THRESHOLD = 500  # запитів за вікно від усіх клієнтів
+IP_WINDOW = 10
+IP_THRESHOLD = 50  # запитів за вікно від одного IP
+MAX_IPS = 10_000  # скільки IP відстежується одночасно
+
+
+class SlidingWindowCounter:
+    """Кількість подій за останні window секунд у кільцевому буфері"""
+
+    __slots__ = ('window', 'counts', 'latest', 'total', 'alerting')
+
+    def __init__(self, window: int):
+        self.window = window
+        self.counts = [0] * window  # комірка second % window
+        self.latest = None  # найпізніша секунда, що потрапила у вікно
+        self.total = 0  # сума всіх комірок
+        self.alerting = False  # поріг уже перевищено, чекаємо спаду
+
+    def add(self, second: int) -> Optional[int]:
+        """
+        Врахувати подію
+        :return: кількість подій у вікні, None - подія старіша за вікно і не врахована
+        """
+        counts, window = self.counts, self.window
+        if self.latest is None or second - self.latest >= window:
+            # перша подія або пауза довша за вікно - всі комірки застаріли
+            if self.total:
+                counts[:] = [0] * window
+                self.total = 0
+            self.latest = second
+        elif second > self.latest:
+            # звільняємо комірки секунд, що вийшли з вікна; за все життя лічильника
+            # кожна секунда звільняється один раз, тому в середньому це O(1)
+            for expired in range(self.latest + 1, second + 1):
+                index = expired % window
+                self.total -= counts[index]
+                counts[index] = 0
+            self.latest = second
+        elif second <= self.latest - window:
+            return None
+
+        counts[second % window] += 1
+        self.total += 1
+        return self.total
+
+
+class Spike(NamedTuple):
+    """Сповіщення про сплеск: source - 'traffic' (весь трафік) або IP адреса"""
+    source: str
+    second: int
+    count: int
+    window: int
+
+
+class RecordParser:
+    """parse_log_line + секунда Unix; рядок з неможливою міткою часу пропускається і рахується"""
+
+    def __init__(self):
+        self.malformed = 0
+
+    def parse(self, lines: Iterable[str]) -> Iterator[dict]:
+        for line in lines:
+            record = parse_log_line(line)
+            if record is None:
+                continue
+            try:
+                record['epoch'] = parse_timestamp(record['timestamp'])
+            except ValueError:
+                # рядок схожий на запис, але час - сміття ('31/Feb', зсув токенів): потік не зупиняємо
+                self.malformed += 1
+                continue
+            yield record
+
+
+def parse_records(lines: Iterable[str], parser: Optional[RecordParser] = None) -> Iterator[dict]:
+    """
+    Розпарсені записи з секундою Unix у полі 'epoch'
+    :param parser: RecordParser, у якому рахуються пропущені рядки
+    """
+    if parser is None:
+        parser = RecordParser()
+    return parser.parse(lines)
+
+
+def merge_by_time(paths, parser: Optional[RecordParser] = None) -> Iterator[dict]:
+    """
+    Записи кількох файлів в порядку часу. Файли можуть охоплювати той самий проміжок
+    (журнали різних серверів), тому читати їх по черзі не можна - час би йшов назад.
+    heapq.merge тримає в пам'яті лише по одному поточному запису з кожного файлу.
+    :param parser: спільний для всіх файлів RecordParser (лічильник пропущених рядків)
+    """
+    if parser is None:
+        parser = RecordParser()
+    streams = [parser.parse(file_generator([path])) for path in paths]
+    return heapq.merge(*streams, key=lambda record: record['epoch'])
+
+
+class SpikeDetector:
+    """Стан детектора: лічильник усього трафіку та LRU лічильників окремих IP"""
+
+    def __init__(self, window: int = WINDOW, threshold: int = THRESHOLD, ip_window: int = IP_WINDOW,
+                 ip_threshold: int = IP_THRESHOLD, max_ips: int = MAX_IPS):
+        self.threshold = threshold
+        self.ip_window = ip_window
+        self.ip_threshold = ip_threshold
+        self.max_ips = max_ips
+        self.traffic = SlidingWindowCounter(window)
+        self.ips = OrderedDict()  # IP -> SlidingWindowCounter, останні активні в кінці
+        self.late = 0  # записи, старіші за вікно
+        self.evicted = 0  # IP, витіснені з LRU
+
+    def _check(self, counter: SlidingWindowCounter, count: Optional[int], threshold: int) -> bool:
+        """True, коли поріг щойно перевищено; наступне сповіщення - після спаду нижче порогу"""
+        if count is None:
+            return False  # запізнілий запис не врахований
+        if count < threshold:
+            counter.alerting = False
+            return False
+        if counter.alerting:
+            return False
+        counter.alerting = True
+        return True
+
+    def add(self, ip: str, second: int) -> List[Spike]:
+        """
+        Врахувати один запит одразу (навіть якщо результат не потрібен);
+        повернути сповіщення, якщо він перевищив поріг - зазвичай порожній список
+        """
+        spikes = []
+        traffic = self.traffic
+        count = traffic.add(second)
+        if count is None:
+            self.late += 1
+        if self._check(traffic, count, self.threshold):
+            spikes.append(Spike('traffic', second, traffic.total, traffic.window))
+
+        counter = self.ips.get(ip)
+        if counter is None:
+            if len(self.ips) >= self.max_ips:
+                self.ips.popitem(last=False)
+                self.evicted += 1
+            counter = self.ips[ip] = SlidingWindowCounter(self.ip_window)
+        else:
+            self.ips.move_to_end(ip)
+        if self._check(counter, counter.add(second), self.ip_threshold):
+            spikes.append(Spike(ip, second, counter.total, counter.window))
+        return spikes
+
+
+def detect_spikes(records: Iterable[dict], detector: Optional[SpikeDetector] = None) -> Iterator[Spike]:
+    """Ланка конвеєра: записи з parse_records --> сповіщення про сплески"""
+    detector = detector or SpikeDetector()
+    add = detector.add
+    for record in records:
+        spikes = add(record['ip'], record['epoch'])
+        if spikes:
+            yield from spikes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Потоковий пошук сплесків трафіку в access_log_{i}.log")
+    parser.add_argument('log_dir', nargs='?', default=LOG_DIR, help="каталог з файлами логів")
+    parser.add_argument('--files', type=int, default=LOG_FILES_COUNT, help="кількість файлів")
+    parser.add_argument('--window', type=int, default=WINDOW, help="вікно всього трафіку, секунд")
+    parser.add_argument('--threshold', type=int, default=THRESHOLD, help="запитів за вікно від усіх клієнтів")
+    parser.add_argument('--ip-window', type=int, default=IP_WINDOW, help="вікно для одного IP, секунд")
+    parser.add_argument('--ip-threshold', type=int, default=IP_THRESHOLD, help="запитів за вікно від одного IP")
+    parser.add_argument('--max-ips', type=int, default=MAX_IPS, help="скільки IP відстежувати одночасно")
+    args = parser.parse_args()
+
+    detector = SpikeDetector(args.window, args.threshold, args.ip_window, args.ip_threshold, args.max_ips)
+    record_parser = RecordParser()
+    records = merge_by_time(log_files(args.log_dir, args.files), record_parser)
+
+    start = time.perf_counter()
+    first_alert = None
+    alerts = 0
+    for spike in detect_spikes(records, detector):
+        if first_alert is None:
+            first_alert = time.perf_counter() - start
+        alerts += 1
+        moment = time.strftime('%d/%b/%Y %H:%M:%S', time.gmtime(spike.second))
+        print(f"🚨 {moment} {spike.source:18} {spike.count:>6,} запитів за {spike.window}s")
+    elapsed = time.perf_counter() - start
+
+    print(f"\nСповіщень: {alerts:,} | пропущено запізнілих записів: {detector.late:,} | "
+          f"витіснено IP: {detector.evicted:,} | рядків з неправильною міткою часу: {record_parser.malformed:,}")
+    if first_alert is not None:
+        print(f"⏱️ Перше сповіщення через {first_alert:.3f}s")
+    print(f"⏱️ Весь потік: {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Tests for the incremental log analysis: python test_log_checkpoint.py or pytest
+"""
+import gzip
+import os
+import tempfile
+
+from log_analysis import sequential_analysis
+from log_checkpoint import LogCheckpoint
+
+LINE = '10.0.0.{ip} - - [27/Aug/2025:14:{minute:02d}:15 +0000] "GET /page HTTP/1.1" {status} 512 "-" "curl/8.0"\n'
+
+
+def write_lines(path, start: int, count: int, mode: str = 'at'):
+    with gzip.open(path, mode) as f:
+        for i in range(start, start + count):
+            f.write(LINE.format(ip=i % 5, minute=i % 60, status=401 if i % 3 == 0 else 200))
+
+
+def test_growing_compressed_file_is_not_counted_twice():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'access_log_0.log.gz')
+        state = os.path.join(directory, 'checkpoint.json')
+
+        write_lines(path, 0, 100, mode='wt')
+        checkpoint = LogCheckpoint(state)
+        checkpoint.update([path])
+        assert checkpoint.stats.total == 100
+
+        # gzip дописується новим членом архіву - файл росте, і обробляється заново цілком
+        write_lines(path, 100, 50)
+        checkpoint = LogCheckpoint(state)
+        checkpoint.update([path])
+        expected = sequential_analysis([path])
+        assert checkpoint.stats.total == expected.total == 150
+        for name in expected.COUNTERS:
+            assert getattr(checkpoint.stats, name) == getattr(expected, name)
+
+        # без змін - нічого не обробляється і не додається
+        assert LogCheckpoint(state).update([path]) == 0
+    print("✓ Growing compressed file passed")
+
+
+def test_appended_plain_file_reads_only_new_lines():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'access_log_0.log')
+        state = os.path.join(directory, 'checkpoint.json')
+        with open(path, 'w') as f:
+            f.writelines(LINE.format(ip=i % 5, minute=i % 60, status=200) for i in range(100))
+        LogCheckpoint(state).update([path])
+
+        with open(path, 'a') as f:
+            f.writelines(LINE.format(ip=i % 5, minute=i % 60, status=404) for i in range(100, 130))
+        checkpoint = LogCheckpoint(state)
+        processed = checkpoint.update([path])
+        assert processed == 30 * len(LINE.format(ip=0, minute=0, status=404))
+        assert checkpoint.stats.total == 130
+        assert checkpoint.stats.statuses == {'200': 100, '404': 30}
+    print("✓ Appended plain file passed")
+
+
+if __name__ == '__main__':
+    test_growing_compressed_file_is_not_counted_twice()
+    test_appended_plain_file_reads_only_new_lines()
+    print("Всі тести пройдено успішно!")
@@ -0,0 +1,53 @@
+"""
+Tests for the streaming sessionizer: python test_sessionizer.py or pytest
+"""
+from sessionizer import Sessionizer, sessionize
+from spike_detector import RecordParser, parse_records
+
+LINE = '10.0.0.{ip} - - [27/Aug/2025:{hour:02d}:{minute:02d}:00 +0000] "POST /login HTTP/1.1" {status} 0 "-" "curl/8.0"\n'
+
+
+def test_malformed_line_does_not_stop_sessions():
+    lines = [
+        LINE.format(ip=1, hour=10, minute=0, status=401),
+        '10.0.0.1 - - [31/Feb/2025:10:01:00 +0000] "POST /login HTTP/1.1" 401 0 "-" "curl/8.0"\n',
+        'many many many many many many many many many many\n',
+        LINE.format(ip=1, hour=10, minute=5, status=200),
+        LINE.format(ip=1, hour=12, minute=0, status=200),
+    ]
+    parser = RecordParser()
+    sessions = list(sessionize(parse_records(lines, parser), gap=30 * 60))
+    assert parser.malformed == 2
+    assert [(session.ip, session.requests, session.duration) for session in sessions] == [
+        ('10.0.0.1', 2, 5 * 60), ('10.0.0.1', 1, 0)]
+    assert sessions[0].auth_failures == 1
+    print("✓ Malformed line through sessionizer passed")
+
+
+def test_sessions_of_different_ips_close_in_time_order():
+    sessionizer = Sessionizer(gap=60)
+    records = [{'ip': ip, 'epoch': second, 'status': '200'}
+               for second, ip in [(0, 'a'), (10, 'b'), (50, 'a'), (200, 'c')]]
+    sessions = list(sessionize(records, sessionizer=sessionizer))
+    assert [(session.ip, session.start, session.end) for session in sessions] == [
+        ('b', 10, 10), ('a', 0, 50), ('c', 200, 200)]
+    assert sessionizer.closed == 3 and len(sessionizer) == 0
+    print("✓ Session order passed")
+
+
+def test_add_counts_without_iterating():
+    sessionizer = Sessionizer(gap=60)
+    sessionizer.add('a', 0, '401')
+    sessionizer.add('a', 30, '200')
+    assert len(sessionizer) == 1 and sessionizer.sessions['a'].requests == 2
+    closed = sessionizer.add('b', 200, '200')
+    assert [(session.ip, session.requests) for session in closed] == [('a', 2)]
+    assert sessionizer.add('b', 210, '200') == []
+    print("✓ Eager add passed")
+
+
+if __name__ == '__main__':
+    test_malformed_line_does_not_stop_sessions()
+    test_sessions_of_different_ips_close_in_time_order()
+    test_add_counts_without_iterating()
+    print("Всі тести пройдено успішно!")
@@ -0,0 +1,56 @@
+"""
+Tests for the streaming spike detector: python test_spike_detector.py or pytest
+"""
+import os
+import tempfile
+
+from spike_detector import RecordParser, Spike, SpikeDetector, merge_by_time, parse_records
+
+LINE = '10.0.0.{ip} - - [27/Aug/2025:14:{minute:02d}:{second:02d} +0000] "GET /page HTTP/1.1" 200 512 "-" "curl/8.0"\n'
+MALFORMED = [
+    '10.0.0.1 - - [31/Feb/2025:14:00:00 +0000] "GET /page HTTP/1.1" 200 512 "-" "curl/8.0"\n',
+    'many many many many many many many many many many\n',
+]
+
+
+def test_malformed_timestamp_is_skipped_and_counted():
+    lines = [LINE.format(ip=1, minute=0, second=1), *MALFORMED, LINE.format(ip=2, minute=0, second=2)]
+    parser = RecordParser()
+    records = list(parse_records(lines, parser))
+    assert [record['ip'] for record in records] == ['10.0.0.1', '10.0.0.2']
+    assert parser.malformed == len(MALFORMED)
+    print("✓ Malformed timestamp passed")
+
+
+def test_merge_by_time_survives_malformed_lines():
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [os.path.join(directory, f'access_log_{i}.log') for i in range(2)]
+        for i, path in enumerate(paths):
+            with open(path, 'w') as f:
+                f.writelines(LINE.format(ip=i, minute=0, second=second) for second in range(i, 10, 2))
+                f.writelines(MALFORMED)
+        parser = RecordParser()
+        epochs = [record['epoch'] for record in merge_by_time(paths, parser)]
+        assert len(epochs) == 10 and epochs == sorted(epochs)
+        assert parser.malformed == 2 * len(MALFORMED)
+    print("✓ Merge by time with malformed lines passed")
+
+
+def test_add_counts_without_iterating():
+    detector = SpikeDetector(window=10, threshold=5, ip_window=10, ip_threshold=3)
+    results = [detector.add('10.0.0.1', 100) for _ in range(5)]
+    assert detector.traffic.total == 5 and detector.ips['10.0.0.1'].total == 5
+    assert results[:2] == [[], []]
+    assert results[2] == [Spike('10.0.0.1', 100, 3, 10)]
+    assert results[4] == [Spike('traffic', 100, 5, 10)]
+    # запізнілий запис теж рахується одразу
+    detector.add('10.0.0.2', 80)
+    assert detector.late == 1
+    print("✓ Eager add passed")
+
+
+if __name__ == '__main__':
+    test_malformed_timestamp_is_skipped_and_counted()
+    test_merge_by_time_survives_malformed_lines()
+    test_add_counts_without_iterating()
+    print("Всі тести пройдено успішно!")
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Пошук сигнатур загроз у шляхах та User-Agent за один прохід (Завдання 2).
+
+is_suspicious_request з Benchmark_test_code.md перевіряє кожен рядок через `pattern in url`
+для кожної сигнатури, тобто час росте лінійно з кількістю сигнатур.
+Тут сигнатури з файлу (threat_signatures.csv: id, field, pattern, category) компілюються
+в автомат Ахо-Корасік: для кожного стану заздалегідь обчислено перехід для кожного символу
+(повний ДСА), тому рядок проходиться один раз - по одному словнику на символ -
+і знаходить усі сигнатури одразу, скільки б їх не було.
+
+Використання:
+    python threat_matcher.py ./log_investigation
+    python threat_matcher.py ./log_investigation --signatures my_rules.csv --synthetic 2000
+"""
+
+import argparse
+import csv
+import random
+import string
+import time
+from collections import Counter, deque
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple
+
+from log_analysis import LOG_DIR, LOG_FILES_COUNT, file_generator, log_files, parse_log_line
+
+SIGNATURES_FILE = Path(__file__).with_name('threat_signatures.csv')
+
+# де шукати сигнатуру
+FIELDS = ('path', 'user_agent')
+ANY_FIELD = 'any'
+
+# скільки запитів перевіряти в порівнянні з перебором `in`
+COMPARE_SAMPLE = 20_000
+
+
+class Signature(NamedTuple):
+    id: str
+    field: str  # 'path', 'user_agent' або 'any'
+    pattern: str  # у нижньому регістрі
+    category: str
+
+
+def load_signatures(path=SIGNATURES_FILE) -> List[Signature]:
+    """Прочитати сигнатури з CSV; порівняння без урахування регістру"""
+    signatures = []
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            field = row['field'].strip()
+            if field not in FIELDS and field != ANY_FIELD:
+                raise ValueError(f"Сигнатура {row['id']}: невідоме поле {field!r}")
+            signatures.append(Signature(row['id'].strip(), field, row['pattern'].lower(), row['category'].strip()))
+    return signatures
+
+
+class AhoCorasick:
+    """Автомат для пошуку багатьох підрядків за один прохід по тексту"""
+
+    def __init__(self, patterns: Iterable[Tuple[str, str]]):
+        """
+        :param patterns: пари (підрядок, значення), значення повертається при збігу
+        """
+        # 1. Бор (trie): goto[state] - переходи за символами, outputs[state] - значення шаблонів
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Set[str]] = [set()]
+        for pattern, value in patterns:
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                if char not in goto[state]:
+                    goto.append({})
+                    outputs.append(set())
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            outputs[state].add(value)
+
+        # 2. Обхід у ширину: посилання невдачі (fail) і повна таблиця переходів.
+        # Перехід за символом, якого немає в борі, - це перехід зі стану fail;
+        # fail-стан ближчий до кореня і вже оброблений, тому його таблиця готова.
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] |= outputs[fail[state]]
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for char, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(char, 0) if state else 0
+                queue.append(child)
+
+        self.delta = delta
+        # кортеж значень для стану або None - так у циклі пошуку менше роботи
+        self.outputs = [tuple(sorted(values)) or None for values in outputs]
+
+    def __len__(self):
+        return len(self.delta)
+
+    def search(self, text: str) -> Set[str]:
+        """Значення всіх шаблонів, що входять у text"""
+        delta, outputs = self.delta, self.outputs
+        found = set()
+        state = 0
+        for char in text:
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
+
+
+class ThreatMatcher:
+    """Окремий автомат для шляхів і для User-Agent; сигнатури 'any' потрапляють в обидва"""
+
+    def __init__(self, signatures: List[Signature]):
+        self.signatures = {signature.id: signature for signature in signatures}
+        self.automata = {
+            field: AhoCorasick((signature.pattern, signature.id) for signature in signatures
+                               if signature.field in (field, ANY_FIELD))
+            for field in FIELDS
+        }
+
+    def match(self, path: str, user_agent: str) -> Set[str]:
+        """id сигнатур, знайдених у шляху або User-Agent"""
+        return self.automata['path'].search(path.lower()) | self.automata['user_agent'].search(user_agent.lower())
+
+    def match_record(self, record: dict) -> Set[str]:
+        """Те саме для запису з parse_log_line"""
+        return self.match(record['path'], record['user_agent'])
+
+
+def naive_match(signatures: List[Signature], path: str, user_agent: str) -> Set[str]:
+    """Перевірка `in` для кожної сигнатури, як is_suspicious_request - для порівняння"""
+    path, user_agent = path.lower(), user_agent.lower()
+    found = set()
+    for signature in signatures:
+        if ((signature.field != 'user_agent' and signature.pattern in path) or
+                (signature.field != 'path' and signature.pattern in user_agent)):
+            found.add(signature.id)
+    return found
+
+
+def synthetic_signatures(count: int, seed: int = 0) -> List[Signature]:
+    """Випадкові сигнатури, щоб перевірити масштабування на великих наборах правил"""
+    rnd = random.Random(seed)
+    alphabet = string.ascii_lowercase + string.digits + '/._-'
+    return [Signature(f'S{i:05d}', rnd.choice(FIELDS),
+                      ''.join(rnd.choice(alphabet) for _ in range(rnd.randint(5, 12))), 'synthetic')
+            for i in range(count)]
+
+
+def scan(records: List[dict], match) -> Tuple[Counter, float]:
+    """Знайти сигнатури у всіх записах: (кількість збігів по id, секунд)"""
+    hits = Counter()
+    start = time.perf_counter()
+    for record in records:
+        hits.update(match(record['path'], record['user_agent']))
+    return hits, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Пошук сигнатур загроз в access_log_{i}.log")
+    parser.add_argument('log_dir', nargs='?', default=LOG_DIR, help="каталог з файлами логів")
+    parser.add_argument('--files', type=int, default=LOG_FILES_COUNT, help="кількість файлів")
+    parser.add_argument('--signatures', default=SIGNATURES_FILE, help="CSV з сигнатурами")
+    parser.add_argument('--synthetic', type=int, default=2000,
+                        help="скільки випадкових сигнатур додати для перевірки масштабування")
+    args = parser.parse_args()
+
+    signatures = load_signatures(args.signatures)
+    records = [record for record in map(parse_log_line, file_generator(log_files(args.log_dir, args.files)))
+               if record]
+
+    start = time.perf_counter()
+    matcher = ThreatMatcher(signatures)
+    print(f"⏱️ Компіляція {len(signatures)} сигнатур: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    hits, matcher_time = scan(records, matcher.match)
+    print(f"\nЗнайдено сигнатур у {len(records):,} запитах:")
+    for signature_id, count in hits.most_common(15):
+        signature = matcher.signatures[signature_id]
+        print(f"  {signature_id} {signature.category:<12} {signature.pattern:<22} {count:>8,}")
+
+    print(f"⏱️ {len(records) / matcher_time:,.0f} запитів/с")
+
+    # перебір `in` з тисячами сигнатур дуже повільний - порівнюємо на вибірці
+    sample = records[:COMPARE_SAMPLE]
+    print(f"\nПорівняння на {len(sample):,} запитах:")
+    print(f"{'Сигнатур':>10}{'in, с':>10}{'Ахо-Корасік, с':>16}")
+    for rules in (signatures, signatures + synthetic_signatures(args.synthetic)):
+        expected, naive_time = scan(sample, lambda path, agent: naive_match(rules, path, agent))
+        found, automaton_time = scan(sample, ThreatMatcher(rules).match)
+        print(f"{len(rules):>10,}{naive_time:>10.2f}{automaton_time:>16.2f} | x{naive_time / automaton_time:.1f}  "
+              f"{'✓' if expected == found else '❌ результати відрізняються'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Класифікація User-Agent (Завдання 2): bot, scanner, browser або unknown.
+
+Правила - підрядки з файлу ua_rules.csv (category, pattern), порівняння без урахування регістру.
+Категорії перевіряються в порядку CATEGORIES: 'Mozilla/5.0 (compatible; Nmap ...)' - сканер,
+а не браузер, 'Mozilla/5.0 (compatible; Googlebot/2.1)' - бот.
+
+Різних User-Agent у журналі небагато, а рядків - мільйони, тому результат класифікації
+кешується (functools.lru_cache) за повним рядком User-Agent. Кеш обмежений cache_size записами:
+ботнет з випадковими User-Agent не з'їсть пам'ять, а витіснятимуться найдавніше використані.
+На звичайних журналах кеш влучає більше ніж у 99% випадків, і класифікація стає пошуком у словнику.
+
+Використання:
+    python ua_classifier.py ./log_investigation
+    python ua_classifier.py ./log_investigation --rules my_rules.csv --cache-size 1024
+"""
+
+import argparse
+import csv
+import time
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from log_analysis import LOG_DIR, LOG_FILES_COUNT, file_generator, log_files, parse_log_line
+
+RULES_FILE = Path(__file__).with_name('ua_rules.csv')
+
+# порядок перевірки: перша категорія, чий підрядок знайдено, перемагає
+CATEGORIES = ('scanner', 'bot', 'browser')
+UNKNOWN = 'unknown'
+
+CACHE_SIZE = 4096
+
+
+def load_rules(path=RULES_FILE) -> Dict[str, Tuple[str, ...]]:
+    """Прочитати правила з CSV: категорія -> підрядки у нижньому регістрі"""
+    rules = {category: [] for category in CATEGORIES}
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            category = row['category'].strip()
+            if category not in rules:
+                raise ValueError(f"Невідома категорія {category!r} для {row['pattern']!r}")
+            rules[category].append(row['pattern'].lower())
+    return {category: tuple(patterns) for category, patterns in rules.items()}
+
+
+class UAClassifier:
+    """Класифікатор User-Agent з обмеженим LRU кешем"""
+
+    def __init__(self, rules: Dict[str, Tuple[str, ...]] = None, cache_size: int = CACHE_SIZE):
+        self.rules = load_rules() if rules is None else rules
+        self.cache_size = cache_size
+        # кеш на екземпляр: у кожного класифікатора свої правила і своя статистика
+        self.classify = lru_cache(maxsize=cache_size)(self.classify_uncached)
+
+    def classify_uncached(self, user_agent: str) -> str:
+        """Перевірка підрядків усіх правил - те, що робиться на кожному рядку без кешу"""
+        agent = user_agent.lower()
+        for category, patterns in self.rules.items():
+            for pattern in patterns:
+                if pattern in agent:
+                    return category
+        return UNKNOWN
+
+    def classify_record(self, record: dict) -> str:
+        """Те саме для запису з parse_log_line"""
+        return self.classify(record['user_agent'])
+
+    def stats(self) -> dict:
+        info = self.classify.cache_info()
+        lookups = info.hits + info.misses
+        return {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'max_size': info.maxsize,
+                'hit_rate': info.hits / lookups if lookups else 0.0}
+
+    def clear(self):
+        """Очистити кеш і статистику (наприклад, після зміни правил)"""
+        self.classify.cache_clear()
+
+
+def classify_agents(records: Iterable[dict], classifier: UAClassifier) -> Iterator[dict]:
+    """Ланка конвеєра генераторів: додає до запису поле 'agent_class'"""
+    classify = classifier.classify
+    for record in records:
+        record['agent_class'] = classify(record['user_agent'])
+        yield record
+
+
+def classify_all(agents: List[str], classify) -> Tuple[Counter, float]:
+    """Класифікувати всі User-Agent: (кількість по категоріях, секунд)"""
+    start = time.perf_counter()
+    counts = Counter(map(classify, agents))
+    return counts, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Класифікація User-Agent в access_log_{i}.log")
+    parser.add_argument('log_dir', nargs='?', default=LOG_DIR, help="каталог з файлами логів")
+    parser.add_argument('--files', type=int, default=LOG_FILES_COUNT, help="кількість файлів")
+    parser.add_argument('--rules', default=RULES_FILE, help="CSV з правилами (category, pattern)")
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE, help="розмір LRU кешу")
+    args = parser.parse_args()
+
+    classifier = UAClassifier(load_rules(args.rules), args.cache_size)
+    agents = [record['user_agent'] for record in map(parse_log_line, file_generator(log_files(args.log_dir, args.files)))
+              if record]
+
+    expected, uncached_time = classify_all(agents, classifier.classify_uncached)
+    counts, cached_time = classify_all(agents, classifier.classify)
+
+    print(f"Категорії User-Agent у {len(agents):,} запитах:")
+    for category, count in counts.most_common():
+        print(f"  {category:<10} {count:>10,} ({count / len(agents):.1%})")
+
+    stats = classifier.stats()
+    print(f"\nКеш: {stats['hits']:,} влучань, {stats['misses']:,} промахів ({stats['hit_rate']:.2%}), "
+          f"{stats['size']:,}/{stats['max_size']:,} записів")
+    print(f"⏱️ Без кешу: {uncached_time:.2f}s | з кешем: {cached_time:.2f}s | x{uncached_time / cached_time:.1f}  "
+          f"{'✓' if counts == expected else '❌ результати відрізняються'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+"""
+Дискретно-подійний планувальник для сценаріїв з Car на віртуальному годиннику.
+
+Car.drive(duration=...) блокує потік через time.sleep, тому сценарій "десять машин
+їздять годину" триває реальну годину. Тут дії не виконуються одразу, а плануються
+як події з віртуальним часом у купі (heapq). run() дістає найранішу подію, переводить
+годинник на її час і викликає метод Car / Engine / Transmission / Wheel.
+Поїздка на N секунд - це car.drive(throttle, duration=0) зараз і car.stop() через N секунд.
+Події одного моменту виконуються в порядку планування (лічильник seq у ключі купи),
+тож результат детермінований. Години віртуального часу виконуються за мілісекунди.
+"""
+
+import contextlib
+import heapq
+import itertools
+import random
+import time
+from collections import Counter
+from typing import Callable, List, NamedTuple, Optional
+
+from car import Car
+
+
+class Event(NamedTuple):
+    time: float
+    seq: int  # порядок планування - для однакового часу
+    name: str
+    action: Callable
+    args: tuple
+
+
+class Scheduler:
+    """Черга подій з віртуальним годинником"""
+
+    def __init__(self, quiet: bool = True, trace: bool = False):
+        """
+        :param quiet: не друкувати повідомлення Car (print у кожному методі)
+        :param trace: зберігати (час, подія, результат) кожної виконаної події у self.history
+        """
+        self.now = 0.0
+        self.quiet = quiet
+        self.trace = trace
+        self.history = []
+        self.processed = 0
+        self.results = Counter()  # (подія, результат) -> кількість
+        self.listeners: List[Callable[['Scheduler', Event], None]] = []  # викликаються після кожної події
+        self._queue: List[Event] = []
+        self._seq = itertools.count()
+        self._drives = {}  # id(car) -> seq останньої поїздки, щоб ігнорувати застарілі зупинки
+
+    def __len__(self):
+        return len(self._queue)
+
+    def at(self, when: float, action: Callable, *args, name: Optional[str] = None) -> Event:
+        """Запланувати action(*args) на віртуальний час when"""
+        if when < self.now:
+            raise ValueError(f"Cannot schedule event in the past: {when} < {self.now}")
+        event = Event(when, next(self._seq), name or action.__name__, action, args)
+        heapq.heappush(self._queue, event)
+        return event
+
+    def after(self, delay: float, action: Callable, *args, name: Optional[str] = None) -> Event:
+        """Запланувати action(*args) через delay секунд від поточного часу"""
+        return self.at(self.now + delay, action, *args, name=name)
+
+    # ----------------------------------------------------------- Події Car
+
+    def start_engine(self, when: float, car: Car) -> Event:
+        return self.at(when, car.start_engine, name='start_engine')
+
+    def stop_engine(self, when: float, car: Car) -> Event:
+        return self.at(when, car.stop_engine, name='stop_engine')
+
+    def shift_gear(self, when: float, car: Car, gear: int) -> Event:
+        return self.at(when, car.transmission.shift_gear, gear, name='shift_gear')
+
+    def open_door(self, when: float, car: Car, door: int) -> Event:
+        return self.at(when, car.body.open_door, door, name='open_door')
+
+    def close_door(self, when: float, car: Car, door: int) -> Event:
+        return self.at(when, car.body.close_door, door, name='close_door')
+
+    def drive(self, when: float, car: Car, throttle: float, duration: float) -> Event:
+        """Поїздка на duration секунд: зупинка планується, лише якщо машина поїхала"""
+        return self.at(when, self._drive, car, throttle, duration, name='drive')
+
+    def _drive(self, car: Car, throttle: float, duration: float) -> bool:
+        if not car.drive(throttle, duration=0):
+            return False
+        # нова поїздка скасовує зупинку попередньої (ледаче: застаріла подія нічого не робить)
+        token = next(self._seq)
+        self._drives[id(car)] = token
+        self.after(duration, self._stop, car, token, name='stop')
+        return True
+
+    def _stop(self, car: Car, token: int) -> Optional[bool]:
+        if self._drives.get(id(car)) != token:
+            return None  # машина вже їде в іншій поїздці
+        del self._drives[id(car)]
+        return car.stop()
+
+    # ------------------------------------------------------------ Виконання
+
+    def step(self) -> Event:
+        """Виконати найранішу подію"""
+        event = heapq.heappop(self._queue)
+        self.now = event.time
+        result = event.action(*event.args)
+        self.processed += 1
+        self.results[event.name, result] += 1
+        if self.trace:
+            self.history.append((event.time, event.name, result))
+        for listener in self.listeners:
+            listener(self, event)
+        return event
+
+    def run(self, until: Optional[float] = None) -> int:
+        """
+        Виконувати події до часу until (включно) або до кінця черги
+        :return: кількість виконаних подій
+        """
+        processed = self.processed
+        with contextlib.redirect_stdout(None) if self.quiet else contextlib.nullcontext():
+            while self._queue and (until is None or self._queue[0].time <= until):
+                self.step()
+        if until is not None and until > self.now:
+            self.now = until
+        return self.processed - processed
+
+
+def commute(scheduler: Scheduler, car: Car, start: float, rnd: random.Random, trips: int = 3):
+    """Сценарій одного дня: сісти в машину, кілька поїздок з паузами, заглушити двигун"""
+    when = start
+    scheduler.open_door(when, car, 1)
+    scheduler.close_door(when + 5, car, 1)
+    scheduler.start_engine(when + 10, car)
+    when += 15
+    for _ in range(trips):
+        # Car.stop перемикає на нейтраль, тож перед кожною поїздкою - передача
+        scheduler.shift_gear(when, car, rnd.randint(1, car.transmission.gears))
+        duration = rnd.uniform(5 * 60, 40 * 60)
+        scheduler.drive(when, car, rnd.uniform(0.2, 0.9), duration)
+        when += duration + rnd.uniform(60, 3600)
+    scheduler.stop_engine(when, car)
+    scheduler.open_door(when + 5, car, 1)
+    scheduler.close_door(when + 10, car, 1)
+
+
+# Демонстрація використання
+if __name__ == "__main__":
+    print("=== Одна машина, з повідомленнями ===")
+    scheduler = Scheduler(quiet=False)
+    car = Car("Toyota", "Camry", 2023)
+    scheduler.start_engine(0, car)
+    scheduler.shift_gear(1, car, 2)
+    scheduler.drive(2, car, 0.4, duration=3600)
+    scheduler.open_door(1800, car, 1)  # Car лише попередить: двері відкрито на ходу
+    scheduler.stop_engine(3000, car)  # не вийде - машина ще їде
+    scheduler.stop_engine(3700, car)
+    scheduler.run()
+    print(f"⏱️ Віртуальний час: {scheduler.now / 3600:.2f} год")
+
+    cars_count = 2000
+    print(f"\n=== Робочий день {cars_count:,} машин ===")
+    rnd = random.Random(42)
+    scheduler = Scheduler(quiet=True)
+    with contextlib.redirect_stdout(None):
+        cars = [Car("Toyota", "Camry", 2023) for _ in range(cars_count)]
+    for car in cars:
+        commute(scheduler, car, rnd.uniform(6 * 3600, 10 * 3600), rnd)
+
+    start = time.perf_counter()
+    processed = scheduler.run()
+    elapsed = time.perf_counter() - start
+    print(f"Подій: {processed:,} | віртуальний час: {scheduler.now / 3600:.1f} год | "
+          f"реальний: {elapsed:.2f}s")
+    for (name, result), count in sorted(scheduler.results.items(), key=lambda item: item[0][0]):
+        print(f"  {name:<14} {str(result):<6} {count:>8,}")
+    print(f"Машин у русі: {sum(car.is_moving for car in cars)} | "
+          f"з працюючим двигуном: {sum(car.engine.is_running for car in cars)}")
@@ -0,0 +1,205 @@
+"""
+Запис телеметрії Car: швидкість, оберти двигуна, передача і оберти коліс у часі.
+
+Car.get_status() і __str__ компонентів щоразу збирають рядки, і стан у часі ніде не зберігається.
+TelemetryRecorder пише числа у заздалегідь виділені масиви array('d') - по масиву на колонку,
+8 байт на значення, - а не в мільйони відформатованих рядків. Коли місце закінчується,
+масиви подвоюються. Два режими:
+- interval=N - знімок кожні N секунд віртуального часу;
+- interval=None - знімок лише тоді, коли стан змінився.
+Записане можна зберегти у компактний бінарний файл (заголовок + колонки, стиснуті zlib) або в CSV.
+"""
+
+import contextlib
+import csv
+import random
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from car import Car
+from car_scheduler import Scheduler, commute
+
+COLUMNS = ('time', 'speed', 'rpm', 'gear', 'wheel_1', 'wheel_2', 'wheel_3', 'wheel_4')
+CAPACITY = 4096
+
+# бінарний формат: magic, версія, прапорці, кількість колонок, кількість рядків; далі назви колонок
+# через кому і колонки float64 little-endian одна за одною (з FLAG_ZLIB - стиснуті разом)
+MAGIC = b'CTEL'
+VERSION = 1
+FLAG_ZLIB = 1
+HEADER = struct.Struct('<4sHHHQ')
+
+
+class TelemetryRecorder:
+    """Знімки стану однієї машини в масивах array('d')"""
+
+    def __init__(self, car: Car, interval: Optional[float] = None, capacity: int = CAPACITY):
+        """
+        :param interval: секунд між знімками; None - знімок при кожній зміні стану
+        :param capacity: скільки знімків вміщують масиви до першого розширення
+        """
+        self.car = car
+        self.interval = interval
+        self.capacity = capacity
+        self.count = 0
+        self.columns: Dict[str, array] = {name: array('d', bytes(8 * capacity)) for name in COLUMNS}
+        self._last_state: Optional[Tuple[float, ...]] = None
+        self._next_sample = 0.0
+
+    def __len__(self):
+        return self.count
+
+    def state(self) -> Tuple[float, ...]:
+        """Поточні speed, rpm, gear і оберти коліс машини"""
+        car = self.car
+        return (car.speed, car.engine.rpm, car.transmission.current_gear,
+                *(wheel.rotation_speed for wheel in car.wheels))
+
+    def sample(self, now: float):
+        """Записати знімок безумовно"""
+        if self.count == self.capacity:
+            # подвоєння: кожен знімок копіюється в середньому не більше одного разу
+            for column in self.columns.values():
+                column.frombytes(bytes(8 * self.capacity))
+            self.capacity *= 2
+        state = self.state()
+        index = self.count
+        columns = self.columns
+        columns['time'][index] = now
+        for name, value in zip(COLUMNS[1:], state):
+            columns[name][index] = value
+        self.count += 1
+        self._last_state = state
+
+    def record(self, now: float) -> bool:
+        """Записати знімок, якщо цього вимагає режим; True - знімок записано"""
+        if self.interval is not None:
+            if now < self._next_sample:
+                return False
+            self._next_sample = now + self.interval
+        elif self.state() == self._last_state:
+            return False
+        self.sample(now)
+        return True
+
+    def attach(self, scheduler: Scheduler, until: Optional[float] = None):
+        """
+        Записувати під час scheduler.run():
+        з interval - подія знімка, яка сама планує наступну, до until (включно);
+        без interval - після кожної події планувальника, якщо стан змінився
+        """
+        if self.interval is None:
+            self.sample(scheduler.now)
+            scheduler.listeners.append(lambda scheduler, event: self.record(scheduler.now))
+            return
+        if until is None:
+            raise ValueError("Fixed-rate telemetry needs 'until' - otherwise the queue never empties")
+
+        def tick(step: int):
+            self.sample(scheduler.now)
+            # час рахується від початку, а не додаванням interval, щоб не накопичувалась похибка
+            next_time = start + (step + 1) * self.interval
+            if next_time <= until:
+                scheduler.at(next_time, tick, step + 1, name='telemetry')
+
+        start = scheduler.now
+        scheduler.at(start, tick, 0, name='telemetry')
+
+    def column(self, name: str) -> array:
+        """Записані значення колонки (без вільного місця в кінці)"""
+        return self.columns[name][:self.count]
+
+    def rows(self):
+        columns = [self.columns[name] for name in COLUMNS]
+        for index in range(self.count):
+            yield tuple(column[index] for column in columns)
+
+    # --------------------------------------------------------------- Експорт
+
+    def save_binary(self, path, compress: bool = True):
+        """
+        Заголовок і колонки float64 без форматування чисел. Значення в колонці рідко змінюються,
+        тому zlib стискає їх у рази; compress=False - колонки як є
+        """
+        names = ','.join(COLUMNS).encode()
+        data = array('d')
+        for name in COLUMNS:
+            data.extend(self.column(name))
+        if sys.byteorder != 'little':
+            data.byteswap()
+        payload = zlib.compress(data.tobytes()) if compress else data.tobytes()
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, FLAG_ZLIB if compress else 0, len(COLUMNS), self.count))
+            f.write(struct.pack('<H', len(names)) + names)
+            f.write(payload)
+
+    def save_csv(self, path):
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(COLUMNS)
+            writer.writerows(self.rows())
+
+
+def load_binary(path) -> Dict[str, array]:
+    """Прочитати файл save_binary: назва колонки -> array('d')"""
+    with open(path, 'rb') as f:
+        magic, version, flags, columns_count, count = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a telemetry file (version {VERSION})")
+        (names_size,) = struct.unpack('<H', f.read(2))
+        names = f.read(names_size).decode().split(',')
+        if len(names) != columns_count:
+            raise ValueError(f"{path}: header lists {len(names)} columns, expected {columns_count}")
+        payload = f.read()
+    data = array('d', zlib.decompress(payload) if flags & FLAG_ZLIB else payload)
+    if len(data) != columns_count * count:
+        raise ValueError(f"{path}: expected {columns_count * count} values, got {len(data)}")
+    if sys.byteorder != 'little':
+        data.byteswap()
+    return {name: data[index * count:(index + 1) * count] for index, name in enumerate(names)}
+
+
+# Демонстрація використання
+if __name__ == "__main__":
+    with contextlib.redirect_stdout(None):
+        car = Car("Toyota", "Camry", 2023)
+    day = 24 * 3600
+
+    print("=== Телеметрія при зміні стану ===")
+    scheduler = Scheduler()
+    on_change = TelemetryRecorder(car)
+    on_change.attach(scheduler)
+    commute(scheduler, car, 8 * 3600, random.Random(42), trips=5)
+    scheduler.run(until=day)
+    print(f"Знімків: {len(on_change)} | подій планувальника: {scheduler.processed}")
+    print(f"{'час, с':>10}{'km/h':>8}{'RPM':>8}{'передача':>10}")
+    for time_, speed, rpm, gear, *wheels in on_change.rows():
+        print(f"{time_:>10.0f}{speed:>8.1f}{rpm:>8.0f}{gear:>10.0f}")
+
+    print("\n=== Телеметрія щосекунди ===")
+    with contextlib.redirect_stdout(None):
+        car = Car("Toyota", "Camry", 2023)
+    scheduler = Scheduler()
+    every_second = TelemetryRecorder(car, interval=1.0)
+    every_second.attach(scheduler, until=day)
+    commute(scheduler, car, 8 * 3600, random.Random(42), trips=5)
+    scheduler.run(until=day)
+    speed = every_second.column('speed')
+    print(f"Знімків: {len(every_second):,} | у русі: {sum(value > 0 for value in speed):,} с | "
+          f"пробіг: {sum(speed) / 3600:.1f} km")
+
+    with tempfile.TemporaryDirectory() as directory:
+        binary_path, csv_path = Path(directory) / 'telemetry.bin', Path(directory) / 'telemetry.csv'
+        every_second.save_binary(binary_path)
+        every_second.save_csv(csv_path)
+        loaded = load_binary(binary_path)
+        same = all(loaded[name] == every_second.column(name) for name in COLUMNS)
+        print(f"Бінарний файл: {binary_path.stat().st_size / 1024:,.0f} KB | CSV: {csv_path.stat().st_size / 1024:,.0f} KB | "
+              f"get_status() рядками: ~{len(car.get_status()) * len(every_second) / 1024:,.0f} KB | "
+              f"у пам'яті: {every_second.capacity * len(COLUMNS) * 8 / 1024:,.0f} KB")
+        print(f"{'✓' if same else '❌'} бінарний файл прочитано без втрат")
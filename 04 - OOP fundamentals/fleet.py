@@ -0,0 +1,249 @@
+"""
+Симуляція парку автомобілів (fleet) на масивах NumPy.
+
+Car з car.py - граф об'єктів Engine / Transmission / Wheel, і Car.drive чекає time.sleep.
+Для сценаріїв з сотнями тисяч машин це не годиться, тому тут стан усіх машин зберігається
+"структурою масивів": кожна властивість - окремий масив, i-й елемент якого належить i-й машині.
+Операції (запуск двигуна, передача, газ, зупинка) виконуються векторно для всіх машин
+або для вибраних (індекси чи булева маска), а час - віртуальний годинник: step(dt) лише
+збільшує число і зупиняє машини, час поїздки яких минув.
+
+Формули ті самі, що в Engine.force і Car.drive:
+    rpm = 800 + (6000 - 800) * throttle
+    force = horsepower * throttle * 0.8
+    speed = force * (current_gear / gears) * 0.5
+    wheel_rpm = speed * 10
+"""
+
+import contextlib
+import time
+
+import numpy as np
+
+from car import Car
+
+IDLE_RPM = 800.0
+MAX_RPM = 6000.0
+FORCE_FACTOR = 0.8
+SPEED_FACTOR = 0.5
+WHEEL_RPM_FACTOR = 10.0
+WHEELS = 4
+
+
+class Fleet:
+    """Стан size автомобілів у масивах NumPy"""
+
+    def __init__(self, size: int, horsepower=200, volume=2.0, gears=6):
+        """
+        horsepower, volume, gears - число (однакове для всіх) або масив довжини size
+        """
+        self.size = size
+        self.clock = 0.0  # віртуальний час, секунд
+
+        # Engine
+        self.horsepower = np.broadcast_to(np.asarray(horsepower, dtype=np.float64), size).copy()
+        self.volume = np.broadcast_to(np.asarray(volume, dtype=np.float64), size).copy()
+        self.rpm = np.zeros(size)
+        self.engine_running = np.zeros(size, dtype=bool)
+
+        # Transmission
+        self.gears = np.broadcast_to(np.asarray(gears, dtype=np.int8), size).copy()
+        if (self.gears < 1).any():
+            raise ValueError("Transmission must have at least one gear")
+        self.current_gear = np.zeros(size, dtype=np.int8)
+
+        # Wheels: по рядку на машину, по стовпцю на колесо
+        self.wheel_mounted = np.ones((size, WHEELS), dtype=bool)
+        self.wheel_rpm = np.zeros((size, WHEELS))
+
+        # Car
+        self.speed = np.zeros(size)  # км/год
+        self.moving = np.zeros(size, dtype=bool)
+        self.stop_at = np.full(size, np.inf)  # віртуальний час зупинки поїздки
+        self.distance = np.zeros(size)  # км
+
+    def __len__(self):
+        return self.size
+
+    def _select(self, cars) -> np.ndarray:
+        """Булева маска вибраних машин: None - всі, інакше індекси або маска"""
+        if cars is None:
+            return np.ones(self.size, dtype=bool)
+        cars = np.asarray(cars)
+        if cars.dtype == bool:
+            return cars.copy()
+        mask = np.zeros(self.size, dtype=bool)
+        mask[cars] = True
+        return mask
+
+    # ---------------------------------------------------------------- Engine
+
+    def start_engines(self, cars=None) -> np.ndarray:
+        """Engine.start: запустити зупинені двигуни; повертає маску запущених"""
+        started = self._select(cars) & ~self.engine_running
+        self.engine_running[started] = True
+        self.rpm[started] = IDLE_RPM
+        return started
+
+    def stop_engines(self, cars=None) -> np.ndarray:
+        """Car.stop_engine: двигун не зупиняється, поки машина їде"""
+        stopped = self._select(cars) & self.engine_running & ~self.moving
+        self.engine_running[stopped] = False
+        self.rpm[stopped] = 0.0
+        return stopped
+
+    def force(self, throttle, cars=None) -> np.ndarray:
+        """Engine.force для вибраних машин; 0 для невибраних і з зупиненим двигуном"""
+        selected = self._select(cars) & self.engine_running
+        throttle = np.clip(np.broadcast_to(np.asarray(throttle, dtype=np.float64), self.size), 0.0, 1.0)
+        self.rpm[selected] = IDLE_RPM + (MAX_RPM - IDLE_RPM) * throttle[selected]
+        return np.where(selected, self.horsepower * throttle * FORCE_FACTOR, 0.0)
+
+    # ---------------------------------------------------------- Transmission
+
+    def shift_gear(self, target_gear, cars=None) -> np.ndarray:
+        """Transmission.shift_gear: передача від 0 до gears і не поточна; повертає маску перемкнутих"""
+        target_gear = np.broadcast_to(np.asarray(target_gear, dtype=np.int8), self.size)
+        shifted = (self._select(cars) & (target_gear >= 0) & (target_gear <= self.gears) &
+                   (target_gear != self.current_gear))
+        self.current_gear[shifted] = target_gear[shifted]
+        return shifted
+
+    def shift_up(self, cars=None) -> np.ndarray:
+        return self.shift_gear(self.current_gear + 1, self._select(cars) & (self.current_gear < self.gears))
+
+    def shift_down(self, cars=None) -> np.ndarray:
+        return self.shift_gear(self.current_gear - 1, self._select(cars) & (self.current_gear > 1))
+
+    # ------------------------------------------------------------------- Car
+
+    def drive(self, throttle=0.3, duration=0.0, cars=None) -> np.ndarray:
+        """
+        Car.drive для вибраних машин: двигун працює, передача не нейтральна, всі колеса на місці.
+        duration > 0 - машина зупиниться через duration секунд віртуального часу (step);
+        0 - їде, доки не викличуть stop (як Car.drive(duration=0)).
+        :return: маска машин, що поїхали
+        """
+        driving = (self._select(cars) & self.engine_running & (self.current_gear > 0) &
+                   self.wheel_mounted.all(axis=1))
+        force = self.force(throttle, driving)
+        gear_ratio = self.current_gear / self.gears
+        self.speed[driving] = (force * gear_ratio * SPEED_FACTOR)[driving]
+        self.wheel_rpm[driving] = (self.speed[driving] * WHEEL_RPM_FACTOR)[:, np.newaxis]
+        self.moving[driving] = True
+        duration = np.broadcast_to(np.asarray(duration, dtype=np.float64), self.size)
+        self.stop_at[driving] = np.where(duration[driving] > 0, self.clock + duration[driving], np.inf)
+        return driving
+
+    def stop(self, cars=None) -> np.ndarray:
+        """Car.stop: колеса зупиняються, швидкість 0, передача - нейтраль"""
+        stopped = self._select(cars) & self.moving
+        # зазвичай зупиняється мало машин - присвоєння за індексами дешевше, ніж за маскою
+        index = np.flatnonzero(stopped)
+        self.wheel_rpm[index] = 0.0
+        self.speed[index] = 0.0
+        self.moving[index] = False
+        self.current_gear[index] = 0
+        self.stop_at[index] = np.inf
+        return stopped
+
+    def step(self, dt: float = 1.0) -> np.ndarray:
+        """Просунути віртуальний годинник на dt секунд; повертає маску машин, що зупинилися"""
+        end = self.clock + dt
+        # машина, яка зупиняється всередині кроку, їде лише до свого stop_at;
+        # у машин, що стоять, speed == 0
+        self.distance += self.speed * (np.minimum(self.stop_at, end) - self.clock) / 3600
+        self.clock = end
+        due = self.stop_at <= end
+        return self.stop(due) if due.any() else due
+
+    def run(self, until: float, dt: float = 1.0):
+        """Крокувати до віртуального часу until"""
+        while self.clock + dt <= until:
+            self.step(dt)
+
+    # ------------------------------------------------------------ Порівняння
+
+    def state(self, index: int) -> dict:
+        """Стан однієї машини в тих самих величинах, що й у Car"""
+        return {
+            'engine_running': bool(self.engine_running[index]),
+            'rpm': float(self.rpm[index]),
+            'current_gear': int(self.current_gear[index]),
+            'speed': float(self.speed[index]),
+            'is_moving': bool(self.moving[index]),
+            'wheel_rpm': [float(rpm) for rpm in self.wheel_rpm[index]],
+        }
+
+
+def car_state(car: Car) -> dict:
+    """Стан Car в тому ж вигляді, що Fleet.state"""
+    return {
+        'engine_running': car.engine.is_running,
+        'rpm': car.engine.rpm,
+        'current_gear': car.transmission.current_gear,
+        'speed': car.speed,
+        'is_moving': car.is_moving,
+        'wheel_rpm': [wheel.rotation_speed for wheel in car.wheels],
+    }
+
+
+def matches_car(throttle: float, gear: int, horsepower: int = 200, gears: int = 6) -> bool:
+    """Чи дають Car і Fleet з однієї машини однаковий стан після запуску, передачі та поїздки"""
+    fleet = Fleet(1, horsepower=horsepower, gears=gears)
+    # Car друкує кожну дію - для порівняння вивід не потрібен
+    with contextlib.redirect_stdout(None):
+        car = Car("Toyota", "Camry", 2023)
+        car._engine._horsepower = horsepower
+        car._transmission._gears = gears
+        for action in (lambda: (car.start_engine(), fleet.start_engines()),
+                       lambda: (car.transmission.shift_gear(gear), fleet.shift_gear(gear)),
+                       lambda: (car.drive(throttle, duration=0), fleet.drive(throttle)),
+                       lambda: (car.stop(), fleet.stop())):
+            action()
+            if car_state(car) != fleet.state(0):
+                return False
+    return True
+
+
+# Демонстрація використання
+if __name__ == "__main__":
+    print("=== Порівняння з Car ===")
+    cases = [(throttle, gear, horsepower) for throttle in (-0.5, 0.0, 0.3, 0.75, 1.0, 1.5)
+             for gear in (0, 1, 3, 6, 7) for horsepower in (90, 200, 450)]
+    failed = [case for case in cases if not matches_car(*case)]
+    print(f"{'✓' if not failed else '❌'} {len(cases) - len(failed)}/{len(cases)} сценаріїв збігаються з Car")
+
+    size = 100_000
+    rng = np.random.default_rng(42)
+    print(f"\n=== Година трафіку для {size:,} машин ===")
+    start = time.perf_counter()
+    fleet = Fleet(size, horsepower=rng.integers(90, 450, size), gears=rng.choice([5, 6, 8], size))
+    fleet.start_engines()
+    for minute in range(60):
+        # щохвилини частина машин, що стоять, рушає на випадковий час з випадковим газом
+        starting = ~fleet.moving & (rng.random(size) < 0.2)
+        fleet.shift_gear(rng.integers(1, 6, size), starting)
+        fleet.drive(rng.uniform(0.1, 1.0, size), rng.uniform(10, 300, size), starting)
+        fleet.run(until=(minute + 1) * 60)
+    elapsed = time.perf_counter() - start
+    print(f"Їдуть: {fleet.moving.sum():,} | середня швидкість: {fleet.speed[fleet.moving].mean():.1f} km/h | "
+          f"пробіг: {fleet.distance.sum():,.0f} km")
+    print(f"⏱️ {fleet.clock / 3600:.0f} год віртуального часу за {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(None):
+        cars = [Car("Toyota", "Camry", 2023) for _ in range(1000)]
+        for car in cars:
+            car.start_engine()
+            car.transmission.shift_gear(3)
+            car.drive(0.5, duration=0)
+            car.stop()
+    per_car = (time.perf_counter() - start) / len(cars)
+    start = time.perf_counter()
+    fleet = Fleet(size)
+    fleet.start_engines()
+    fleet.shift_gear(3)
+    fleet.drive(0.5)
+    fleet.stop()
+    print(f"⏱️ Одна поїздка {size:,} машин: Car ~{per_car * size:.2f}s | Fleet {time.perf_counter() - start:.3f}s")
@@ -0,0 +1,173 @@
+"""
+Об'єднання повторюваних сповіщень у часовому вікні.
+
+Під час атаки той самий IP надсилає тисячі однакових сповіщень (IP, тип, рівень),
+і всі вони йдуть далі поодинці. AlertAggregator об'єднує однакові сповіщення, що прийшли
+протягом window секунд від першого, в один запис з кількістю, першим і останнім часом.
+
+Стан - OrderedDict ключ -> AggregatedAlert у порядку останньої активності (LRU):
+- повтор переносить запис у кінець (move_to_end);
+- на початку - записи, які найдовше не оновлювались; якщо з останнього повтору минуло
+  більше window, вікно точно закрите - запис віддається далі (витіснення за часом);
+- якщо записів більше max_keys, найдавніше активний віддається достроково -
+  пам'ять обмежена, навіть коли атакують мільйони різних IP.
+"""
+
+import random
+import time
+from collections import OrderedDict
+from typing import Callable, Iterable, Iterator, List, Optional
+
+WINDOW = 60.0  # секунд
+MAX_KEYS = 10_000
+
+
+class AggregatedAlert:
+    """Однакові сповіщення одного вікна"""
+
+    __slots__ = ('ip', 'severity', 'alert_type', 'count', 'first_seen', 'last_seen')
+
+    def __init__(self, ip: str, severity: str, alert_type: str, seen: float):
+        self.ip = ip
+        self.severity = severity
+        self.alert_type = alert_type
+        self.count = 0
+        self.first_seen = seen
+        self.last_seen = seen
+
+    def to_dict(self) -> dict:
+        return {'ip': self.ip, 'severity': self.severity, 'alert_type': self.alert_type, 'count': self.count,
+                'first_seen': self.first_seen, 'last_seen': self.last_seen}
+
+    def __repr__(self):
+        return (f"AggregatedAlert({self.ip!r}, {self.severity!r}, {self.alert_type!r}, count={self.count}, "
+                f"{self.first_seen:.0f}-{self.last_seen:.0f})")
+
+
+class AlertAggregator:
+    """Обмежений LRU відкритих вікон з витісненням за часом"""
+
+    def __init__(self, window: float = WINDOW, max_keys: int = MAX_KEYS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.window = window
+        self.max_keys = max_keys
+        self.clock = clock
+        self._open = OrderedDict()  # (ip, тип, рівень) -> AggregatedAlert, останні активні в кінці
+        self.alerts_in = 0
+        self.records_out = 0
+        self.evicted = 0  # віддано достроково через max_keys
+
+    def __len__(self):
+        return len(self._open)
+
+    def _emit(self, record: AggregatedAlert) -> AggregatedAlert:
+        self.records_out += 1
+        return record
+
+    def expire(self, now: Optional[float] = None) -> Iterator[AggregatedAlert]:
+        """Віддати записи, в яких більше window секунд не було повторів"""
+        now = self.clock() if now is None else now
+        open_records = self._open
+        while open_records:
+            record = next(iter(open_records.values()))
+            if now - record.last_seen < self.window:
+                break
+            open_records.popitem(last=False)
+            yield self._emit(record)
+
+    def add(self, ip: str, severity: str, alert_type: str,
+            now: Optional[float] = None) -> List[AggregatedAlert]:
+        """
+        Врахувати сповіщення одразу (навіть якщо результат не потрібен);
+        повернути список записів, що закрилися
+        """
+        now = self.clock() if now is None else now
+        self.alerts_in += 1
+        open_records = self._open
+        closed = []
+        # expire лише тоді, коли найдавніший запис справді закритий - без генератора на кожне сповіщення
+        if open_records and now - next(iter(open_records.values())).last_seen >= self.window:
+            closed.extend(self.expire(now))
+
+        key = (ip, alert_type, severity)
+        record = open_records.get(key)
+        if record is not None and now - record.first_seen >= self.window:
+            # вікно цього ключа минуло, хоча повтори тривають (флуд) - закриваємо і починаємо нове
+            del open_records[key]
+            closed.append(self._emit(record))
+            record = None
+        if record is None:
+            record = open_records[key] = AggregatedAlert(ip, severity, alert_type, now)
+            if len(open_records) > self.max_keys:
+                _, oldest = open_records.popitem(last=False)
+                self.evicted += 1
+                closed.append(self._emit(oldest))
+        else:
+            open_records.move_to_end(key)
+        record.count += 1
+        record.last_seen = now
+        return closed
+
+    def flush(self) -> Iterator[AggregatedAlert]:
+        """Віддати всі відкриті записи (кінець потоку)"""
+        while self._open:
+            _, record = self._open.popitem(last=False)
+            yield self._emit(record)
+
+    def stats(self) -> dict:
+        return {'alerts_in': self.alerts_in, 'records_out': self.records_out, 'open': len(self._open),
+                'evicted': self.evicted,
+                'reduction': self.alerts_in / self.records_out if self.records_out else 0.0}
+
+
+def aggregate(alerts: Iterable, aggregator: Optional[AlertAggregator] = None) -> Iterator[AggregatedAlert]:
+    """
+    Генератор: сповіщення (AlertRecord з alert_ingest або будь-що з ip, severity, alert_type
+    і received) -> об'єднані записи
+    """
+    if aggregator is None:
+        aggregator = AlertAggregator()
+    for alert in alerts:
+        yield from aggregator.add(alert.ip, alert.severity, alert.alert_type, alert.received)
+    yield from aggregator.flush()
+
+
+# Демонстрація
+if __name__ == '__main__':
+    rnd = random.Random(42)
+    attackers = [f"203.0.113.{i}" for i in range(1, 51)]
+    severities = ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL']
+    duration = 10 * 60  # секунд флуду
+    per_second = 2000
+
+    aggregator = AlertAggregator(window=60, max_keys=5000)
+    records = []
+    max_open = 0
+    start = time.perf_counter()
+    for second in range(duration):
+        for _ in range(per_second):
+            now = second + rnd.random()
+            if rnd.random() < 0.95:
+                # флуд: 50 IP повторюють однакові сповіщення
+                ip, severity, alert_type = rnd.choice(attackers), 'HIGH', 'BRUTE_FORCE'
+            else:
+                # фон: багато різних IP
+                ip = f"10.{rnd.randint(0, 255)}.{rnd.randint(0, 255)}.{rnd.randint(1, 254)}"
+                severity, alert_type = rnd.choice(severities), 'PORT_SCAN'
+            records.extend(aggregator.add(ip, severity, alert_type, now))
+        max_open = max(max_open, len(aggregator))
+    records.extend(aggregator.flush())
+    elapsed = time.perf_counter() - start
+
+    stats = aggregator.stats()
+    print(f"Alerts in: {stats['alerts_in']:,} | records out: {stats['records_out']:,} | "
+          f"reduction: x{stats['reduction']:,.0f}")
+    print(f"Open windows at most: {max_open:,} (limit {aggregator.max_keys:,}) | evicted early: {stats['evicted']:,}")
+    flood = [record for record in records if record.ip in attackers]
+    flood_alerts = sum(record.count for record in flood)
+    print(f"Flood: {flood_alerts:,} alerts -> {len(flood):,} records (x{flood_alerts / len(flood):,.0f}) | "
+          f"background of unique IPs passes through as is")
+    print(f"{'✓' if sum(record.count for record in records) == stats['alerts_in'] else '❌'} "
+          f"no alerts lost in aggregation")
+    print("Largest record:", max(records, key=lambda record: record.count))
+    print(f"⏱️ {stats['alerts_in'] / elapsed:,.0f} alerts/s")
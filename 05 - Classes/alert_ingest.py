@@ -0,0 +1,158 @@
+"""
+Масове завантаження сповіщень безпеки з файлів журналу.
+
+SecurityAlert.create_from_log_line створює повноцінний об'єкт з __dict__ і викликає
+datetime.now() на кожному рядку, а на неправильному рядку кидає ValueError.
+Для мільйонів рядків на годину тут:
+- AlertRecord з __slots__ - без __dict__ на кожен об'єкт;
+- однакові рядки (IP, рівень, тип) інтернуються - всі записи посилаються на один об'єкт str;
+- час надходження - time.monotonic() (дешеве число, не об'єкт datetime);
+- неправильні рядки пропускаються, а причини рахуються в AlertIngestor.stats.
+
+Формат рядка той самий, що в create_from_log_line: "192.168.1.1 HIGH MALWARE_DETECTED"
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Tuple
+
+from security_alert_full import SecurityAlert
+
+SEVERITIES = frozenset(SecurityAlert.severity_levels)
+
+# Відповідність monotonic() і годинника - щоб перевести час надходження в datetime
+_MONOTONIC_ORIGIN = time.monotonic()
+_WALL_ORIGIN = datetime.now()
+
+
+class AlertRecord:
+    """Сповіщення без __dict__: лише чотири слоти"""
+
+    __slots__ = ('ip', 'severity', 'alert_type', 'received')
+
+    def __init__(self, ip: str, severity: str, alert_type: str, received: float):
+        self.ip = ip
+        self.severity = severity
+        self.alert_type = alert_type
+        self.received = received  # time.monotonic() в момент завантаження
+
+    @property
+    def received_at(self) -> datetime:
+        """Час надходження як datetime (обчислюється лише на запит)"""
+        return _WALL_ORIGIN + timedelta(seconds=self.received - _MONOTONIC_ORIGIN)
+
+    def __repr__(self):
+        return f"AlertRecord({self.ip!r}, {self.severity!r}, {self.alert_type!r})"
+
+
+@lru_cache(maxsize=65536)
+def valid_ip(ip: str) -> bool:
+    """IPv4 у вигляді a.b.c.d; ті самі IP повторюються, тому результат кешується"""
+    parts = ip.split('.')
+    return len(parts) == 4 and all(part.isascii() and part.isdigit() and int(part) <= 255 for part in parts)
+
+
+class AlertIngestor:
+    """Потокове завантаження сповіщень з підрахунком пропущених рядків"""
+
+    def __init__(self):
+        self.lines = 0
+        self.accepted = 0
+        self.malformed = Counter()  # причина -> кількість рядків
+
+    def ingest(self, lines: Iterable[str]) -> Iterator[AlertRecord]:
+        """Генератор AlertRecord з рядків; неправильні рядки лише рахуються"""
+        intern, monotonic = sys.intern, time.monotonic
+        malformed = self.malformed
+        for line in lines:
+            self.lines += 1
+            parts = line.split(None, 2)
+            if len(parts) < 3:
+                if parts:
+                    malformed['too_few_fields'] += 1
+                else:
+                    malformed['empty'] += 1
+                continue
+            ip, severity, alert_type = parts
+            if severity not in SEVERITIES:
+                malformed['bad_severity'] += 1
+                continue
+            if not valid_ip(ip):
+                malformed['bad_ip'] += 1
+                continue
+            self.accepted += 1
+            yield AlertRecord(intern(ip), intern(severity), intern(alert_type.rstrip()), monotonic())
+
+    def ingest_file(self, path) -> Iterator[AlertRecord]:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            yield from self.ingest(f)
+
+    def stats(self) -> dict:
+        return {'lines': self.lines, 'accepted': self.accepted,
+                'malformed': sum(self.malformed.values()), 'reasons': dict(self.malformed)}
+
+
+def load_alerts(path) -> Tuple[List[AlertRecord], dict]:
+    """Прочитати весь файл: (записи, статистика)"""
+    ingestor = AlertIngestor()
+    records = list(ingestor.ingest_file(path))
+    return records, ingestor.stats()
+
+
+def load_with_security_alert(lines: Iterable[str]) -> List[SecurityAlert]:
+    """Поточний спосіб - create_from_log_line для кожного рядка, для порівняння"""
+    alerts = []
+    for line in lines:
+        try:
+            alerts.append(SecurityAlert.create_from_log_line(line))
+        except ValueError:
+            pass
+    return alerts
+
+
+def sample_lines(count: int, malformed_share: float = 0.01) -> List[str]:
+    """Синтетичні рядки сповіщень, частина з них - неправильні"""
+    rnd = random.Random(42)
+    types = ['MALWARE_DETECTED', 'PORT_SCAN', 'BRUTE_FORCE', 'SQL_INJECTION', 'XSS_ATTEMPT', 'DDOS']
+    ips = [f"{rnd.randint(1, 223)}.{rnd.randint(0, 255)}.{rnd.randint(0, 255)}.{rnd.randint(1, 254)}"
+           for _ in range(5000)]
+    broken = ['', 'garbage', '10.0.0.5 HIGH', '999.1.1.1 HIGH MALWARE', '10.0.0.5 URGENT MALWARE']
+    return [rnd.choice(broken) + '\n' if rnd.random() < malformed_share else
+            f"{rnd.choice(ips)} {rnd.choice(SecurityAlert.severity_levels)} {rnd.choice(types)}\n"
+            for _ in range(count)]
+
+
+def measure(load, lines: List[str]):
+    """(кількість об'єктів, сповіщень/с, байт пам'яті на сповіщення)"""
+    start = time.perf_counter()
+    alerts = load(lines)
+    elapsed = time.perf_counter() - start
+    del alerts
+
+    tracemalloc.start()
+    alerts = load(lines)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(alerts), len(alerts) / elapsed, size / len(alerts)
+
+
+# Демонстрація
+if __name__ == '__main__':
+    count = 1_000_000
+    lines = sample_lines(count)
+
+    ingestor = AlertIngestor()
+    records = list(ingestor.ingest(lines))
+    print(f"First record: {records[0]} received at {records[0].received_at:%H:%M:%S}")
+    print("Ingest stats:", ingestor.stats())
+
+    print(f"\n{'Loader':<28}{'alerts':>10}{'alerts/s':>12}{'bytes/alert':>13}")
+    for name, load in (('SecurityAlert', load_with_security_alert),
+                       ('AlertIngestor', lambda lines: list(AlertIngestor().ingest(lines)))):
+        alerts, rate, per_alert = measure(load, lines)
+        print(f"{name:<28}{alerts:>10,}{rate:>12,.0f}{per_alert:>13.0f}")
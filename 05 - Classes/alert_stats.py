@@ -0,0 +1,232 @@
+"""
+Статистика сповіщень для багатьох потоків без глобального блокування.
+
+SecurityAlert.total_alerts_created += 1 - це прочитати, додати і записати атрибут класу;
+два потоки можуть прочитати одне значення, і одне збільшення загубиться. А get_statistics()
+знає лише загальну кількість.
+
+AlertStats дає кожному потоку власний "шард" лічильників (threading.local):
+- потік пише лише у свій шард, тому лічильники точні без блокування;
+- блокування береться один раз - коли потік реєструє свій шард;
+- читання (counts, rates) додає всі шарди разом;
+- шарди потоків, що завершились, зливаються в один "архівний" шард - пам'ять
+  не росте, коли потоки постійно створюються і завершуються.
+Для швидкості за останні 1, 5 і 15 хвилин кожен шард тримає кільцевий буфер
+на 15 хвилин з коміркою на секунду.
+"""
+
+import threading
+import time
+import weakref
+from collections import Counter
+from typing import Callable, Dict, Optional
+
+from alert_ingest import AlertIngestor, sample_lines
+
+RATE_WINDOWS = (60, 300, 900)  # секунд: 1, 5 і 15 хвилин
+HISTORY = max(RATE_WINDOWS)
+
+
+class _Shard:
+    """Лічильники одного потоку; змінює їх лише цей потік"""
+
+    __slots__ = ('total', 'by_severity', 'by_type', 'seconds', 'counts')
+
+    def __init__(self):
+        self.total = 0
+        self.by_severity = Counter()
+        self.by_type = Counter()
+        self.seconds = [-1] * HISTORY  # секунда, до якої належить комірка
+        self.counts = [0] * HISTORY
+
+    def add(self, severity: str, alert_type: str, count: int, second: int):
+        self.total += count
+        self.by_severity[severity] += count
+        self.by_type[alert_type] += count
+        index = second % HISTORY
+        if self.seconds[index] != second:
+            self.seconds[index] = second
+            self.counts[index] = 0
+        self.counts[index] += count
+
+    def merge(self, other: '_Shard'):
+        """Додати лічильники іншого шарда (його потік уже нічого не пише)"""
+        self.total += other.total
+        self.by_severity.update(other.by_severity)
+        self.by_type.update(other.by_type)
+        for index, second in enumerate(other.seconds):
+            if second == self.seconds[index]:
+                self.counts[index] += other.counts[index]
+            elif second > self.seconds[index]:
+                self.seconds[index] = second
+                self.counts[index] = other.counts[index]
+
+
+class AlertStats:
+    """Реєстр статистики: запис без блокування, читання - сума шардів"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        :param clock: джерело часу в секундах (для симуляції можна передати свій годинник)
+        """
+        self.clock = clock
+        self._local = threading.local()
+        self._shards = []  # (weakref на потік, його шард) - лише живі потоки
+        self._retired = _Shard()  # сума шардів потоків, що завершились
+        self._register_lock = threading.Lock()
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._register_lock:
+                # новий потік - слушна нагода прибрати шарди завершених
+                self._retire_finished()
+                self._shards.append((weakref.ref(threading.current_thread()), shard))
+        return shard
+
+    def _retire_finished(self):
+        """Злити шарди завершених потоків в архівний (викликається під _register_lock)"""
+        live = []
+        for thread_ref, shard in self._shards:
+            thread = thread_ref()
+            if thread is not None and thread.is_alive():
+                live.append((thread_ref, shard))
+            else:
+                # потік завершився - у шард більше ніхто не пише, лічильники переходять в архів
+                self._retired.merge(shard)
+        self._shards = live
+
+    def _all_shards(self):
+        """Архівний шард і шарди живих потоків (викликається під _register_lock)"""
+        self._retire_finished()
+        return [self._retired] + [shard for _, shard in self._shards]
+
+    def record(self, severity: str, alert_type: str, count: int = 1):
+        """Врахувати сповіщення (викликається з будь-якого потоку)"""
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._shard()
+        shard.add(severity, alert_type, count, int(self.clock()))
+
+    def record_alert(self, alert):
+        """Те саме для об'єкта з атрибутами severity і alert_type (SecurityAlert, AlertRecord)"""
+        self.record(alert.severity, alert.alert_type)
+
+    # --------------------------------------------------------------- Читання
+
+    @property
+    def total(self) -> int:
+        with self._register_lock:
+            return sum(shard.total for shard in self._all_shards())
+
+    def counts(self) -> Dict[str, Counter]:
+        """Кількість по рівнях і по типах, сума всіх шардів"""
+        by_severity, by_type = Counter(), Counter()
+        # блокування лише від реєстрації й архівування шардів; потоки пишуть далі без нього
+        with self._register_lock:
+            for shard in self._all_shards():
+                # dict(...) копіює словник за один крок, навіть якщо потік саме додає новий ключ
+                by_severity.update(dict(shard.by_severity))
+                by_type.update(dict(shard.by_type))
+        return {'severity': by_severity, 'type': by_type}
+
+    def rates(self, now: Optional[float] = None) -> Dict[int, float]:
+        """Сповіщень за хвилину в середньому за останні 1, 5 і 15 хвилин"""
+        now = int(self.clock() if now is None else now)
+        totals = dict.fromkeys(RATE_WINDOWS, 0)
+        with self._register_lock:
+            buckets = [(list(shard.seconds), list(shard.counts)) for shard in self._all_shards()]
+        for seconds, counts in buckets:
+            for second, count in zip(seconds, counts):
+                age = now - second
+                if 0 <= age < HISTORY:
+                    for window in RATE_WINDOWS:
+                        if age < window:
+                            totals[window] += count
+        return {window: totals[window] * 60 / window for window in RATE_WINDOWS}
+
+    def get_statistics(self) -> dict:
+        """Як SecurityAlert.get_statistics, але з розподілами і швидкостями"""
+        counts = self.counts()
+        rates = self.rates()
+        with self._register_lock:
+            self._retire_finished()
+            threads = len(self._shards)
+        return {
+            'total_alerts': sum(counts['severity'].values()),
+            'by_severity': dict(counts['severity']),
+            'by_type': dict(counts['type']),
+            'rate_1m': rates[60],
+            'rate_5m': rates[300],
+            'rate_15m': rates[900],
+            'threads': threads,  # лише живі потоки
+        }
+
+
+class LockedStats(AlertStats):
+    """Для порівняння: один спільний шард, кожен запис - під глобальним блокуванням"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        super().__init__(clock)
+        self._lock = threading.Lock()
+
+    def record(self, severity: str, alert_type: str, count: int = 1):
+        # спільний шард - той самий _retired, тож читання працює без змін
+        with self._lock:
+            self._retired.add(severity, alert_type, count, int(self.clock()))
+
+
+def run_threads(stats, alerts, threads: int) -> float:
+    """Кожен потік записує свою частину сповіщень; повертає секунди"""
+    def work(batch):
+        record = stats.record
+        for alert in batch:
+            record(alert.severity, alert.alert_type)
+
+    workers = [threading.Thread(target=work, args=(alerts[i::threads],)) for i in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+# Демонстрація
+if __name__ == '__main__':
+    threads = 8
+    alerts = list(AlertIngestor().ingest(sample_lines(400_000)))
+    expected = Counter(alert.severity for alert in alerts)
+
+    print(f"=== {len(alerts):,} alerts from {threads} threads ===")
+    stats = AlertStats()
+    sharded_time = run_threads(stats, alerts, threads)
+    locked = LockedStats()
+    locked_time = run_threads(locked, alerts, threads)
+
+    counts = stats.counts()
+    print(f"Sharded: {sharded_time:.2f}s | global lock: {locked_time:.2f}s")
+    print(f"{'✓' if counts['severity'] == expected == locked.counts()['severity'] else '❌'} "
+          f"exact counts: {dict(counts['severity'])}")
+    print("Statistics:", stats.get_statistics())
+
+    print("\n=== Rates on a simulated clock ===")
+    now = [0.0]
+    stats = AlertStats(clock=lambda: now[0])
+    for second in range(20 * 60):
+        now[0] = second
+        # перші 10 хвилин - 10 сповіщень на секунду, потім сплеск - 100 на секунду
+        for _ in range(10 if second < 10 * 60 else 100):
+            stats.record('HIGH', 'BRUTE_FORCE')
+    print("Alerts per minute:", {f"{window // 60}m": round(rate) for window, rate in stats.rates().items()})
+
+    print("\n=== Short-lived threads ===")
+    stats = AlertStats()
+    for _ in range(200):
+        # потік на кожну пачку: шарди завершених потоків зливаються в архівний
+        run_threads(stats, alerts[:100], 4)
+    statistics = stats.get_statistics()
+    print(f"{'✓' if statistics['total_alerts'] == 200 * 100 else '❌'} {statistics['total_alerts']:,} alerts "
+          f"from 800 threads | live shards: {statistics['threads']}")
@@ -80,31 +80,31 @@ class SecurityAlert:
 
 
 # Демонстрація
-alert1 = SecurityAlert("192.168.1.100", "HIGH", "MALWARE")
-alert2 = SecurityAlert("10.0.0.5", "LOW", "PORT_SCAN")
-
-print(f"Total alerts created: {SecurityAlert.total_alerts_created}")  # 2
-print(alert1.get_info())  # Alert #2: MALWARE from 192.168.1.100
-
-# Тестування
-try:
-    alert = SecurityAlert("192.168.1.100", "HIGH", "MALWARE")
-    alert.mark_as_processed()
-    print(f"Alert age: {alert.get_age_minutes():.1f} minutes")
-
-    # Це викличе помилку
-    bad_alert = SecurityAlert("999.999.999.999", "HIGH", "MALWARE")
-except ValueError as e:
-    print(f"Error: {e}")
-
-
-# Використання різних типів методів
-print("Statistics:", SecurityAlert.get_statistics())
-
-# Створення з логу
-alert = SecurityAlert.create_from_log_line("10.0.0.5 HIGH MALWARE_DETECTED")
-print(f"Created alert: {alert.ip}, {alert.severity}")
-
-# Статичні методи
-print(f"Is 192.168.1.1 private? {SecurityAlert.is_private_ip('192.168.1.1')}")
-print(f"Risk score: {SecurityAlert.calculate_risk_score('HIGH', False)}")
\ No newline at end of file
+if __name__ == '__main__':
+    alert1 = SecurityAlert("192.168.1.100", "HIGH", "MALWARE")
+    alert2 = SecurityAlert("10.0.0.5", "LOW", "PORT_SCAN")
+
+    print(f"Total alerts created: {SecurityAlert.total_alerts_created}")  # 2
+    print(alert1.get_info())  # Alert #2: MALWARE from 192.168.1.100
+
+    # Тестування
+    try:
+        alert = SecurityAlert("192.168.1.100", "HIGH", "MALWARE")
+        alert.mark_as_processed()
+        print(f"Alert age: {alert.get_age_minutes():.1f} minutes")
+
+        # Це викличе помилку
+        bad_alert = SecurityAlert("999.999.999.999", "HIGH", "MALWARE")
+    except ValueError as e:
+        print(f"Error: {e}")
+
+    # Використання різних типів методів
+    print("Statistics:", SecurityAlert.get_statistics())
+
+    # Створення з логу
+    alert = SecurityAlert.create_from_log_line("10.0.0.5 HIGH MALWARE_DETECTED")
+    print(f"Created alert: {alert.ip}, {alert.severity}")
+
+    # Статичні методи
+    print(f"Is 192.168.1.1 private? {SecurityAlert.is_private_ip('192.168.1.1')}")
+    print(f"Risk score: {SecurityAlert.calculate_risk_score('HIGH', False)}")